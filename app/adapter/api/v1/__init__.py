@@ -1 +1 @@
-from app.adapter.api.v1.router import router
+from app.adapter.api.v1.router import clear_cached_representations, router
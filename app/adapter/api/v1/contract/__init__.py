@@ -1 +1,3 @@
 from app.adapter.api.v1.contract.daily_fun_fact_dto import DailyFunFactDto
+from app.adapter.api.v1.contract.daily_fun_fact_page_dto import DailyFunFactPageDto
+from app.adapter.api.v1.contract.daily_fun_fact_batch_dto import DailyFunFactBatchRequestDto, DailyFunFactBatchDto
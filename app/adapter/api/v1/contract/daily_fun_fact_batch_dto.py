@@ -0,0 +1,22 @@
+from datetime import date
+
+from pydantic import BaseModel, Field
+
+from app.adapter.api.v1.contract.daily_fun_fact_dto import DailyFunFactDto
+from app.domain.model import DailyFunFact
+
+
+class DailyFunFactBatchRequestDto(BaseModel):
+    dates: list[date] = Field(min_length=1, max_length=366)
+
+
+class DailyFunFactBatchDto(BaseModel):
+    found: list[DailyFunFactDto]
+    missing: list[date]
+
+    @staticmethod
+    def to_json(found: list[DailyFunFact], missing: list[date]) -> dict:
+        return {
+            "found": [DailyFunFactDto.to_json(model) for model in found],
+            "missing": [missing_date.isoformat() for missing_date in missing],
+        }
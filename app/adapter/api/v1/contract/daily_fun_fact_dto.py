@@ -11,3 +11,7 @@ class DailyFunFactDto(BaseModel):
     @staticmethod
     def from_model(model: DailyFunFact):
         return DailyFunFactDto(date=model.date, fact=model.fact)
+
+    @staticmethod
+    def to_json(model: DailyFunFact) -> dict:
+        return {"date": model.date.isoformat(), "fact": model.fact}
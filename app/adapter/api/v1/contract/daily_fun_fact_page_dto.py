@@ -0,0 +1,19 @@
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.adapter.api.v1.contract.daily_fun_fact_dto import DailyFunFactDto
+from app.domain.model import DailyFunFact
+
+
+class DailyFunFactPageDto(BaseModel):
+    items: list[DailyFunFactDto]
+    next_cursor: Optional[date]
+
+    @staticmethod
+    def to_json(models: list[DailyFunFact], next_cursor: Optional[date]) -> dict:
+        return {
+            "items": [DailyFunFactDto.to_json(model) for model in models],
+            "next_cursor": next_cursor.isoformat() if next_cursor else None,
+        }
@@ -1,5 +1,6 @@
 from functools import wraps
 
+from app.adapter.metrics import record_request_error
 from app.util import logger
 
 
@@ -10,5 +11,6 @@ def handle_errors(func):
             return await func(*args, **kwargs)
         except Exception as e:
             logger.error(f"Error in {func.__name__}: {e}")
+            record_request_error(func.__name__, e)
             raise e
     return wrapper
\ No newline at end of file
@@ -0,0 +1,88 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Iterable, Optional
+
+from fastapi import Request, Response
+
+from app.domain.model import DailyFunFact
+
+
+@dataclass(frozen=True)
+class CacheValidators:
+    etag: str
+    last_modified: datetime
+
+    @staticmethod
+    def from_facts(facts: Iterable[DailyFunFact]) -> 'CacheValidators':
+        digest = hashlib.sha256()
+        newest = date.min
+        for fact in facts:
+            digest.update(f"{fact.date.isoformat()}\0{fact.fact}\0".encode())
+            newest = max(newest, fact.date)
+        last_modified = datetime.combine(newest, time.min, tzinfo=timezone.utc)
+        return CacheValidators(etag=f'"{digest.hexdigest()[:32]}"', last_modified=last_modified)
+
+    def is_not_modified(self, request: Request) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            return self._etag_matches(if_none_match)
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is not None:
+            try:
+                return self.last_modified <= parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def apply(self, response: Response, cacheable: bool) -> None:
+        response.headers["ETag"] = self.etag
+        response.headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        if cacheable:
+            response.headers["Cache-Control"] = f"public, max-age={seconds_until_rollover()}"
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+
+    def _etag_matches(self, if_none_match: str) -> bool:
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if candidate == "*" or candidate.removeprefix("W/") == self.etag:
+                return True
+        return False
+
+
+@dataclass(frozen=True)
+class CachedRepresentation:
+    body: bytes
+    validators: CacheValidators
+    cacheable: bool
+
+    @staticmethod
+    def of(content: Any, facts: list[DailyFunFact], cacheable: bool) -> 'CachedRepresentation':
+        return CachedRepresentation(
+            body=encode_json(content),
+            validators=CacheValidators.from_facts(facts),
+            cacheable=cacheable,
+        )
+
+    def respond(self, request: Request) -> Response:
+        if self.validators.is_not_modified(request):
+            response = Response(status_code=304)
+        else:
+            response = Response(content=self.body, media_type="application/json")
+        self.validators.apply(response, self.cacheable)
+        return response
+
+
+def encode_json(content: Any) -> bytes:
+    # same output as fastapi's JSONResponse, without the jsonable_encoder pass
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def seconds_until_rollover(now: Optional[datetime] = None) -> int:
+    now = now or datetime.now()
+    next_midnight = datetime.combine(now.date() + timedelta(days=1), time.min)
+    return max(int((next_midnight - now).total_seconds()), 0)
@@ -1,29 +1,225 @@
-from typing import Annotated
+import asyncio
+from datetime import date
+from typing import Annotated, AsyncIterator, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response, Query
 from fastapi.params import Depends
+from fastapi.responses import StreamingResponse
 
-from app.adapter.api.v1.contract import DailyFunFactDto
+from app.adapter.api.v1.contract import (
+    DailyFunFactDto,
+    DailyFunFactPageDto,
+    DailyFunFactBatchRequestDto,
+    DailyFunFactBatchDto,
+)
 from app.adapter.api.v1.error_handler import handle_errors
-from app.domain.service import get_daily_fun_fact_service, DailyFunFactService
-from app.util import logger
+from app.adapter.api.v1.http_cache import CachedRepresentation, encode_json
+from app.adapter.metrics import record_cache_lookup
+from app.adapter.push import FunFactBroadcaster, get_fun_fact_broadcaster
+from app.adapter.ratelimit import enforce_rate_limit
+from app.domain.model import DailyFunFact
+from app.domain.service import (
+    get_category_fun_fact_service,
+    get_daily_fun_fact_service,
+    CategoryFunFactService,
+    DailyFunFactService,
+)
+from app.util import logger, DailyLruCache
 
 
-router = APIRouter(prefix="/v1/fun-facts")
+router = APIRouter(prefix="/v1/fun-facts", dependencies=[Depends(enforce_rate_limit)])
+
+_RECENT_COUNT = 10
+_DEFAULT_PAGE_SIZE = 100
+_MAX_PAGE_SIZE = 1000
+_STREAM_PAGE_SIZE = 500
+_NDJSON_MEDIA_TYPE = "application/x-ndjson"
+_PUSH_KEEP_ALIVE_SECONDS = 25.0  # below the idle timeout of common proxies
+_PUSH_RETRY_MS = 5000
+
+# encoded responses that cannot change before the next rollover
+_representations = DailyLruCache(max_size=16, on_lookup=lambda hit: record_cache_lookup("http", hit))
+
+def clear_cached_representations() -> None:
+    # for callers that replace the service underneath, e.g. tests and benchmarks
+    _representations.clear()
 
 @router.get("/today", response_model=DailyFunFactDto)
 @handle_errors
-async def get_todays_fun_fact(service: Annotated[DailyFunFactService, Depends(get_daily_fun_fact_service)]):
+async def get_todays_fun_fact(
+    request: Request,
+    service: Annotated[DailyFunFactService, Depends(get_daily_fun_fact_service)],
+):
+    representation = _representations.get("today")
+    if representation:
+        return representation.respond(request)
+
     logger.info("Retrieving today's fun fact")
     fact = await service.get_todays_fun_fact()
 
     if not fact:
         raise HTTPException(status_code=404, detail="Fun fact not found")
-    return DailyFunFactDto.from_model(fact)
+
+    representation = CachedRepresentation.of(
+        DailyFunFactDto.to_json(fact),
+        [fact],
+        cacheable=fact.date == date.today(),
+    )
+    if representation.cacheable:
+        _representations.put("today", representation, fact.date)
+    return representation.respond(request)
+
+@router.get("/today/stream")
+@handle_errors
+async def stream_todays_fun_fact(service: Annotated[DailyFunFactService, Depends(get_daily_fun_fact_service)]):
+    logger.info("Streaming today's fun fact")
+    return StreamingResponse(
+        _stream_todays_fun_fact_events(service),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 @router.get("/recent", response_model=list[DailyFunFactDto])
 @handle_errors
-async def get_recent_fun_facts(service: Annotated[DailyFunFactService, Depends(get_daily_fun_fact_service)]):
+async def get_recent_fun_facts(
+    request: Request,
+    service: Annotated[DailyFunFactService, Depends(get_daily_fun_fact_service)],
+):
+    key = ("recent", _RECENT_COUNT)
+    representation = _representations.get(key)
+    if representation:
+        return representation.respond(request)
+
     logger.info("Retrieving recent fun facts")
-    facts = await service.get_last_n_fun_facts(10)
-    return [DailyFunFactDto.from_model(fact) for fact in facts]
+    facts = await service.get_last_n_fun_facts(_RECENT_COUNT)
+
+    # until today's fact exists the list may still change
+    representation = CachedRepresentation.of(
+        [DailyFunFactDto.to_json(fact) for fact in facts],
+        facts,
+        cacheable=bool(facts) and facts[0].date == date.today(),
+    )
+    if representation.cacheable:
+        _representations.put(key, representation, facts[0].date)
+    return representation.respond(request)
+
+@router.get("/subscribe")
+async def subscribe_to_fun_facts(
+    broadcaster: Annotated[Optional[FunFactBroadcaster], Depends(get_fun_fact_broadcaster)],
+):
+    if broadcaster is None:
+        raise HTTPException(status_code=503, detail="Push needs Redis as the authoritative cache tier")
+
+    logger.info("Subscribing to new fun facts")
+    return StreamingResponse(
+        _push_fun_fact_events(broadcaster),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.get("", response_model=DailyFunFactPageDto)
+@handle_errors
+async def get_fun_facts(
+    request: Request,
+    service: Annotated[DailyFunFactService, Depends(get_daily_fun_fact_service)],
+    from_date: Annotated[Optional[date], Query(alias="from")] = None,
+    to_date: Annotated[Optional[date], Query(alias="to")] = None,
+    limit: Annotated[Optional[int], Query(ge=1)] = None,
+    cursor: Optional[date] = None,
+):
+    start = cursor or from_date or date.min
+    end = to_date or date.today()
+
+    if _NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        logger.info(f"Streaming fun facts from {start} to {end}")
+        pages = service.iter_fun_fact_pages(start, end, _STREAM_PAGE_SIZE, limit)
+        return StreamingResponse(_encode_ndjson(pages), media_type=_NDJSON_MEDIA_TYPE)
+
+    limit = limit or _DEFAULT_PAGE_SIZE
+    if limit > _MAX_PAGE_SIZE:
+        raise HTTPException(
+            status_code=422,
+            detail=f"limit must be at most {_MAX_PAGE_SIZE}, request {_NDJSON_MEDIA_TYPE} for larger ranges",
+        )
+
+    logger.info(f"Retrieving fun facts from {start} to {end}")
+    facts, next_cursor = await service.get_fun_facts_page(start, end, limit)
+    return Response(content=encode_json(DailyFunFactPageDto.to_json(facts, next_cursor)), media_type="application/json")
+
+@router.post("/batch", response_model=DailyFunFactBatchDto)
+@handle_errors
+async def get_fun_facts_batch(
+    body: DailyFunFactBatchRequestDto,
+    service: Annotated[DailyFunFactService, Depends(get_daily_fun_fact_service)],
+):
+    logger.info(f"Retrieving fun facts of {len(body.dates)} dates")
+    found, missing = await service.get_fun_facts_by_date(body.dates)
+    return Response(content=encode_json(DailyFunFactBatchDto.to_json(found, missing)), media_type="application/json")
+
+@router.get("/{category}/today", response_model=DailyFunFactDto)
+@handle_errors
+async def get_todays_category_fun_fact(
+    category: str,
+    request: Request,
+    service: Annotated[CategoryFunFactService, Depends(get_category_fun_fact_service)],
+):
+    category = category.lower()
+    if category not in service.categories:
+        raise HTTPException(status_code=404, detail="Unknown category")
+
+    key = ("today", category)
+    representation = _representations.get(key)
+    if representation:
+        return representation.respond(request)
+
+    logger.info(f"Retrieving today's fun fact about {category}")
+    fact = await service.get_todays_fun_fact(category)
+
+    if not fact:
+        raise HTTPException(status_code=404, detail="Fun fact not found")
+
+    representation = CachedRepresentation.of(
+        DailyFunFactDto.to_json(fact),
+        [fact],
+        cacheable=fact.date == date.today(),
+    )
+    if representation.cacheable:
+        _representations.put(key, representation, fact.date)
+    return representation.respond(request)
+
+async def _stream_todays_fun_fact_events(service: DailyFunFactService) -> AsyncIterator[bytes]:
+    # token events are provisional, the closing fact event carries the stored fact
+    try:
+        async for chunk in service.stream_todays_fun_fact():
+            yield _encode_sse("token", {"token": chunk})
+
+        fact = await service.get_todays_fun_fact()
+        if fact:
+            yield _encode_sse("fact", DailyFunFactDto.to_json(fact))
+        else:
+            yield _encode_sse("error", {"detail": "Fun fact not found"})
+    except Exception as e:
+        logger.error(f"Error in stream_todays_fun_fact: {e}")
+        yield _encode_sse("error", {"detail": "Fun fact could not be generated"})
+
+async def _push_fun_fact_events(broadcaster: FunFactBroadcaster) -> AsyncIterator[bytes]:
+    # tells EventSource clients how long to wait before reconnecting
+    yield f"retry: {_PUSH_RETRY_MS}\n\n".encode()
+    async with broadcaster.subscribe() as facts:
+        while True:
+            try:
+                fact = await asyncio.wait_for(facts.get(), _PUSH_KEEP_ALIVE_SECONDS)
+            except TimeoutError:
+                yield b": keep-alive\n\n"
+                continue
+
+            if fact is None:
+                return  # fell behind or the worker is shutting down, the client reconnects
+            yield _encode_sse("fact", DailyFunFactDto.to_json(fact))
+
+def _encode_sse(event: str, data: dict) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + encode_json(data) + b"\n\n"
+
+async def _encode_ndjson(pages: AsyncIterator[list[DailyFunFact]]) -> AsyncIterator[bytes]:
+    async for facts in pages:
+        yield b"".join(encode_json(DailyFunFactDto.to_json(fact)) + b"\n" for fact in facts)
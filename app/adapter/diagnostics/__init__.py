@@ -0,0 +1,3 @@
+from app.adapter.diagnostics.sampling_profiler import SamplingProfiler
+from app.adapter.diagnostics.server_timing_middleware import ServerTimingMiddleware
+from app.adapter.diagnostics.slow_request_profiler_middleware import SlowRequestProfilerMiddleware
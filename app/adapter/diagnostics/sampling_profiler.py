@@ -0,0 +1,55 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from types import FrameType
+from typing import Optional
+
+
+class SamplingProfiler:
+    """Samples the stack of one thread, normally the event loop's, into a ring buffer of recent stacks."""
+
+    _DEFAULT_INTERVAL = 0.005
+    _DEFAULT_MAX_SAMPLES = 10_000
+
+    def __init__(self, interval: float = _DEFAULT_INTERVAL, max_samples: int = _DEFAULT_MAX_SAMPLES):
+        self._interval = interval
+        self._samples: deque[tuple[float, str]] = deque(maxlen=max_samples)
+        self._target_thread_id: Optional[int] = None
+        self._sampler: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self, thread_id: int) -> None:
+        self._target_thread_id = thread_id
+        if self._sampler is not None:
+            return
+        self._stopped.clear()
+        self._sampler = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        if self._sampler is None:
+            return
+        self._stopped.set()
+        self._sampler.join()
+        self._sampler = None
+
+    def collapsed_stacks(self, start: float, end: float) -> Counter[str]:
+        """Counts the stacks sampled between two `time.monotonic()` readings, in the folded flame graph format."""
+        return Counter(stack for sampled_at, stack in list(self._samples) if start <= sampled_at <= end)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            frame = sys._current_frames().get(self._target_thread_id)
+            if frame is not None:
+                self._samples.append((time.monotonic(), self._collapse(frame)))
+
+    @staticmethod
+    def _collapse(frame: Optional[FrameType]) -> str:
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{code.co_qualname} ({os.path.basename(code.co_filename)})")
+            frame = frame.f_back
+        return ";".join(reversed(names))
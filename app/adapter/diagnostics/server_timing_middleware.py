@@ -0,0 +1,34 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.util import start_phase_timings, stop_phase_timings
+
+
+class ServerTimingMiddleware:
+    """Reports the phases recorded with `timed_phase` while handling a request in a Server-Timing header."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        timings, token = start_phase_timings()
+
+        async def send_with_timings(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # streamed responses only report what happened before their first byte
+                metrics = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in timings.items()]
+                metrics.append(f"total;dur={(time.perf_counter() - started) * 1000:.1f}")
+                MutableHeaders(scope=message).append("Server-Timing", ", ".join(metrics))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timings)
+        finally:
+            stop_phase_timings(token)
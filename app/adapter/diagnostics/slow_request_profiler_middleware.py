@@ -0,0 +1,56 @@
+import asyncio
+import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.adapter.diagnostics.sampling_profiler import SamplingProfiler
+from app.util import logger
+
+
+class SlowRequestProfilerMiddleware:
+    """Writes the stacks sampled during requests slower than a threshold to a directory, one file per request.
+
+    The sampled thread runs every request of the worker, so a profile also shows whatever ran concurrently.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: SamplingProfiler, directory: str, threshold: float):
+        self.app = app
+        self._profiler = profiler
+        self._directory = directory
+        self._threshold = threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        self._profiler.start(threading.get_ident())
+        started = time.monotonic()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            elapsed = time.monotonic() - started
+            if elapsed >= self._threshold:
+                stacks = self._profiler.collapsed_stacks(started, started + elapsed)
+                await asyncio.to_thread(self._write_profile, scope, elapsed, stacks)
+
+    def _write_profile(self, scope: Scope, elapsed: float, stacks: Counter[str]) -> None:
+        if not stacks:
+            return  # faster than the sampling interval
+
+        route = scope.get("route")
+        route_name = (route.path if route else scope["path"]).strip("/").replace("/", "_") or "root"
+        file_name = f"{datetime.now():%Y%m%dT%H%M%S}-{os.getpid()}-{route_name}-{elapsed * 1000:.0f}ms.folded"
+        path = os.path.join(self._directory, file_name)
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            with open(path, "w") as profile:
+                profile.writelines(f"{stack} {count}\n" for stack, count in stacks.most_common())
+        except OSError as e:
+            logger.warning(f"Could not write the profile of a slow request to {path}: {e}")
+            return
+        logger.warning(f"{scope['method']} {scope['path']} took {elapsed * 1000:.0f}ms, profile written to {path}")
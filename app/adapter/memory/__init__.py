@@ -0,0 +1,16 @@
+import os
+from typing import Optional
+
+from app.adapter.memory.daily_fun_fact_memory_adapter import FunFactMemoryAdapter
+from app.domain.port.daily_fun_fact_cache_port import DailyFunFactCachePort
+
+
+_daily_fun_fact_memory_adapter_instance: Optional[FunFactMemoryAdapter] = None
+
+def get_daily_fun_fact_memory_adapter() -> DailyFunFactCachePort:
+    global _daily_fun_fact_memory_adapter_instance
+    if _daily_fun_fact_memory_adapter_instance is None:
+        _daily_fun_fact_memory_adapter_instance = FunFactMemoryAdapter(
+            max_size=int(os.environ.get("MEMORY_CACHE_MAX_SIZE", "1024"))
+        )
+    return _daily_fun_fact_memory_adapter_instance
@@ -0,0 +1,89 @@
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Callable, Optional
+
+from app.domain.model import DailyFunFact
+from app.domain.port import DailyFunFactCachePort
+
+
+class FunFactMemoryAdapter(DailyFunFactCachePort):
+    """Bounded in-process LRU of facts by date, meant as the top tier of a TieredCachePort.
+
+    Its locks only coordinate callers within this process.
+    """
+
+    _DEFAULT_MAX_SIZE = 1024
+
+    def __init__(self, max_size: int = _DEFAULT_MAX_SIZE, clock: Callable[[], float] = time.monotonic):
+        self._max_size = max_size
+        self._clock = clock
+        self._facts: OrderedDict[date, str] = OrderedDict()
+        self._lock_expiries: dict[date, float] = {}
+        self._stored: dict[date, asyncio.Event] = {}
+
+    async def store(self, fun_fact: DailyFunFact) -> None:
+        self._facts[fun_fact.date] = fun_fact.fact
+        self._facts.move_to_end(fun_fact.date)
+        while len(self._facts) > self._max_size:
+            self._facts.popitem(last=False)
+
+        stored = self._stored.pop(fun_fact.date, None)
+        if stored:
+            stored.set()
+
+    async def get(self, date: date) -> Optional[DailyFunFact]:
+        fact = self._facts.get(date)
+        if fact is None:
+            return None
+
+        self._facts.move_to_end(date)
+        return DailyFunFact(date=date, fact=fact)
+
+    async def get_last_n(self, limit: int) -> list[DailyFunFact]:
+        today = date.today()
+        dates = sorted((fact_date for fact_date in self._facts if fact_date <= today), reverse=True)
+        return [DailyFunFact(date=fact_date, fact=self._facts[fact_date]) for fact_date in dates[:limit]]
+
+    async def get_range(self, start: date, end: date, limit: int) -> list[DailyFunFact]:
+        dates = sorted(fact_date for fact_date in self._facts if start <= fact_date <= end)
+        return [DailyFunFact(date=fact_date, fact=self._facts[fact_date]) for fact_date in dates[:limit]]
+
+    async def get_many(self, dates: list[date]) -> list[DailyFunFact]:
+        return [
+            DailyFunFact(date=query_date, fact=self._facts[query_date])
+            for query_date in dates
+            if query_date in self._facts
+        ]
+
+    async def acquire_lock(self, date: date, ttl: int = 10) -> bool:
+        now = self._clock()
+        if self._lock_expiries.get(date, now) > now:
+            return False
+
+        self._lock_expiries[date] = now + ttl
+        return True
+
+    async def renew_lock(self, date: date, ttl: int = 10) -> bool:
+        now = self._clock()
+        if self._lock_expiries.get(date, now) <= now:
+            return False
+
+        self._lock_expiries[date] = now + ttl
+        return True
+
+    async def release_lock(self, date: date):
+        self._lock_expiries.pop(date, None)
+
+    async def wait_for_store(self, date: date, timeout: float) -> Optional[DailyFunFact]:
+        fact = await self.get(date)
+        if fact:
+            return fact
+
+        stored = self._stored.setdefault(date, asyncio.Event())
+        try:
+            await asyncio.wait_for(stored.wait(), timeout)
+        except TimeoutError:
+            pass
+        return await self.get(date)
@@ -0,0 +1,10 @@
+from app.adapter.metrics.instrumented_cache_port import InstrumentedCachePort
+from app.adapter.metrics.instrumented_llm_port import InstrumentedLlmPort
+from app.adapter.metrics.metrics import (
+    record_cache_lookup,
+    record_llm_usage,
+    record_request_error,
+    reset_multiprocess_dir,
+)
+from app.adapter.metrics.request_metrics_middleware import RequestMetricsMiddleware
+from app.adapter.metrics.router import metrics_router
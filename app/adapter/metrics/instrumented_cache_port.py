@@ -0,0 +1,56 @@
+from datetime import date
+from typing import Optional
+
+from app.adapter.metrics.metrics import CACHE_LOOKUPS, LOCK_ACQUISITIONS, observe_port_call, record_cache_lookup
+from app.domain.model import DailyFunFact
+from app.domain.port import DailyFunFactCachePort
+
+
+class InstrumentedCachePort(DailyFunFactCachePort):
+
+    def __init__(self, cache_port: DailyFunFactCachePort, name: str):
+        self._cache_port = cache_port
+        self._name = name
+
+    async def store(self, fun_fact: DailyFunFact) -> None:
+        with observe_port_call(self._name, "store"):
+            await self._cache_port.store(fun_fact)
+
+    async def get(self, date: date) -> Optional[DailyFunFact]:
+        with observe_port_call(self._name, "get"):
+            fact = await self._cache_port.get(date)
+        record_cache_lookup(self._name, fact is not None)
+        return fact
+
+    async def get_last_n(self, limit: int) -> list[DailyFunFact]:
+        with observe_port_call(self._name, "get_last_n"):
+            return await self._cache_port.get_last_n(limit)
+
+    async def get_range(self, start: date, end: date, limit: int) -> list[DailyFunFact]:
+        with observe_port_call(self._name, "get_range"):
+            return await self._cache_port.get_range(start, end, limit)
+
+    async def get_many(self, dates: list[date]) -> list[DailyFunFact]:
+        with observe_port_call(self._name, "get_many"):
+            facts = await self._cache_port.get_many(dates)
+        CACHE_LOOKUPS.labels(self._name, "hit").inc(len(facts))
+        CACHE_LOOKUPS.labels(self._name, "miss").inc(len(dates) - len(facts))
+        return facts
+
+    async def acquire_lock(self, date: date, ttl: int = 10) -> bool:
+        with observe_port_call(self._name, "acquire_lock"):
+            acquired = await self._cache_port.acquire_lock(date, ttl)
+        LOCK_ACQUISITIONS.labels(self._name, "won" if acquired else "lost").inc()
+        return acquired
+
+    async def renew_lock(self, date: date, ttl: int = 10) -> bool:
+        with observe_port_call(self._name, "renew_lock"):
+            return await self._cache_port.renew_lock(date, ttl)
+
+    async def release_lock(self, date: date):
+        with observe_port_call(self._name, "release_lock"):
+            await self._cache_port.release_lock(date)
+
+    async def wait_for_store(self, date: date, timeout: float) -> Optional[DailyFunFact]:
+        with observe_port_call(self._name, "wait_for_store"):
+            return await self._cache_port.wait_for_store(date, timeout)
@@ -0,0 +1,23 @@
+from contextlib import aclosing
+from typing import AsyncIterator, Optional
+
+from app.adapter.metrics.metrics import observe_port_call
+from app.domain.port import LlmPort
+
+
+class InstrumentedLlmPort(LlmPort):
+
+    def __init__(self, llm_port: LlmPort, name: str):
+        self._llm_port = llm_port
+        self._name = name
+
+    async def chat(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+        with observe_port_call(self._name, "chat"):
+            return await self._llm_port.chat(prompt, max_tokens)
+
+    async def stream_chat(self, prompt: str) -> AsyncIterator[str]:
+        with observe_port_call(self._name, "stream_chat"):
+            # closes the wrapped stream too when the consumer leaves early
+            async with aclosing(self._llm_port.stream_chat(prompt)) as chunks:
+                async for chunk in chunks:
+                    yield chunk
@@ -0,0 +1,70 @@
+import glob
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from prometheus_client import CollectorRegistry, Counter, Histogram, REGISTRY, generate_latest, multiprocess
+
+
+_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+PORT_CALL_SECONDS = Histogram(
+    "funfacts_port_call_seconds", "Latency of calls to the cache and LLM ports.", ["port", "method"],
+    buckets=_LATENCY_BUCKETS,
+)
+PORT_CALL_ERRORS = Counter(
+    "funfacts_port_call_errors_total", "Port calls that raised, by exception type.", ["port", "method", "error"]
+)
+LOCK_ACQUISITIONS = Counter(
+    "funfacts_lock_acquisitions_total", "Generation lock acquire attempts by outcome.", ["port", "outcome"]
+)
+CACHE_LOOKUPS = Counter("funfacts_cache_lookups_total", "Cache lookups by tier and result.", ["tier", "result"])
+LLM_TOKENS = Counter("funfacts_llm_tokens_total", "Tokens billed by the LLM provider.", ["kind"])
+REQUEST_ERRORS = Counter(
+    "funfacts_request_errors_total", "Errors raised by API handlers, by exception type.", ["handler", "error"]
+)
+REQUEST_SECONDS = Histogram(
+    "funfacts_http_request_seconds", "HTTP request latency by route.", ["method", "route", "status"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+
+@contextmanager
+def observe_port_call(port: str, method: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        PORT_CALL_ERRORS.labels(port, method, type(e).__name__).inc()
+        raise
+    finally:
+        PORT_CALL_SECONDS.labels(port, method).observe(time.perf_counter() - started)
+
+def record_cache_lookup(tier: str, hit: bool) -> None:
+    CACHE_LOOKUPS.labels(tier, "hit" if hit else "miss").inc()
+
+def record_llm_usage(prompt_tokens: int, completion_tokens: int) -> None:
+    LLM_TOKENS.labels("prompt").inc(prompt_tokens)
+    LLM_TOKENS.labels("completion").inc(completion_tokens)
+
+def record_request_error(handler: str, error: Exception) -> None:
+    REQUEST_ERRORS.labels(handler, type(error).__name__).inc()
+
+def render_metrics() -> bytes:
+    # with several workers each process writes its samples under PROMETHEUS_MULTIPROC_DIR, so any worker can
+    # answer the scrape with the aggregate
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+def reset_multiprocess_dir() -> None:
+    # samples left by a previous run would be aggregated into this one
+    directory = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if not directory:
+        return
+    os.makedirs(directory, exist_ok=True)
+    for path in glob.glob(os.path.join(directory, "*.db")):
+        os.remove(path)
@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from app.adapter.metrics.metrics import render_metrics
+
+
+metrics_router = APIRouter()
+
+@metrics_router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
@@ -1,11 +1,34 @@
 import os
+from typing import Optional
 
+from app.adapter.metrics import record_llm_usage
 from app.adapter.mistral.mistral_adapter import MistralAdapter
+from app.adapter.resilience import CircuitBreaker, ResilientLlmAdapter
 from app.domain.port.llm_port import LlmPort
 
 
-_mistral_api_key = os.getenv("MISTRAL_API_KEY", "")
-_mistral_adapter_instance: LlmPort = MistralAdapter(_mistral_api_key)
+_mistral_client_instance: Optional[MistralAdapter] = None
+_mistral_adapter_instance: Optional[LlmPort] = None
 
 def get_mistral_adapter() -> LlmPort:
+    global _mistral_client_instance, _mistral_adapter_instance
+    if _mistral_adapter_instance is None:
+        hedge_percentile = os.getenv("LLM_HEDGE_PERCENTILE")
+        _mistral_client_instance = MistralAdapter(os.getenv("MISTRAL_API_KEY", ""), usage_listener=record_llm_usage)
+        _mistral_adapter_instance = ResilientLlmAdapter(
+            _mistral_client_instance,
+            timeout=float(os.getenv("LLM_TIMEOUT_SECONDS", "15")),
+            max_attempts=int(os.getenv("LLM_MAX_ATTEMPTS", "3")),
+            hedge_percentile=float(hedge_percentile) if hedge_percentile else None,
+            circuit_breaker=CircuitBreaker(
+                failure_threshold=int(os.getenv("LLM_CIRCUIT_FAILURE_THRESHOLD", "5")),
+                reset_timeout=float(os.getenv("LLM_CIRCUIT_RESET_SECONDS", "30")),
+            ),
+        )
     return _mistral_adapter_instance
+
+async def close_mistral_adapter() -> None:
+    global _mistral_client_instance, _mistral_adapter_instance
+    client, _mistral_client_instance, _mistral_adapter_instance = _mistral_client_instance, None, None
+    if client is not None:
+        await client.close()
@@ -1,3 +1,5 @@
+from typing import AsyncIterator, Callable, Optional
+
 from mistralai import Mistral
 
 from app.domain.port import LlmPort
@@ -6,14 +8,16 @@ from app.domain.port import LlmPort
 class MistralAdapter(LlmPort):
     _DEFAULT_MODEL = "mistral-tiny"
     _DEFAULT_TEMP = 1.0
-    _MAX_TOKENS = 4096
+    _MAX_TOKENS = 256  # a single-sentence fact
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, usage_listener: Optional[Callable[[int, int], None]] = None):
         self.client = Mistral(api_key=api_key)
+        self._usage_listener = usage_listener
 
     async def chat(
         self,
         prompt: str,
+        max_tokens: Optional[int] = None,
         model: str = _DEFAULT_MODEL,
         temperature: float = _DEFAULT_TEMP,
     ) -> str:
@@ -21,6 +25,34 @@ class MistralAdapter(LlmPort):
             model=model,
             messages=[{"role": "user", "content": prompt}], # type: ignore
             temperature=temperature,
-            max_tokens=self._MAX_TOKENS,
+            max_tokens=max_tokens or self._MAX_TOKENS,
         )
+        self._report_usage(response.usage)
         return str(response.choices[0].message.content)
+
+    async def stream_chat(
+        self,
+        prompt: str,
+        model: str = _DEFAULT_MODEL,
+        temperature: float = _DEFAULT_TEMP,
+    ) -> AsyncIterator[str]:
+        events = await self.client.chat.stream_async(
+            model=model,
+            messages=[{"role": "user", "content": prompt}], # type: ignore
+            temperature=temperature,
+            max_tokens=self._MAX_TOKENS,
+        )
+        async with events:
+            async for event in events:
+                # only the last chunk carries the usage of the whole completion
+                self._report_usage(event.data.usage)
+                content = event.data.choices[0].delta.content
+                if content:
+                    yield str(content)
+
+    async def close(self) -> None:
+        await self.client.__aexit__(None, None, None)
+
+    def _report_usage(self, usage) -> None:
+        if self._usage_listener and usage:
+            self._usage_listener(usage.prompt_tokens or 0, usage.completion_tokens or 0)
@@ -0,0 +1,28 @@
+import os
+from typing import Optional
+
+from app.adapter.push.fun_fact_broadcaster import FunFactBroadcaster
+from app.domain.service import authoritative_cache_tier, get_daily_fun_fact_service
+
+
+_fun_fact_broadcaster_instance: Optional[FunFactBroadcaster] = None
+
+def get_fun_fact_broadcaster() -> Optional[FunFactBroadcaster]:
+    # only stores to Redis as the authoritative tier publish new facts, any other deployment would never push one
+    if authoritative_cache_tier() != "redis":
+        return None
+
+    global _fun_fact_broadcaster_instance
+    if _fun_fact_broadcaster_instance is None:
+        _fun_fact_broadcaster_instance = FunFactBroadcaster(
+            os.environ.get("REDIS_URL", "redis://localhost:6379"),
+            get_daily_fun_fact_service().cache_port,
+            queue_size=int(os.getenv("PUSH_QUEUE_SIZE", "4")),
+        )
+    return _fun_fact_broadcaster_instance
+
+async def close_fun_fact_broadcaster() -> None:
+    global _fun_fact_broadcaster_instance
+    broadcaster, _fun_fact_broadcaster_instance = _fun_fact_broadcaster_instance, None
+    if broadcaster is not None:
+        await broadcaster.close()
@@ -0,0 +1,124 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date, datetime, time, timedelta
+from typing import AsyncIterator, Callable, Optional
+
+import redis.asyncio as redis
+
+from app.domain.model import DailyFunFact
+from app.domain.port import DailyFunFactCachePort
+from app.util import logger
+
+
+class FunFactBroadcaster:
+    """Pushes each new daily fact to the subscribers of this worker, which share one Redis pub/sub subscription.
+
+    Every subscriber has a small bounded queue. One that falls behind is sent None and dropped instead of buffering
+    without bound. A fact stored ahead of its date is pushed at its midnight.
+    """
+
+    _CHANNEL_PREFIX = "funfacts:stored:"  # published by FunFactRedisAdapter.store
+    _DEFAULT_QUEUE_SIZE = 4
+    _RECONNECT_DELAY = 1.0
+    _MAX_RECONNECT_DELAY = 30.0
+
+    def __init__(
+        self,
+        redis_url: str,
+        cache_port: DailyFunFactCachePort,
+        queue_size: int = _DEFAULT_QUEUE_SIZE,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        self._client = redis.from_url(redis_url, decode_responses=True)
+        self._cache_port = cache_port
+        self._queue_size = queue_size
+        self._clock = clock
+        self._subscribers: set[asyncio.Queue] = set()
+        self._deferred: dict[date, asyncio.Task] = {}
+        self._last_pushed: Optional[date] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue]:
+        # the Redis subscription starts with the first subscriber of the worker
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    def push(self, fact: DailyFunFact) -> None:
+        today = self._clock().date()
+        if fact.date > today:
+            self._defer(fact)
+            return
+        if fact.date < today or (self._last_pushed and fact.date <= self._last_pushed):
+            return  # a backfill or a fact the subscribers already have
+
+        self._last_pushed = fact.date
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(fact)
+            except asyncio.QueueFull:
+                self._drop(queue)
+
+    async def close(self) -> None:
+        tasks = [*self._deferred.values(), *([self._task] if self._task else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        for queue in list(self._subscribers):
+            self._drop(queue)
+        await self._client.aclose()
+
+    def _drop(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    def _defer(self, fact: DailyFunFact) -> None:
+        if fact.date in self._deferred:
+            return
+
+        task = asyncio.create_task(self._push_when_due(fact))
+        self._deferred[fact.date] = task
+        task.add_done_callback(lambda _: self._deferred.pop(fact.date, None))
+
+    async def _push_when_due(self, fact: DailyFunFact) -> None:
+        while self._clock().date() < fact.date:
+            due = datetime.combine(fact.date, time.min)
+            await asyncio.sleep(max((due - self._clock()).total_seconds(), 0))
+        self.push(fact)
+
+    async def _listen(self) -> None:
+        delay = self._RECONNECT_DELAY
+        while True:
+            try:
+                async with self._client.pubsub() as pubsub:
+                    await pubsub.psubscribe(f"{self._CHANNEL_PREFIX}*")
+                    delay = self._RECONNECT_DELAY
+                    # subscribed before checking, so that a fact pre-generated before now is not missed
+                    tomorrow = await self._cache_port.get(self._clock().date() + timedelta(days=1))
+                    if tomorrow:
+                        self.push(tomorrow)
+
+                    async for message in pubsub.listen():
+                        if message["type"] == "pmessage":
+                            fact_date = date.fromisoformat(message["channel"].removeprefix(self._CHANNEL_PREFIX))
+                            self.push(DailyFunFact(date=fact_date, fact=message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Lost the subscription to stored fun facts, retrying in {delay:.0f}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._MAX_RECONNECT_DELAY)
@@ -0,0 +1,2 @@
+from app.adapter.ratelimit.rate_limit_dependency import close_rate_limiter, enforce_rate_limit, get_rate_limiter
+from app.adapter.ratelimit.rate_limiter import RateLimit, RateLimiter
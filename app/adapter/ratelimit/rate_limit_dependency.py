@@ -0,0 +1,104 @@
+import ipaddress
+import json
+import math
+import os
+from typing import Optional
+
+from fastapi import HTTPException, Request
+
+from app.adapter.ratelimit.rate_limiter import RateLimit, RateLimiter
+
+
+# budgets per route template: "client" is per client address, "total" is shared by all clients
+_DEFAULT_RULES = {
+    "*": {"client": "120/60"},
+    "/v1/fun-facts": {"client": "30/60"},
+    "/v1/fun-facts/batch": {"client": "30/60"},
+    "/v1/fun-facts/today/stream": {"client": "10/60"},
+    "/v1/fun-facts/subscribe": {"client": "10/60"},
+}
+
+_rate_limiter_instance: Optional[RateLimiter] = None
+_rules_instance: Optional[dict[str, dict[str, RateLimit]]] = None
+_trusted_proxies_instance: Optional[list[ipaddress.IPv4Network | ipaddress.IPv6Network]] = None
+
+def _rate_limiting_enabled() -> bool:
+    return os.getenv("RATE_LIMIT_ENABLED", "false").lower() == "true"
+
+def _rules() -> dict[str, dict[str, RateLimit]]:
+    global _rules_instance
+    if _rules_instance is None:
+        rules = {**_DEFAULT_RULES, **json.loads(os.getenv("RATE_LIMITS", "{}"))}
+        _rules_instance = {
+            route: {scope: RateLimit.parse(limit) for scope, limit in budgets.items()}
+            for route, budgets in rules.items()
+        }
+    return _rules_instance
+
+def _trusted_proxies() -> list[ipaddress.IPv4Network | ipaddress.IPv6Network]:
+    global _trusted_proxies_instance
+    if _trusted_proxies_instance is None:
+        _trusted_proxies_instance = [
+            ipaddress.ip_network(proxy.strip(), strict=False)
+            for proxy in os.getenv("RATE_LIMIT_TRUSTED_PROXIES", "").split(",")
+            if proxy.strip()
+        ]
+    return _trusted_proxies_instance
+
+def _is_trusted_proxy(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in _trusted_proxies())
+
+def _client_address(request: Request) -> str:
+    # X-Forwarded-For is only believed when it was appended by a proxy we trust; walking it from the
+    # right, the first address that is not one of our proxies is the client (anything left of it may be forged)
+    address = request.client.host if request.client else "unknown"
+    if not _is_trusted_proxy(address):
+        return address
+    forwarded = [hop.strip() for hop in request.headers.get("x-forwarded-for", "").split(",") if hop.strip()]
+    for hop in reversed(forwarded):
+        address = hop
+        if not _is_trusted_proxy(hop):
+            break
+    return address
+
+def get_rate_limiter() -> RateLimiter:
+    global _rate_limiter_instance
+    if _rate_limiter_instance is None:
+        _rate_limiter_instance = RateLimiter(
+            os.environ.get("REDIS_URL", "redis://localhost:6379"),
+            lease_size=int(os.getenv("RATE_LIMIT_LEASE_SIZE", "5")),
+        )
+    return _rate_limiter_instance
+
+async def close_rate_limiter() -> None:
+    global _rate_limiter_instance
+    limiter, _rate_limiter_instance = _rate_limiter_instance, None
+    if limiter is not None:
+        await limiter.close()
+
+async def enforce_rate_limit(request: Request) -> None:
+    if not _rate_limiting_enabled():
+        return
+
+    route = request.scope["route"].path
+    rules = _rules()
+    budgets = {**rules["*"], **rules.get(route, {})}
+    client = _client_address(request)
+
+    limiter = get_rate_limiter()
+    for scope, key in (("client", f"{route}:{client}"), ("total", route)):
+        limit = budgets.get(scope)
+        if limit is None:
+            continue
+
+        retry_after = await limiter.acquire(key, limit)
+        if retry_after > 0:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many requests",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
@@ -0,0 +1,127 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+import redis.asyncio as redis
+
+from app.util import logger
+
+
+# KEYS: bucket / ARGV: capacity, tokens refilled per ms, most tokens to take
+# the clock is Redis', so that workers with skewed clocks share one bucket
+_TAKE_TOKENS_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'at')
+local tokens = tonumber(bucket[1]) or capacity
+local at = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(now - at, 0) * rate)
+local granted = math.min(tonumber(ARGV[3]), math.floor(tokens))
+tokens = tokens - granted
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'at', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate) + 1000)
+if granted > 0 then
+    return {granted, 0}
+end
+return {0, math.ceil((1 - tokens) / rate)}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    capacity: int
+    period: float  # seconds to refill the whole capacity
+
+    @staticmethod
+    def parse(value: str) -> 'RateLimit':
+        # "60/60" allows bursts of 60 requests and 60 requests per 60 seconds
+        capacity, period = value.split("/")
+        return RateLimit(capacity=int(capacity), period=float(period))
+
+    @property
+    def tokens_per_ms(self) -> float:
+        return self.capacity / self.period / 1000
+
+
+@dataclass
+class _Lease:
+    tokens: int = 0
+    expires_at: float = 0.0
+    denied_until: float = 0.0
+
+
+class RateLimiter:
+    """Token buckets shared by all workers through Redis.
+
+    A worker leases a few tokens at a time and spends them locally, and once a bucket is empty it refuses requests
+    until the next token is due without asking Redis, so most requests do not cost a round trip. Leased tokens that
+    are not spent within the lease ttl are dropped, which makes the limit slightly stricter, never looser.
+    """
+
+    _KEY_PREFIX = "funfacts:ratelimit:"
+    _DEFAULT_LEASE_SIZE = 5
+    _DEFAULT_LEASE_TTL = 1.0
+    _MAX_LOCAL_BUCKETS = 10_000
+
+    def __init__(
+        self,
+        redis_url: str,
+        lease_size: int = _DEFAULT_LEASE_SIZE,
+        lease_ttl: float = _DEFAULT_LEASE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._client = redis.from_url(redis_url, decode_responses=True)
+        self._take_tokens_script = self._client.register_script(_TAKE_TOKENS_SCRIPT)
+        self._lease_size = lease_size
+        self._lease_ttl = lease_ttl
+        self._clock = clock
+        self._leases: OrderedDict[str, _Lease] = OrderedDict()
+
+    async def acquire(self, key: str, limit: RateLimit) -> float:
+        """Takes a token of the bucket of key, returns 0 if it got one, or else the seconds until it may retry."""
+        now = self._clock()
+        lease = self._lease(key)
+        if lease.denied_until > now:
+            return lease.denied_until - now
+        if lease.tokens > 0 and lease.expires_at > now:
+            lease.tokens -= 1
+            return 0.0
+
+        # small buckets lease single tokens, so that leftovers of one worker do not starve the others
+        wanted = max(1, min(self._lease_size, limit.capacity // 10))
+        try:
+            granted, retry_after_ms = await self._take_tokens_script(
+                keys=[f"{self._KEY_PREFIX}{key}"],
+                args=[limit.capacity, limit.tokens_per_ms, wanted],
+                client=self._client,
+            )
+        except Exception as e:
+            # a broken limiter must not take the API down with it
+            logger.warning(f"Rate limiting is unavailable, letting the request through: {e}")
+            return 0.0
+
+        now = self._clock()
+        if granted == 0:
+            lease.tokens = 0
+            lease.denied_until = now + retry_after_ms / 1000
+            return retry_after_ms / 1000
+
+        lease.tokens = granted - 1
+        lease.expires_at = now + self._lease_ttl
+        return 0.0
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    def _lease(self, key: str) -> _Lease:
+        lease = self._leases.get(key)
+        if lease is None:
+            lease = self._leases[key] = _Lease()
+            while len(self._leases) > self._MAX_LOCAL_BUCKETS:
+                self._leases.popitem(last=False)
+        else:
+            self._leases.move_to_end(key)
+        return lease
@@ -1,11 +1,57 @@
 import os
+from typing import Optional
 
+from app.adapter.redis.category_fun_fact_redis_adapter import CategoryFunFactRedisAdapter
 from app.adapter.redis.daily_fun_fact_redis_adapter import FunFactRedisAdapter
+from app.adapter.redis.fun_fact_pool_redis_adapter import FunFactPoolRedisAdapter
+from app.domain.port.category_fun_fact_cache_port import CategoryFunFactCachePort
 from app.domain.port.daily_fun_fact_cache_port import DailyFunFactCachePort
+from app.domain.port.fun_fact_pool_port import FunFactPoolPort
 
 
-_redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379")
-_daily_fun_fact_redis_adapter_instance: DailyFunFactCachePort = FunFactRedisAdapter(_redis_url)
+_daily_fun_fact_redis_adapter_instance: Optional[FunFactRedisAdapter] = None
+_fun_fact_pool_redis_adapter_instance: Optional[FunFactPoolRedisAdapter] = None
+_category_fun_fact_redis_adapter_instance: Optional[CategoryFunFactRedisAdapter] = None
+
+def _redis_url() -> str:
+    return os.environ.get("REDIS_URL", "redis://localhost:6379")
 
 def get_daily_fun_fact_redis_adapter() -> DailyFunFactCachePort:
+    global _daily_fun_fact_redis_adapter_instance
+    if _daily_fun_fact_redis_adapter_instance is None:
+        client_tracking = os.environ.get("REDIS_CLIENT_TRACKING", "false").lower() == "true"
+        legacy_layout = os.environ.get("REDIS_LEGACY_LAYOUT", "false").lower() == "true"
+        _daily_fun_fact_redis_adapter_instance = FunFactRedisAdapter(
+            _redis_url(), client_tracking=client_tracking, legacy_layout=legacy_layout
+        )
     return _daily_fun_fact_redis_adapter_instance
+
+def get_fun_fact_pool_redis_adapter() -> FunFactPoolPort:
+    global _fun_fact_pool_redis_adapter_instance
+    if _fun_fact_pool_redis_adapter_instance is None:
+        _fun_fact_pool_redis_adapter_instance = FunFactPoolRedisAdapter(_redis_url())
+    return _fun_fact_pool_redis_adapter_instance
+
+def get_category_fun_fact_redis_adapter(categories: list[str]) -> CategoryFunFactCachePort:
+    global _category_fun_fact_redis_adapter_instance
+    if _category_fun_fact_redis_adapter_instance is None:
+        _category_fun_fact_redis_adapter_instance = CategoryFunFactRedisAdapter(_redis_url(), categories)
+    return _category_fun_fact_redis_adapter_instance
+
+async def warm_up_redis_adapters(connections: int) -> None:
+    get_daily_fun_fact_redis_adapter()
+    await _daily_fun_fact_redis_adapter_instance.warm_up(connections)
+
+async def close_redis_adapters() -> None:
+    global _daily_fun_fact_redis_adapter_instance, _fun_fact_pool_redis_adapter_instance
+    global _category_fun_fact_redis_adapter_instance
+    adapters = [
+        _daily_fun_fact_redis_adapter_instance,
+        _fun_fact_pool_redis_adapter_instance,
+        _category_fun_fact_redis_adapter_instance,
+    ]
+    _daily_fun_fact_redis_adapter_instance = _fun_fact_pool_redis_adapter_instance = None
+    _category_fun_fact_redis_adapter_instance = None
+    for adapter in adapters:
+        if adapter is not None:
+            await adapter.close()
@@ -0,0 +1,127 @@
+import asyncio
+import json
+import uuid
+from datetime import date
+
+import redis.asyncio as redis
+
+from app.adapter.redis.daily_fun_fact_redis_adapter import _RELEASE_LOCK_SCRIPT, _RENEW_LOCK_SCRIPT
+from app.domain.port import CategoryFunFactCachePort, LockLostError
+
+
+# KEYS: lock, then the facts hash and the date index of each category / ARGV: token or '', ordinal, then the facts
+_STORE_CATEGORIES_SCRIPT = """
+if ARGV[1] ~= '' and redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+local fact = 3
+for i = 2, #KEYS, 2 do
+    redis.call('HSET', KEYS[i], ARGV[2], ARGV[fact])
+    redis.call('ZADD', KEYS[i + 1], ARGV[2], ARGV[2])
+    fact = fact + 1
+end
+return 1
+"""
+
+
+class CategoryFunFactRedisAdapter(CategoryFunFactCachePort):
+    """Keeps the facts of each category in its own namespace, laid out like those of FunFactRedisAdapter.
+
+    A day's categories share one lock and are stored by a single script, so readers never see part of a day.
+    """
+
+    _CATEGORY_KEY_PREFIX = "funfacts:category:"
+    _LOCK_KEY_PREFIX = "funfacts:categories:lock:"
+    _STORED_CHANNEL_PREFIX = "funfacts:categories:stored:"
+
+    def __init__(self, redis_url: str, categories: list[str]):
+        self._client = redis.from_url(redis_url, decode_responses=True)
+        self._categories = list(categories)
+        self._lock_tokens: dict[str, str] = {}
+        self._renew_lock_script = self._client.register_script(_RENEW_LOCK_SCRIPT)
+        self._release_lock_script = self._client.register_script(_RELEASE_LOCK_SCRIPT)
+        self._store_categories_script = self._client.register_script(_STORE_CATEGORIES_SCRIPT)
+
+    @classmethod
+    def facts_key(cls, category: str) -> str:
+        return f"{cls._CATEGORY_KEY_PREFIX}{category}:facts"
+
+    @classmethod
+    def index_key(cls, category: str) -> str:
+        return f"{cls._CATEGORY_KEY_PREFIX}{category}:dates"
+
+    async def store_categories(self, date: date, facts: dict[str, str]) -> None:
+        lock_key = self._build_lock_key(date)
+        keys = [lock_key]
+        for category in facts:
+            keys += [self.facts_key(category), self.index_key(category)]
+
+        # only the current lock holder may commit the facts of this date
+        committed = await self._store_categories_script(
+            keys=keys,
+            args=[self._lock_tokens.get(lock_key, ""), date.toordinal(), *facts.values()],
+            client=self._client,
+        )
+        if not committed:
+            raise LockLostError(f"Lock of the categories of {date} was lost before storing their fun facts")
+        await self._client.publish(self._build_stored_channel(date), json.dumps(facts))
+
+    async def get_categories(self, date: date) -> dict[str, str]:
+        ordinal = str(date.toordinal())
+        # one transaction, so that a concurrent store is seen either entirely or not at all
+        async with self._client.pipeline(transaction=True) as pipe:
+            for category in self._categories:
+                pipe.hget(self.facts_key(category), ordinal)
+            facts = await pipe.execute()
+        return {category: fact for category, fact in zip(self._categories, facts) if fact is not None}
+
+    async def acquire_lock(self, date: date, ttl: int = 10) -> bool:
+        lock_key = self._build_lock_key(date)
+        token = uuid.uuid4().hex
+        if not await self._client.set(lock_key, token, px=ttl * 1000, nx=True):
+            return False
+
+        self._lock_tokens[lock_key] = token
+        return True
+
+    async def renew_lock(self, date: date, ttl: int = 10) -> bool:
+        lock_key = self._build_lock_key(date)
+        token = self._lock_tokens.get(lock_key)
+        if token is None:
+            return False
+
+        return bool(await self._renew_lock_script(keys=[lock_key], args=[token, ttl * 1000], client=self._client))
+
+    async def release_lock(self, date: date):
+        lock_key = self._build_lock_key(date)
+        token = self._lock_tokens.pop(lock_key, None)
+        if token is not None:
+            await self._release_lock_script(keys=[lock_key], args=[token], client=self._client)
+
+    async def wait_for_store(self, date: date, timeout: float) -> dict[str, str]:
+        async with self._client.pubsub() as pubsub:
+            await pubsub.subscribe(self._build_stored_channel(date))
+
+            # subscribed before checking, so a store in between cannot be missed
+            facts = await self.get_categories(date)
+            if facts:
+                return facts
+
+            try:
+                async with asyncio.timeout(timeout):
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            return json.loads(message["data"])
+            except TimeoutError:
+                pass
+
+        return await self.get_categories(date)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    def _build_lock_key(self, date: date) -> str:
+        return f"{self._LOCK_KEY_PREFIX}{date.isoformat()}"
+
+    def _build_stored_channel(self, date: date) -> str:
+        return f"{self._STORED_CHANNEL_PREFIX}{date.isoformat()}"
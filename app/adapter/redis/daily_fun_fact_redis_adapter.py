@@ -1,43 +1,261 @@
-from typing import Optional
+import asyncio
+import uuid
+from typing import Any, Awaitable, Callable, Hashable, Optional
 from datetime import date
 
 import redis.asyncio as redis
 
 from app.domain.model import DailyFunFact
-from app.domain.port import DailyFunFactCachePort
+from app.domain.port import DailyFunFactCachePort, LockLostError
+from app.adapter.redis.redis_client_tracking import RedisClientTracking
+
+
+# KEYS: lock / ARGV: token, ttl ms
+_RENEW_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# KEYS: lock / ARGV: token
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# KEYS: lock, facts, index, legacy zset if it is still written / ARGV: token, ordinal, fact
+_LOCKED_STORE_SCRIPT = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[2], ARGV[2], ARGV[3])
+redis.call('ZADD', KEYS[3], ARGV[2], ARGV[2])
+if KEYS[4] then
+    redis.call('ZADD', KEYS[4], ARGV[2], ARGV[3])
+end
+return 1
+"""
 
 
 class FunFactRedisAdapter(DailyFunFactCachePort):
 
-    KEY = "funfacts"
+    FACTS_KEY = "funfacts:facts"
+    INDEX_KEY = "funfacts:dates"
+    LEGACY_KEY = "funfacts"
+    _KEY_PREFIX = "funfacts"
     _LOCK_KEY_PREFIX = "funfacts:lock:"
+    _STORED_CHANNEL_PREFIX = "funfacts:stored:"
 
-    def __init__(self, redis_url: str):
+    def __init__(self, redis_url: str, client_tracking: bool = False, legacy_layout: bool = False):
         self._client = redis.from_url(redis_url, decode_responses=True)
+        # while old releases still run, facts are also written to and read from their sorted set
+        self._legacy_layout = legacy_layout
+        self._tracking = (
+            RedisClientTracking(self._client, self._KEY_PREFIX, {self.FACTS_KEY, self.INDEX_KEY, self.LEGACY_KEY})
+            if client_tracking
+            else None
+        )
+        self._lock_tokens: dict[str, str] = {}
+        self._renew_lock_script = self._client.register_script(_RENEW_LOCK_SCRIPT)
+        self._release_lock_script = self._client.register_script(_RELEASE_LOCK_SCRIPT)
+        self._locked_store_script = self._client.register_script(_LOCKED_STORE_SCRIPT)
 
     async def store(self, fun_fact: DailyFunFact) -> None:
-        score = fun_fact.date.toordinal() 
-        await self._client.zadd(self.KEY, {fun_fact.fact: score})
+        ordinal = fun_fact.date.toordinal()
+        lock_key = self._build_lock_key(fun_fact.date)
+        token = self._lock_tokens.get(lock_key)
+        if token is not None:
+            # only the current lock holder may commit the fact of this date
+            committed = await self._locked_store_script(
+                keys=[lock_key, self.FACTS_KEY, self.INDEX_KEY, *([self.LEGACY_KEY] if self._legacy_layout else [])],
+                args=[token, ordinal, fun_fact.fact],
+                client=self._client,
+            )
+            if not committed:
+                raise LockLostError(f"Lock of {fun_fact.date} was lost before storing its fun fact")
+        else:
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.hset(self.FACTS_KEY, str(ordinal), fun_fact.fact)
+                pipe.zadd(self.INDEX_KEY, {str(ordinal): ordinal})
+                if self._legacy_layout:
+                    pipe.zadd(self.LEGACY_KEY, {fun_fact.fact: ordinal})
+                await pipe.execute()
+        await self._client.publish(self._build_stored_channel(fun_fact.date), fun_fact.fact)
 
     async def get(self, query_date: date) -> Optional[DailyFunFact]:
-        score = query_date.toordinal()
-        results = await self._client.zrangebyscore(self.KEY, score, score)
-        if not results:
+        return await self._read(("get", query_date), lambda: self._get(query_date))
+
+    async def _get(self, query_date: date) -> Optional[DailyFunFact]:
+        ordinal = query_date.toordinal()
+        fact = await self._client.hget(self.FACTS_KEY, str(ordinal))
+        if fact is None:
+            # facts stored by an older release before the layout was migrated
+            results = await self._client.zrangebyscore(self.LEGACY_KEY, ordinal, ordinal)
+            fact = results[0] if results else None
+        if fact is None:
             return None
 
-        return DailyFunFact(date=query_date, fact=results[0])
+        return DailyFunFact(date=query_date, fact=fact)
     
     async def get_last_n(self, n: int) -> list[DailyFunFact]:
-        results = await self._client.zrevrange(self.KEY, 0, n - 1, withscores=True)
-        return [DailyFunFact.from_ordinal(int(score), fact) for fact, score in results]
+        # facts pre-generated for upcoming days stay hidden until their date
+        today = date.today().toordinal()
+        return await self._read(("get_last_n", today, n), lambda: self._get_last_n(today, n))
+
+    async def _get_last_n(self, today: int, n: int) -> list[DailyFunFact]:
+        ordinals = await self._client.zrevrangebyscore(self.INDEX_KEY, today, "-inf", start=0, num=n)
+        facts = await self._get_by_ordinals(ordinals)
+        if not self._legacy_layout:
+            return facts
+
+        legacy = await self._client.zrevrangebyscore(self.LEGACY_KEY, today, "-inf", start=0, num=n, withscores=True)
+        return self._merge_legacy(facts, legacy, reverse=True)[:n]
+
+    async def get_range(self, start: date, end: date, limit: int) -> list[DailyFunFact]:
+        return await self._read(("get_range", start, end, limit), lambda: self._get_range(start, end, limit))
+
+    async def _get_range(self, start: date, end: date, limit: int) -> list[DailyFunFact]:
+        ordinals = await self._client.zrangebyscore(
+            self.INDEX_KEY, start.toordinal(), end.toordinal(), start=0, num=limit
+        )
+        facts = await self._get_by_ordinals(ordinals)
+        if not self._legacy_layout:
+            return facts
+
+        legacy = await self._client.zrangebyscore(
+            self.LEGACY_KEY, start.toordinal(), end.toordinal(), start=0, num=limit, withscores=True
+        )
+        return self._merge_legacy(facts, legacy)[:limit]
+
+    async def get_many(self, dates: list[date]) -> list[DailyFunFact]:
+        return await self._read(("get_many", tuple(dates)), lambda: self._get_many(dates))
+
+    async def _get_many(self, dates: list[date]) -> list[DailyFunFact]:
+        ordinals = [str(query_date.toordinal()) for query_date in dates]
+        facts = await self._get_by_ordinals(ordinals)
+        if not self._legacy_layout or len(facts) == len(set(ordinals)):
+            return facts
+
+        found = {fact.date for fact in facts}
+        missing = [query_date for query_date in dict.fromkeys(dates) if query_date not in found]
+        async with self._client.pipeline(transaction=False) as pipe:
+            for query_date in missing:
+                pipe.zrangebyscore(self.LEGACY_KEY, query_date.toordinal(), query_date.toordinal(), start=0, num=1)
+            results = await pipe.execute()
+
+        by_date = {fact.date: fact for fact in facts}
+        by_date.update(
+            (query_date, DailyFunFact(date=query_date, fact=result[0]))
+            for query_date, result in zip(missing, results)
+            if result
+        )
+        return [by_date[query_date] for query_date in dates if query_date in by_date]
+
+    @staticmethod
+    def _merge_legacy(
+        facts: list[DailyFunFact], legacy: list[tuple[str, float]], reverse: bool = False
+    ) -> list[DailyFunFact]:
+        # facts an old release stored since the migration exist only in the legacy sorted set
+        by_date = {fact.date: fact for fact in facts}
+        for fact, score in legacy:
+            by_date.setdefault(date.fromordinal(int(score)), DailyFunFact.from_ordinal(int(score), fact))
+        return sorted(by_date.values(), key=lambda fact: fact.date, reverse=reverse)
+
+    async def _get_by_ordinals(self, ordinals: list[str]) -> list[DailyFunFact]:
+        if not ordinals:
+            return []
+
+        facts = await self._client.hmget(self.FACTS_KEY, ordinals)
+        return [
+            DailyFunFact.from_ordinal(int(ordinal), fact)
+            for ordinal, fact in zip(ordinals, facts)
+            if fact is not None
+        ]
+
+    async def migrate_legacy_layout(self, batch_size: int = 500, delete_legacy: bool = False) -> int:
+        migrated = 0
+        offset = 0
+        while True:
+            results = await self._client.zrange(self.LEGACY_KEY, offset, offset + batch_size - 1, withscores=True)
+            if not results:
+                break
+
+            async with self._client.pipeline(transaction=False) as pipe:
+                for fact, score in results:
+                    ordinal = int(score)
+                    # never overwrite a fact already written in the new layout
+                    pipe.hsetnx(self.FACTS_KEY, str(ordinal), fact)
+                    pipe.zadd(self.INDEX_KEY, {str(ordinal): ordinal}, nx=True)
+                replies = await pipe.execute()
+
+            migrated += sum(replies[::2])
+            offset += batch_size
+
+        if delete_legacy:
+            await self._client.delete(self.LEGACY_KEY)
+        return migrated
 
     async def acquire_lock(self, date: date, ttl: int = 10) -> bool:
         lock_key = self._build_lock_key(date)
-        return await self._client.set(lock_key, "1", ex=ttl, nx=True) or False
+        token = uuid.uuid4().hex
+        if not await self._client.set(lock_key, token, px=ttl * 1000, nx=True):
+            return False
+
+        self._lock_tokens[lock_key] = token
+        return True
+
+    async def renew_lock(self, date: date, ttl: int = 10) -> bool:
+        lock_key = self._build_lock_key(date)
+        token = self._lock_tokens.get(lock_key)
+        if token is None:
+            return False
+
+        return bool(await self._renew_lock_script(keys=[lock_key], args=[token, ttl * 1000], client=self._client))
 
     async def release_lock(self, date: date):
         lock_key = self._build_lock_key(date)
-        await self._client.delete(lock_key)
+        token = self._lock_tokens.pop(lock_key, None)
+        if token is not None:
+            await self._release_lock_script(keys=[lock_key], args=[token], client=self._client)
+
+    async def wait_for_store(self, date: date, timeout: float) -> Optional[DailyFunFact]:
+        async with self._client.pubsub() as pubsub:
+            await pubsub.subscribe(self._build_stored_channel(date))
+
+            # subscribed before checking, so a store in between cannot be missed
+            fact = await self.get(date)
+            if fact:
+                return fact
+
+            try:
+                async with asyncio.timeout(timeout):
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            return DailyFunFact(date=date, fact=message["data"])
+            except TimeoutError:
+                pass
+
+        return await self.get(date)
+
+    async def warm_up(self, connections: int) -> None:
+        # concurrent commands each check a connection out of the pool, which keeps them open afterwards
+        await asyncio.gather(*(self._client.ping() for _ in range(connections)))
+
+    async def close(self) -> None:
+        if self._tracking is not None:
+            await self._tracking.close()
+        await self._client.aclose()
+
+    async def _read(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        if self._tracking is None:
+            return await loader()
+        return await self._tracking.get_or_load(key, loader)
 
     def _build_lock_key(self, date: date) -> str:
         return f"{self._LOCK_KEY_PREFIX}{date.isoformat()}"
+
+    def _build_stored_channel(self, date: date) -> str:
+        return f"{self._STORED_CHANNEL_PREFIX}{date.isoformat()}"
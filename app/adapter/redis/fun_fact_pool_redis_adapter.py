@@ -0,0 +1,54 @@
+import uuid
+from typing import Optional
+
+import redis.asyncio as redis
+
+from app.domain.port import FunFactPoolPort
+
+
+# KEYS: lock / ARGV: token
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class FunFactPoolRedisAdapter(FunFactPoolPort):
+
+    KEY = "funfacts:pool"
+    _REFILL_LOCK_KEY = "funfacts:pool:lock"
+
+    def __init__(self, redis_url: str):
+        self._client = redis.from_url(redis_url, decode_responses=True)
+        self._refill_lock_token: Optional[str] = None
+        self._release_lock_script = self._client.register_script(_RELEASE_LOCK_SCRIPT)
+
+    async def pop(self) -> Optional[str]:
+        return await self._client.lpop(self.KEY)
+
+    async def push_many(self, facts: list[str]) -> int:
+        if not facts:
+            return 0
+        await self._client.rpush(self.KEY, *facts)
+        return len(facts)
+
+    async def size(self) -> int:
+        return await self._client.llen(self.KEY)
+
+    async def acquire_refill_lock(self, ttl: int = 120) -> bool:
+        token = uuid.uuid4().hex
+        if not await self._client.set(self._REFILL_LOCK_KEY, token, ex=ttl, nx=True):
+            return False
+
+        self._refill_lock_token = token
+        return True
+
+    async def release_refill_lock(self):
+        token, self._refill_lock_token = self._refill_lock_token, None
+        if token is not None:
+            await self._release_lock_script(keys=[self._REFILL_LOCK_KEY], args=[token], client=self._client)
+
+    async def close(self) -> None:
+        await self._client.aclose()
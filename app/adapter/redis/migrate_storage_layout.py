@@ -0,0 +1,26 @@
+import argparse
+import asyncio
+import os
+
+from app.adapter.redis.daily_fun_fact_redis_adapter import FunFactRedisAdapter
+
+
+async def main(redis_url: str, batch_size: int, delete_legacy: bool) -> None:
+    adapter = FunFactRedisAdapter(redis_url)
+    migrated = await adapter.migrate_legacy_layout(batch_size=batch_size, delete_legacy=delete_legacy)
+    print(f"Migrated {migrated} fun facts from '{FunFactRedisAdapter.LEGACY_KEY}'")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Copy fun facts from the legacy sorted set into the hash + date index layout."
+    )
+    parser.add_argument("--redis-url", default=os.environ.get("REDIS_URL", "redis://localhost:6379"))
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--delete-legacy",
+        action="store_true",
+        help="delete the legacy sorted set afterwards, only once no old release is writing to it",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.redis_url, args.batch_size, args.delete_legacy))
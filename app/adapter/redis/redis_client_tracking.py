@@ -0,0 +1,115 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+import redis.asyncio as redis
+
+from app.util import logger
+
+
+class RedisClientTracking:
+    """Process-local read cache kept coherent by Redis client tracking (BCAST mode, redirected to pub/sub)."""
+
+    INVALIDATE_CHANNEL = "__redis__:invalidate"
+    _RETRY_DELAY = 1.0
+    _HEALTH_CHECK_INTERVAL = 5.0
+
+    def __init__(self, client: redis.Redis, prefix: str, keys: set[str], max_entries: int = 1024):
+        self._client = client
+        self._prefix = prefix
+        self._keys = keys
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._generation = 0
+        self._ready = False
+        self._reconnected = False
+        self._listener: Optional[asyncio.Task] = None
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        generation = self._generation
+        value = await loader()
+        # misses are not cached, a store from another node must be visible right away
+        if value and self._ready and generation == self._generation:
+            self._entries[key] = value
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, keys: Optional[list[str]]) -> None:
+        # None means the server flushed the database
+        if keys is None or any(key in self._keys for key in keys):
+            self._flush()
+
+    async def close(self) -> None:
+        if self._listener is None:
+            return
+
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+        self._listener = None
+
+    def _flush(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                await self._track()
+            except Exception as e:
+                logger.warning(f"Redis client tracking interrupted, serving reads from Redis: {e}")
+            await asyncio.sleep(self._RETRY_DELAY)
+
+    async def _track(self) -> None:
+        pubsub = self._client.pubsub()
+        tracking_connection = self._client.connection_pool.make_connection()
+        try:
+            await pubsub.connect()
+            await pubsub.connection.send_command("CLIENT", "ID")
+            client_id = await pubsub.connection.read_response()
+            await pubsub.subscribe(self.INVALIDATE_CHANNEL)
+
+            await tracking_connection.connect()
+            await tracking_connection.send_command(
+                "CLIENT", "TRACKING", "ON", "REDIRECT", client_id, "BCAST", "PREFIX", self._prefix
+            )
+            await tracking_connection.read_response()
+
+            # a reconnect silently drops the tracking state, start over when it happens
+            self._reconnected = False
+            pubsub.connection.register_connect_callback(self._on_reconnect)
+            tracking_connection.register_connect_callback(self._on_reconnect)
+
+            self._flush()
+            self._ready = True
+            logger.info("Redis client tracking enabled")
+
+            loop = asyncio.get_running_loop()
+            next_health_check = loop.time() + self._HEALTH_CHECK_INTERVAL
+            while not self._reconnected:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message and message["type"] == "message":
+                    self.invalidate(message["data"])
+
+                if loop.time() >= next_health_check:
+                    await tracking_connection.send_command("PING")
+                    await tracking_connection.read_response()
+                    next_health_check = loop.time() + self._HEALTH_CHECK_INTERVAL
+        finally:
+            self._ready = False
+            self._flush()
+            await pubsub.aclose()
+            await tracking_connection.disconnect()
+
+    async def _on_reconnect(self, connection) -> None:
+        self._reconnected = True
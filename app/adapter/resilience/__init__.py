@@ -0,0 +1,2 @@
+from app.adapter.resilience.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.adapter.resilience.resilient_llm_adapter import ResilientLlmAdapter
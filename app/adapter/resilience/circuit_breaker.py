@@ -0,0 +1,56 @@
+import time
+from typing import Callable, Optional
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if self._clock() - self._opened_at >= self._reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def before_call(self) -> None:
+        state = self.state
+        if state == self.OPEN or (state == self.HALF_OPEN and self._trial_in_flight):
+            raise CircuitOpenError("Circuit is open, failing fast")
+        if state == self.HALF_OPEN:
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+            self._opened_at = self._clock()
+        self._trial_in_flight = False
+
+    def record_cancelled(self) -> None:
+        # a call that never finished says nothing about the LLM, the next one may try again
+        self._trial_in_flight = False
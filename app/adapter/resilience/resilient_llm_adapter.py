@@ -0,0 +1,128 @@
+import asyncio
+import random
+import time
+from collections import deque
+from typing import AsyncIterator, Callable, Optional
+
+from app.adapter.resilience.circuit_breaker import CircuitBreaker
+from app.domain.port import LlmPort
+from app.util import logger
+
+
+class ResilientLlmAdapter(LlmPort):
+
+    _DEFAULT_TIMEOUT = 15.0
+    _DEFAULT_MAX_ATTEMPTS = 3
+    _DEFAULT_BACKOFF = 0.5
+    _DEFAULT_MAX_BACKOFF = 5.0
+    _HEDGE_MIN_SAMPLES = 20
+    _LATENCY_WINDOW = 200
+
+    def __init__(
+        self,
+        llm_port: LlmPort,
+        timeout: float = _DEFAULT_TIMEOUT,
+        max_attempts: int = _DEFAULT_MAX_ATTEMPTS,
+        backoff: float = _DEFAULT_BACKOFF,
+        max_backoff: float = _DEFAULT_MAX_BACKOFF,
+        hedge_percentile: Optional[float] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        jitter: Callable[[], float] = random.random,
+    ):
+        self._llm_port = llm_port
+        self._timeout = timeout
+        self._max_attempts = max_attempts
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._hedge_percentile = hedge_percentile
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._jitter = jitter
+        self._latencies: deque[float] = deque(maxlen=self._LATENCY_WINDOW)
+
+    async def chat(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+        attempt = 1
+        while True:
+            self._circuit_breaker.before_call()
+            try:
+                result = await self._hedged_chat(prompt, max_tokens)
+            except Exception as e:
+                self._circuit_breaker.record_failure()
+                if attempt >= self._max_attempts:
+                    raise
+                logger.warning(f"LLM call failed (attempt {attempt}/{self._max_attempts}): {e!r}")
+                await asyncio.sleep(self._backoff_delay(attempt))
+                attempt += 1
+            except BaseException:
+                self._circuit_breaker.record_cancelled()
+                raise
+            else:
+                self._circuit_breaker.record_success()
+                return result
+
+    async def stream_chat(self, prompt: str) -> AsyncIterator[str]:
+        # tokens may already be on their way to clients, so a stream is never retried or hedged
+        self._circuit_breaker.before_call()
+        chunks = self._llm_port.stream_chat(prompt)
+        try:
+            while True:
+                async with asyncio.timeout(self._timeout):
+                    try:
+                        chunk = await anext(chunks)
+                    except StopAsyncIteration:
+                        break
+                yield chunk
+        except Exception:
+            self._circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            # cancelled, or the consumer went away and closed the generator
+            self._circuit_breaker.record_cancelled()
+            raise
+        finally:
+            # otherwise the upstream response, and its pooled connection, stays open until garbage collection
+            await chunks.aclose()
+        self._circuit_breaker.record_success()
+
+    async def _hedged_chat(self, prompt: str, max_tokens: Optional[int]) -> str:
+        hedge_delay = self._hedge_delay()
+        if hedge_delay is None:
+            return await self._timed_chat(prompt, max_tokens)
+
+        pending = {asyncio.create_task(self._timed_chat(prompt, max_tokens))}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge_delay)
+            if done:
+                return done.pop().result()
+
+            logger.info(f"LLM call slower than {hedge_delay:.2f}s, sending a hedged request")
+            pending.add(asyncio.create_task(self._timed_chat(prompt, max_tokens)))
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error  # type: ignore[misc]
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _timed_chat(self, prompt: str, max_tokens: Optional[int]) -> str:
+        started = time.monotonic()
+        async with asyncio.timeout(self._timeout):
+            result = await self._llm_port.chat(prompt, max_tokens=max_tokens)
+        self._latencies.append(time.monotonic() - started)
+        return result
+
+    def _hedge_delay(self) -> Optional[float]:
+        if self._hedge_percentile is None or len(self._latencies) < self._HEDGE_MIN_SAMPLES:
+            return None
+
+        latencies = sorted(self._latencies)
+        index = min(int(len(latencies) * self._hedge_percentile), len(latencies) - 1)
+        return latencies[index]
+
+    def _backoff_delay(self, attempt: int) -> float:
+        # full jitter
+        return self._jitter() * min(self._max_backoff, self._backoff * 2 ** (attempt - 1))
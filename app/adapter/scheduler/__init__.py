@@ -0,0 +1,21 @@
+import os
+from datetime import timedelta
+
+from app.adapter.scheduler.daily_fun_fact_scheduler import DailyFunFactScheduler
+from app.adapter.scheduler.fun_fact_pool_refiller import FunFactPoolRefiller
+from app.domain.service import get_category_fun_fact_service, get_daily_fun_fact_service
+
+
+_lead_time = timedelta(seconds=int(os.getenv("FUN_FACT_PREGENERATE_LEAD_SECONDS", "600")))
+_category_pregenerate_enabled = os.getenv("FUN_FACT_CATEGORY_PREGENERATE_ENABLED", "true").lower() == "true"
+_pool_refill_interval = float(os.getenv("FUN_FACT_POOL_REFILL_INTERVAL_SECONDS", "300"))
+
+def create_daily_fun_fact_scheduler() -> DailyFunFactScheduler:
+    return DailyFunFactScheduler(
+        get_daily_fun_fact_service(),
+        lead_time=_lead_time,
+        category_service=get_category_fun_fact_service() if _category_pregenerate_enabled else None,
+    )
+
+def create_fun_fact_pool_refiller() -> FunFactPoolRefiller:
+    return FunFactPoolRefiller(get_daily_fun_fact_service(), interval=_pool_refill_interval)
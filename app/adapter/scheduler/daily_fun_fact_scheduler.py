@@ -0,0 +1,87 @@
+import asyncio
+from datetime import date, datetime, time, timedelta
+from typing import Awaitable, Callable, Optional
+
+from app.domain.service import CategoryFunFactService, DailyFunFactService
+from app.util import logger
+
+
+class DailyFunFactScheduler:
+
+    _DEFAULT_LEAD_TIME = timedelta(minutes=10)
+    _DEFAULT_MAX_ATTEMPTS = 5
+    _DEFAULT_RETRY_DELAY = 5.0
+
+    def __init__(
+        self,
+        service: DailyFunFactService,
+        lead_time: timedelta = _DEFAULT_LEAD_TIME,
+        max_attempts: int = _DEFAULT_MAX_ATTEMPTS,
+        retry_delay: float = _DEFAULT_RETRY_DELAY,
+        clock: Callable[[], datetime] = datetime.now,
+        category_service: Optional[CategoryFunFactService] = None,
+    ):
+        self._service = service
+        self._category_service = category_service
+        self._lead_time = lead_time
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._clock = clock
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        # covers a start after midnight, when nobody pre-generated today's fact
+        target_date = self._clock().date()
+        await self.generate(target_date)
+
+        while True:
+            next_run, target_date = self._next_run(target_date)
+            await asyncio.sleep(max((next_run - self._clock()).total_seconds(), 0))
+            await self.generate(target_date)
+
+    async def generate(self, target_date: date) -> bool:
+        ready = await self._pregenerate(
+            f"the fun fact of {target_date}", lambda: self._service.pregenerate_fun_fact(target_date)
+        )
+        if self._category_service is not None:
+            ready = await self._pregenerate(
+                f"the category fun facts of {target_date}",
+                lambda: self._category_service.pregenerate_fun_facts(target_date),
+            ) and ready
+        return ready
+
+    async def _pregenerate(self, description: str, pregenerate: Callable[[], Awaitable[object]]) -> bool:
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                if await pregenerate():
+                    logger.info(f"{description.capitalize()} is ready")
+                    return True
+                logger.warning(f"Nothing for {description} yet (attempt {attempt}/{self._max_attempts})")
+            except Exception as e:
+                logger.warning(f"Pre-generating {description} failed (attempt {attempt}/{self._max_attempts}): {e}")
+
+            if attempt < self._max_attempts:
+                await asyncio.sleep(self._retry_delay * 2 ** (attempt - 1))
+
+        logger.critical(f"ALERT: giving up pre-generating {description}, requests will fall back to live generation")
+        return False
+
+    def _next_run(self, generated: date) -> tuple[datetime, date]:
+        # the day after the last one generated, lead_time before its midnight; a start inside that window runs at once
+        target_date = max(generated, self._clock().date()) + timedelta(days=1)
+        return datetime.combine(target_date, time.min) - self._lead_time, target_date
@@ -0,0 +1,38 @@
+import asyncio
+from typing import Optional
+
+from app.domain.service import DailyFunFactService
+from app.util import logger
+
+
+class FunFactPoolRefiller:
+
+    _DEFAULT_INTERVAL = 300.0
+
+    def __init__(self, service: DailyFunFactService, interval: float = _DEFAULT_INTERVAL):
+        self._service = service
+        self._interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._service.refill_fun_fact_pool()
+            except Exception as e:
+                logger.error(f"Refilling the fun fact pool failed: {e}")
+            await asyncio.sleep(self._interval)
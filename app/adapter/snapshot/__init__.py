@@ -0,0 +1,29 @@
+import os
+from typing import Optional
+
+from app.adapter.snapshot.snapshot_exporter import SnapshotExporter
+from app.adapter.snapshot.snapshot_exporting_cache_port import SnapshotExportingCachePort
+from app.domain.port import DailyFunFactCachePort
+
+
+_snapshot_exporter_instance: Optional[SnapshotExporter] = None
+
+def get_snapshot_exporter(cache_port: DailyFunFactCachePort) -> SnapshotExporter:
+    global _snapshot_exporter_instance
+    if _snapshot_exporter_instance is None:
+        _snapshot_exporter_instance = SnapshotExporter(
+            cache_port,
+            os.environ["SNAPSHOT_DIR"],
+            recent_count=int(os.getenv("SNAPSHOT_RECENT_COUNT", "10")),
+        )
+    return _snapshot_exporter_instance
+
+def find_snapshot_exporter() -> Optional[SnapshotExporter]:
+    # the exporter is created with the cache port of the service, it exists only when SNAPSHOT_DIR is set
+    return _snapshot_exporter_instance
+
+async def close_snapshot_exporter() -> None:
+    global _snapshot_exporter_instance
+    exporter, _snapshot_exporter_instance = _snapshot_exporter_instance, None
+    if exporter is not None:
+        await exporter.close()
@@ -0,0 +1,33 @@
+import argparse
+import asyncio
+import os
+from datetime import date
+
+from app.adapter.snapshot.snapshot_exporter import SnapshotExporter
+from app.domain.service import close_daily_fun_fact_service, get_daily_fun_fact_service
+
+
+async def main(directory: str, since: date, recent_count: int) -> None:
+    exporter = SnapshotExporter(get_daily_fun_fact_service().cache_port, directory, recent_count=recent_count)
+    try:
+        written = await exporter.export_all(since)
+    finally:
+        await exporter.close()
+        await close_daily_fun_fact_service()
+    print(f"Wrote {len(written)} snapshot files to '{directory}'")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Render today's fun fact, the recent list and the monthly archives into static files."
+    )
+    parser.add_argument("--directory", default=os.environ.get("SNAPSHOT_DIR", "snapshot"))
+    parser.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        default=date.min,
+        help="only render the archives from the month of this date on, older ones are left as they are",
+    )
+    parser.add_argument("--recent-count", type=int, default=int(os.environ.get("SNAPSHOT_RECENT_COUNT", "10")))
+    args = parser.parse_args()
+    asyncio.run(main(args.directory, args.since, args.recent_count))
@@ -0,0 +1,213 @@
+import asyncio
+import fcntl
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Optional
+
+from app.domain.model import DailyFunFact
+from app.domain.port import DailyFunFactCachePort
+from app.util import logger
+
+
+def _encode_facts(content) -> bytes:
+    # the same bytes the API responds with
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+def _to_json(fact: DailyFunFact) -> dict:
+    return {"date": fact.date.isoformat(), "fact": fact.fact}
+
+def _write_atomically(path: str, content: bytes) -> None:
+    # readers see either the old or the new file, never a partly written one
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(content)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+class SnapshotExporter:
+    """Renders today's fact, the recent list and monthly archives into static files for object storage or a CDN.
+
+    Every file gets a precompressed .gz sibling. The manifest holds the SHA-256 of each file, so that an export only
+    rewrites the files whose content changed. Started as a background task, it also exports today's files at startup
+    and at every midnight, so that a fact pre-generated by another process or before a restart still shows up.
+    """
+
+    MANIFEST = "manifest.json"
+    _LOCK_FILE = ".export.lock"
+    TODAY = "today.json"
+    RECENT = "recent.json"
+    _DEFAULT_RECENT_COUNT = 10  # the size of /recent
+    _ARCHIVE_PAGE_SIZE = 1000
+
+    def __init__(
+        self,
+        cache_port: DailyFunFactCachePort,
+        directory: str,
+        recent_count: int = _DEFAULT_RECENT_COUNT,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        self._cache_port = cache_port
+        self._directory = directory
+        self._recent_count = recent_count
+        self._clock = clock
+        self._write_lock = asyncio.Lock()
+        self._deferred: dict[date, asyncio.Task] = {}
+        self._rollover_task: Optional[asyncio.Task] = None
+
+    async def export_all(self, since: date = date.min) -> list[str]:
+        today = self._clock().date()
+        files = await self._render_current(today)
+
+        months: dict[str, list[DailyFunFact]] = {}
+        start = since.replace(day=1)
+        while True:
+            facts = await self._cache_port.get_range(start, today, self._ARCHIVE_PAGE_SIZE)
+            for fact in facts:
+                months.setdefault(self.archive_path(fact.date), []).append(fact)
+            if len(facts) < self._ARCHIVE_PAGE_SIZE:
+                break
+            start = facts[-1].date + timedelta(days=1)
+
+        for path, facts in months.items():
+            files[path] = _encode_facts([_to_json(fact) for fact in facts])
+        return await self._write(files)
+
+    async def export_fact(self, fact: DailyFunFact) -> list[str]:
+        today = self._clock().date()
+        if fact.date > today:
+            # a pre-generated fact stays hidden until its date, like it does in the API
+            self._defer(fact.date)
+            return []
+
+        files = await self._render_current(today)
+        first = fact.date.replace(day=1)
+        last = min((first + timedelta(days=31)).replace(day=1) - timedelta(days=1), today)
+        facts = await self._cache_port.get_range(first, last, 31)
+        files[self.archive_path(fact.date)] = _encode_facts([_to_json(fact) for fact in facts])
+        return await self._write(files)
+
+    async def export_today(self) -> list[str]:
+        today = self._clock().date()
+        fact = await self._cache_port.get(today)
+        if fact:
+            return await self.export_fact(fact)
+        return await self._write(await self._render_current(today))
+
+    def start(self) -> None:
+        if self._rollover_task is None:
+            self._rollover_task = asyncio.create_task(self._export_at_rollover())
+
+    async def stop(self) -> None:
+        if self._rollover_task is None:
+            return
+
+        self._rollover_task.cancel()
+        try:
+            await self._rollover_task
+        except asyncio.CancelledError:
+            pass
+        self._rollover_task = None
+
+    async def close(self) -> None:
+        await self.stop()
+        tasks = list(self._deferred.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def archive_path(fact_date: date) -> str:
+        return f"archive/{fact_date.year:04d}/{fact_date.month:02d}.json"
+
+    async def _render_current(self, today: date) -> dict[str, bytes]:
+        recent = await self._cache_port.get_last_n(self._recent_count)
+        files = {self.RECENT: _encode_facts([_to_json(fact) for fact in recent])}
+        if recent and recent[0].date == today:
+            files[self.TODAY] = _encode_facts(_to_json(recent[0]))
+        return files
+
+    def _defer(self, fact_date: date) -> None:
+        if fact_date in self._deferred:
+            return
+
+        task = asyncio.create_task(self._export_when_due(fact_date))
+        self._deferred[fact_date] = task
+        task.add_done_callback(lambda _: self._deferred.pop(fact_date, None))
+
+    async def _export_when_due(self, fact_date: date) -> None:
+        while self._clock().date() < fact_date:
+            due = datetime.combine(fact_date, time.min)
+            await asyncio.sleep(max((due - self._clock()).total_seconds(), 0))
+
+        try:
+            fact = await self._cache_port.get(fact_date)
+            if fact:
+                await self.export_fact(fact)
+        except Exception as e:
+            logger.warning(f"Could not export the snapshot of {fact_date}: {e}")
+
+    async def _export_at_rollover(self) -> None:
+        # unchanged files are skipped, so every process can run this against a shared directory
+        while True:
+            try:
+                await self.export_today()
+            except Exception as e:
+                logger.warning(f"Could not export today's snapshot: {e}")
+
+            midnight = datetime.combine(self._clock().date() + timedelta(days=1), time.min)
+            await asyncio.sleep(max((midnight - self._clock()).total_seconds(), 0))
+
+    async def _write(self, files: dict[str, bytes]) -> list[str]:
+        async with self._write_lock:
+            return await asyncio.to_thread(self._write_changed, files)
+
+    def _write_changed(self, files: dict[str, bytes]) -> list[str]:
+        # the asyncio lock only covers this process, every worker may export to the same directory
+        os.makedirs(self._directory, exist_ok=True)
+        with open(os.path.join(self._directory, self._LOCK_FILE), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            return self._write_changed_locked(files)
+
+    def _write_changed_locked(self, files: dict[str, bytes]) -> list[str]:
+        manifest = self._read_manifest()
+        written = []
+        for path, content in sorted(files.items()):
+            digest = hashlib.sha256(content).hexdigest()
+            full_path = os.path.join(self._directory, path)
+            if manifest.get(path, {}).get("sha256") == digest and os.path.exists(full_path):
+                continue
+
+            # mtime=0 keeps the compressed bytes stable for the same content
+            _write_atomically(full_path + ".gz", gzip.compress(content, compresslevel=9, mtime=0))
+            _write_atomically(full_path, content)
+            manifest[path] = {"sha256": digest, "size": len(content)}
+            written.append(path)
+
+        if written:
+            # written last, so that it never lists content that is not on disk yet
+            _write_atomically(
+                os.path.join(self._directory, self.MANIFEST),
+                json.dumps({"files": manifest}, indent=2, sort_keys=True).encode("utf-8"),
+            )
+            logger.info(f"Exported snapshot files: {', '.join(written)}")
+        return written
+
+    def _read_manifest(self) -> dict[str, dict]:
+        try:
+            with open(os.path.join(self._directory, self.MANIFEST), "rb") as manifest_file:
+                return json.load(manifest_file)["files"]
+        except FileNotFoundError:
+            return {}
@@ -0,0 +1,47 @@
+from datetime import date
+from typing import Optional
+
+from app.adapter.snapshot.snapshot_exporter import SnapshotExporter
+from app.domain.model import DailyFunFact
+from app.domain.port import DailyFunFactCachePort
+from app.util import logger
+
+
+class SnapshotExportingCachePort(DailyFunFactCachePort):
+    """Exports the snapshot files touched by every fact stored through it."""
+
+    def __init__(self, cache_port: DailyFunFactCachePort, exporter: SnapshotExporter):
+        self._cache_port = cache_port
+        self._exporter = exporter
+
+    async def store(self, fun_fact: DailyFunFact) -> None:
+        await self._cache_port.store(fun_fact)
+        try:
+            await self._exporter.export_fact(fun_fact)
+        except Exception as e:
+            # the fact is stored, the next export or a run of the CLI catches up
+            logger.warning(f"Could not export the snapshot of {fun_fact.date}: {e}")
+
+    async def get(self, date: date) -> Optional[DailyFunFact]:
+        return await self._cache_port.get(date)
+
+    async def get_last_n(self, limit: int) -> list[DailyFunFact]:
+        return await self._cache_port.get_last_n(limit)
+
+    async def get_range(self, start: date, end: date, limit: int) -> list[DailyFunFact]:
+        return await self._cache_port.get_range(start, end, limit)
+
+    async def get_many(self, dates: list[date]) -> list[DailyFunFact]:
+        return await self._cache_port.get_many(dates)
+
+    async def acquire_lock(self, date: date, ttl: int = 10) -> bool:
+        return await self._cache_port.acquire_lock(date, ttl)
+
+    async def renew_lock(self, date: date, ttl: int = 10) -> bool:
+        return await self._cache_port.renew_lock(date, ttl)
+
+    async def release_lock(self, date: date):
+        await self._cache_port.release_lock(date)
+
+    async def wait_for_store(self, date: date, timeout: float) -> Optional[DailyFunFact]:
+        return await self._cache_port.wait_for_store(date, timeout)
@@ -0,0 +1,27 @@
+import os
+from typing import Optional
+
+from app.adapter.sqlite.daily_fun_fact_sqlite_adapter import FunFactSqliteAdapter
+from app.domain.port.daily_fun_fact_cache_port import DailyFunFactCachePort
+
+
+_daily_fun_fact_sqlite_adapter_instance: Optional[FunFactSqliteAdapter] = None
+
+def get_daily_fun_fact_sqlite_adapter() -> DailyFunFactCachePort:
+    global _daily_fun_fact_sqlite_adapter_instance
+    if _daily_fun_fact_sqlite_adapter_instance is None:
+        _daily_fun_fact_sqlite_adapter_instance = FunFactSqliteAdapter(
+            os.environ.get("SQLITE_PATH", "funfacts.sqlite3"),
+            max_workers=int(os.environ.get("SQLITE_MAX_WORKERS", "4")),
+        )
+    return _daily_fun_fact_sqlite_adapter_instance
+
+async def warm_up_sqlite_adapter(connections: int) -> None:
+    get_daily_fun_fact_sqlite_adapter()
+    await _daily_fun_fact_sqlite_adapter_instance.warm_up(connections)
+
+async def close_sqlite_adapter() -> None:
+    global _daily_fun_fact_sqlite_adapter_instance
+    adapter, _daily_fun_fact_sqlite_adapter_instance = _daily_fun_fact_sqlite_adapter_instance, None
+    if adapter is not None:
+        await adapter.close()
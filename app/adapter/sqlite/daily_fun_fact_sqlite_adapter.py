@@ -0,0 +1,218 @@
+import asyncio
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date
+from typing import Any, Callable, Iterator, Optional
+
+from app.domain.model import DailyFunFact
+from app.domain.port import DailyFunFactCachePort, LockLostError
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS facts (ordinal INTEGER PRIMARY KEY, fact TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS locks (name TEXT PRIMARY KEY, token TEXT NOT NULL, expires_at REAL NOT NULL);
+"""
+
+_UPSERT_FACT = (
+    "INSERT INTO facts (ordinal, fact) VALUES (?, ?) ON CONFLICT (ordinal) DO UPDATE SET fact = excluded.fact"
+)
+_SELECT_FACT = "SELECT fact FROM facts WHERE ordinal = ?"
+_SELECT_LAST_N = "SELECT ordinal, fact FROM facts WHERE ordinal <= ? ORDER BY ordinal DESC LIMIT ?"
+_SELECT_RANGE = "SELECT ordinal, fact FROM facts WHERE ordinal BETWEEN ? AND ? ORDER BY ordinal LIMIT ?"
+_DELETE_EXPIRED_LOCK = "DELETE FROM locks WHERE name = ? AND expires_at <= ?"
+_INSERT_LOCK = "INSERT OR IGNORE INTO locks (name, token, expires_at) VALUES (?, ?, ?)"
+_RENEW_LOCK = "UPDATE locks SET expires_at = ? WHERE name = ? AND token = ? AND expires_at > ?"
+_RELEASE_LOCK = "DELETE FROM locks WHERE name = ? AND token = ?"
+_SELECT_LIVE_LOCK = "SELECT 1 FROM locks WHERE name = ? AND token = ? AND expires_at > ?"
+
+
+@contextmanager
+def _immediate_transaction(connection: sqlite3.Connection) -> Iterator[None]:
+    # takes the write lock up front, so that a read-then-write cannot interleave with another writer
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
+class FunFactSqliteAdapter(DailyFunFactCachePort):
+    """Embedded storage for deployments without Redis; several processes may share the database file."""
+
+    _DEFAULT_MAX_WORKERS = 4
+    _DEFAULT_POLL_INTERVAL = 0.05
+    _BUSY_TIMEOUT_MS = 5000
+    _STATEMENT_CACHE_SIZE = 64
+    _MAX_VARIABLES = 500  # per IN (...) query, well below SQLite's limit
+    _LOCK_PREFIX = "funfacts:lock:"
+
+    def __init__(
+        self,
+        path: str,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+        poll_interval: float = _DEFAULT_POLL_INTERVAL,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._path = path
+        self._poll_interval = poll_interval
+        # lock expiry is compared across processes, so it uses the wall clock
+        self._clock = clock
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="funfacts-sqlite")
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._lock_tokens: dict[str, str] = {}
+
+    async def store(self, fun_fact: DailyFunFact) -> None:
+        lock_name = self._build_lock_name(fun_fact.date)
+        token = self._lock_tokens.get(lock_name)
+        committed = await self._run(self._store, fun_fact.date.toordinal(), fun_fact.fact, lock_name, token)
+        if not committed:
+            raise LockLostError(f"Lock of {fun_fact.date} was lost before storing its fun fact")
+
+    def _store(
+        self, connection: sqlite3.Connection, ordinal: int, fact: str, lock_name: str, token: Optional[str]
+    ) -> bool:
+        with _immediate_transaction(connection):
+            # only the current lock holder may commit the fact of this date
+            if token is not None:
+                if not connection.execute(_SELECT_LIVE_LOCK, (lock_name, token, self._clock())).fetchone():
+                    return False
+            connection.execute(_UPSERT_FACT, (ordinal, fact))
+        return True
+
+    async def get(self, query_date: date) -> Optional[DailyFunFact]:
+        row = await self._run(lambda connection: connection.execute(_SELECT_FACT, (query_date.toordinal(),)).fetchone())
+        if row is None:
+            return None
+        return DailyFunFact(date=query_date, fact=row[0])
+
+    async def get_last_n(self, n: int) -> list[DailyFunFact]:
+        # facts pre-generated for upcoming days stay hidden until their date
+        today = date.today().toordinal()
+        rows = await self._run(lambda connection: connection.execute(_SELECT_LAST_N, (today, n)).fetchall())
+        return [DailyFunFact.from_ordinal(ordinal, fact) for ordinal, fact in rows]
+
+    async def get_range(self, start: date, end: date, limit: int) -> list[DailyFunFact]:
+        rows = await self._run(
+            lambda connection: connection.execute(
+                _SELECT_RANGE, (start.toordinal(), end.toordinal(), limit)
+            ).fetchall()
+        )
+        return [DailyFunFact.from_ordinal(ordinal, fact) for ordinal, fact in rows]
+
+    async def get_many(self, dates: list[date]) -> list[DailyFunFact]:
+        if not dates:
+            return []
+
+        ordinals = [query_date.toordinal() for query_date in dates]
+        facts = dict(await self._run(self._get_many, ordinals))
+        return [DailyFunFact.from_ordinal(ordinal, facts[ordinal]) for ordinal in ordinals if ordinal in facts]
+
+    def _get_many(self, connection: sqlite3.Connection, ordinals: list[int]) -> list[tuple[int, str]]:
+        rows = []
+        for offset in range(0, len(ordinals), self._MAX_VARIABLES):
+            chunk = ordinals[offset:offset + self._MAX_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            rows.extend(connection.execute(f"SELECT ordinal, fact FROM facts WHERE ordinal IN ({placeholders})", chunk))
+        return rows
+
+    async def acquire_lock(self, date: date, ttl: int = 10) -> bool:
+        lock_name = self._build_lock_name(date)
+        token = uuid.uuid4().hex
+        if not await self._run(self._acquire_lock, lock_name, token, ttl):
+            return False
+
+        self._lock_tokens[lock_name] = token
+        return True
+
+    def _acquire_lock(self, connection: sqlite3.Connection, lock_name: str, token: str, ttl: int) -> bool:
+        now = self._clock()
+        with _immediate_transaction(connection):
+            connection.execute(_DELETE_EXPIRED_LOCK, (lock_name, now))
+            return connection.execute(_INSERT_LOCK, (lock_name, token, now + ttl)).rowcount == 1
+
+    async def renew_lock(self, date: date, ttl: int = 10) -> bool:
+        lock_name = self._build_lock_name(date)
+        token = self._lock_tokens.get(lock_name)
+        if token is None:
+            return False
+
+        def renew(connection: sqlite3.Connection) -> bool:
+            now = self._clock()
+            return connection.execute(_RENEW_LOCK, (now + ttl, lock_name, token, now)).rowcount == 1
+
+        return await self._run(renew)
+
+    async def release_lock(self, date: date):
+        lock_name = self._build_lock_name(date)
+        token = self._lock_tokens.pop(lock_name, None)
+        if token is not None:
+            await self._run(lambda connection: connection.execute(_RELEASE_LOCK, (lock_name, token)))
+
+    async def wait_for_store(self, date: date, timeout: float) -> Optional[DailyFunFact]:
+        # SQLite cannot notify other processes, so the waiter polls
+        deadline = asyncio.get_running_loop().time() + timeout
+        while True:
+            fact = await self.get(date)
+            remaining = deadline - asyncio.get_running_loop().time()
+            if fact or remaining <= 0:
+                return fact
+            await asyncio.sleep(min(self._poll_interval, remaining))
+
+    async def warm_up(self, connections: int) -> None:
+        if connections <= 0:
+            return  # CACHE_WARM_UP_CONNECTIONS=0 turns connection warm-up off, a barrier cannot have zero parties
+
+        # holding every call until all have started spreads them over distinct pool threads, each of which opens
+        # its connection and prepares the hot statements
+        barrier = threading.Barrier(min(connections, self._max_workers))
+
+        def prepare(connection: sqlite3.Connection) -> None:
+            connection.execute(_SELECT_FACT, (0,)).fetchone()
+            connection.execute(_SELECT_LAST_N, (0, 0)).fetchall()
+            barrier.wait(timeout=self._BUSY_TIMEOUT_MS / 1000)
+
+        await asyncio.gather(*(self._run(prepare) for _ in range(barrier.parties)))
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._executor.shutdown)
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+
+    async def _run(self, operation: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, lambda: operation(self._connection(), *args)
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # autocommit, explicit transactions where needed; the statement cache keeps queries prepared
+            connection = sqlite3.connect(
+                self._path,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=self._STATEMENT_CACHE_SIZE,
+            )
+            connection.execute(f"PRAGMA busy_timeout = {self._BUSY_TIMEOUT_MS}")
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.executescript(_SCHEMA)
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def _build_lock_name(self, date: date) -> str:
+        return f"{self._LOCK_PREFIX}{date.isoformat()}"
+
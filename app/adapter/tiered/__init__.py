@@ -0,0 +1 @@
+from app.adapter.tiered.tiered_cache_port import TierStats, TieredCachePort
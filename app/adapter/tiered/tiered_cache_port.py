@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Awaitable, Optional
+
+from app.domain.model import DailyFunFact
+from app.domain.port import DailyFunFactCachePort
+from app.util import logger
+
+
+@dataclass(frozen=True)
+class TierStats:
+    name: str
+    hits: int
+    misses: int
+
+
+class TieredCachePort(DailyFunFactCachePort):
+    """Stacks cache ports from fastest to slowest; the last one is authoritative.
+
+    Reads go down the tiers until one has the fact and backfill the tiers above it. Writes go to the authoritative
+    tier first and then to the others. Locks, waits and queries over dates that upper tiers may only partly hold
+    go to the authoritative tier alone. Upper tiers are best effort: their failures are logged and read as misses.
+    """
+
+    def __init__(self, tiers: list[tuple[str, DailyFunFactCachePort]]):
+        if not tiers:
+            raise ValueError("TieredCachePort needs at least one tier")
+
+        self._names = [name for name, _ in tiers]
+        self._tiers = [tier for _, tier in tiers]
+        self._hits = [0] * len(tiers)
+        self._misses = [0] * len(tiers)
+
+    @property
+    def _authoritative(self) -> DailyFunFactCachePort:
+        return self._tiers[-1]
+
+    async def store(self, fun_fact: DailyFunFact) -> None:
+        # a store that lost its lock raises here, before any cache sees the fact
+        await self._authoritative.store(fun_fact)
+        await self._backfill(len(self._tiers) - 1, [fun_fact])
+
+    async def get(self, date: date) -> Optional[DailyFunFact]:
+        for level, tier in enumerate(self._tiers):
+            fact = await self._read(level, tier.get(date))
+            if fact is None:
+                self._misses[level] += 1
+                continue
+
+            self._hits[level] += 1
+            await self._backfill(level, [fact])
+            return fact
+        return None
+
+    async def get_many(self, dates: list[date]) -> list[DailyFunFact]:
+        found: dict[date, DailyFunFact] = {}
+        remaining = list(dates)
+        for level, tier in enumerate(self._tiers):
+            if not remaining:
+                break
+
+            facts = await self._read(level, tier.get_many(remaining)) or []
+            self._hits[level] += len(facts)
+            self._misses[level] += len(remaining) - len(facts)
+            await self._backfill(level, facts)
+
+            found.update((fact.date, fact) for fact in facts)
+            remaining = [query_date for query_date in remaining if query_date not in found]
+        return [found[query_date] for query_date in dates if query_date in found]
+
+    async def get_last_n(self, limit: int) -> list[DailyFunFact]:
+        return await self._authoritative.get_last_n(limit)
+
+    async def get_range(self, start: date, end: date, limit: int) -> list[DailyFunFact]:
+        return await self._authoritative.get_range(start, end, limit)
+
+    async def acquire_lock(self, date: date, ttl: int = 10) -> bool:
+        return await self._authoritative.acquire_lock(date, ttl)
+
+    async def renew_lock(self, date: date, ttl: int = 10) -> bool:
+        return await self._authoritative.renew_lock(date, ttl)
+
+    async def release_lock(self, date: date):
+        await self._authoritative.release_lock(date)
+
+    async def wait_for_store(self, date: date, timeout: float) -> Optional[DailyFunFact]:
+        fact = await self._authoritative.wait_for_store(date, timeout)
+        if fact:
+            await self._backfill(len(self._tiers) - 1, [fact])
+        return fact
+
+    def stats(self) -> list[TierStats]:
+        return [
+            TierStats(name=name, hits=hits, misses=misses)
+            for name, hits, misses in zip(self._names, self._hits, self._misses)
+        ]
+
+    async def _read(self, level: int, read: Awaitable[Any]) -> Any:
+        if level == len(self._tiers) - 1:
+            return await read
+
+        try:
+            return await read
+        except Exception as e:
+            logger.warning(f"Cache tier {self._names[level]} failed, reading from the next one: {e}")
+            return None
+
+    async def _backfill(self, level: int, facts: list[DailyFunFact]) -> None:
+        for upper in range(level):
+            for fact in facts:
+                try:
+                    await self._tiers[upper].store(fact)
+                except Exception as e:
+                    logger.warning(f"Could not backfill cache tier {self._names[upper]}: {e}")
+                    break
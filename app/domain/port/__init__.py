@@ -1,2 +1,4 @@
-from app.domain.port.daily_fun_fact_cache_port import DailyFunFactCachePort
+from app.domain.port.daily_fun_fact_cache_port import DailyFunFactCachePort, LockLostError
 from app.domain.port.llm_port import LlmPort
+from app.domain.port.fun_fact_pool_port import FunFactPoolPort
+from app.domain.port.category_fun_fact_cache_port import CategoryFunFactCachePort
@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+
+class CategoryFunFactCachePort(ABC):
+    """Storage of the facts of every category of a day, which are generated and stored together."""
+
+    @abstractmethod
+    async def store_categories(self, date: date, facts: dict[str, str]) -> None:
+        pass
+
+    @abstractmethod
+    async def get_categories(self, date: date) -> dict[str, str]:
+        pass
+
+    @abstractmethod
+    async def acquire_lock(self, date: date, ttl: int = 10) -> bool:
+        pass
+
+    @abstractmethod
+    async def renew_lock(self, date: date, ttl: int = 10) -> bool:
+        pass
+
+    @abstractmethod
+    async def release_lock(self, date: date):
+        pass
+
+    @abstractmethod
+    async def wait_for_store(self, date: date, timeout: float) -> dict[str, str]:
+        pass
@@ -5,6 +5,10 @@ from typing import Optional
 from app.domain.model import DailyFunFact
 
 
+class LockLostError(Exception):
+    pass
+
+
 class DailyFunFactCachePort(ABC):
 
     @abstractmethod
@@ -19,10 +23,26 @@ class DailyFunFactCachePort(ABC):
     async def get_last_n(self, limit: int) -> list[DailyFunFact]:
         pass
 
+    @abstractmethod
+    async def get_range(self, start: date, end: date, limit: int) -> list[DailyFunFact]:
+        pass
+
+    @abstractmethod
+    async def get_many(self, dates: list[date]) -> list[DailyFunFact]:
+        pass
+
     @abstractmethod
     async def acquire_lock(self, date: date, ttl: int = 10) -> bool:
         pass
 
+    @abstractmethod
+    async def renew_lock(self, date: date, ttl: int = 10) -> bool:
+        pass
+
     @abstractmethod
     async def release_lock(self, date: date):
         pass
+
+    @abstractmethod
+    async def wait_for_store(self, date: date, timeout: float) -> Optional[DailyFunFact]:
+        pass
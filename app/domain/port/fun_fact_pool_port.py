@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class FunFactPoolPort(ABC):
+
+    @abstractmethod
+    async def pop(self) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    async def push_many(self, facts: list[str]) -> int:
+        pass
+
+    @abstractmethod
+    async def size(self) -> int:
+        pass
+
+    @abstractmethod
+    async def acquire_refill_lock(self, ttl: int = 120) -> bool:
+        pass
+
+    @abstractmethod
+    async def release_refill_lock(self):
+        pass
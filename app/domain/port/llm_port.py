@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional
 
 
 class LlmPort(ABC):
 
     @abstractmethod
-    async def chat(self, prompt: str) -> str:
+    async def chat(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+        pass
+
+    @abstractmethod
+    def stream_chat(self, prompt: str) -> AsyncIterator[str]:
         pass
@@ -1,11 +1,117 @@
-from app.adapter.mistral import get_mistral_adapter
-from app.adapter.redis import get_daily_fun_fact_redis_adapter
+import os
+from typing import Optional
+
+from app.domain.port import DailyFunFactCachePort
+from app.domain.service.category_fun_fact_service import CategoryFunFactService
 from app.domain.service.daily_fun_fact_service import DailyFunFactService
+from app.domain.service.near_duplicate_index import NearDuplicateIndex
+
+
+# built on first use; tests replace it by patching this name
+_daily_fun_fact_service_instance: Optional[DailyFunFactService] = None
+_category_fun_fact_service_instance: Optional[CategoryFunFactService] = None
+
+def _cache_tiers() -> list[str]:
+    # fastest first, the last tier is authoritative, e.g. "memory,redis,sqlite"
+    tiers = os.getenv("FUN_FACT_CACHE_TIERS") or os.getenv("FUN_FACT_CACHE_BACKEND", "redis")
+    return [tier.strip().lower() for tier in tiers.split(",") if tier.strip()]
+
+def authoritative_cache_tier() -> str:
+    return _cache_tiers()[-1]
+
+def _get_cache_adapter(tier: str) -> DailyFunFactCachePort:
+    if tier == "memory":
+        from app.adapter.memory import get_daily_fun_fact_memory_adapter
+        return get_daily_fun_fact_memory_adapter()
+    if tier == "sqlite":
+        from app.adapter.sqlite import get_daily_fun_fact_sqlite_adapter
+        return get_daily_fun_fact_sqlite_adapter()
+    if tier == "redis":
+        from app.adapter.redis import get_daily_fun_fact_redis_adapter
+        return get_daily_fun_fact_redis_adapter()
+    raise ValueError(f"Unknown cache tier: {tier}")
+
+def _create_cache_port() -> DailyFunFactCachePort:
+    from app.adapter.metrics import InstrumentedCachePort
+    from app.adapter.tiered import TieredCachePort
+
+    tiers = [(tier, InstrumentedCachePort(_get_cache_adapter(tier), tier)) for tier in _cache_tiers()]
+    if len(tiers) == 1:
+        return tiers[0][1]
+    return TieredCachePort(tiers)
 
+def _create_daily_fun_fact_service() -> DailyFunFactService:
+    # adapters are imported here so that importing the domain does not pull in the Redis and Mistral clients
+    from app.adapter.metrics import InstrumentedLlmPort, record_cache_lookup
+    from app.adapter.mistral import get_mistral_adapter
+    from app.adapter.redis import get_fun_fact_pool_redis_adapter
 
-_cache_port = get_daily_fun_fact_redis_adapter()
-_llm_port = get_mistral_adapter()
-_daily_fun_fact_service_instance = DailyFunFactService(_cache_port, _llm_port)
+    # the pool lives in Redis, which deployments without it do not have
+    pool_default = "true" if "redis" in _cache_tiers() else "false"
+    pool_enabled = os.getenv("FUN_FACT_POOL_ENABLED", pool_default).lower() == "true"
+    dedup_enabled = os.getenv("FUN_FACT_DEDUP_ENABLED", "true").lower() == "true"
+    cache_port = _create_cache_port()
+    if os.getenv("SNAPSHOT_DIR"):
+        from app.adapter.snapshot import SnapshotExportingCachePort, get_snapshot_exporter
+        cache_port = SnapshotExportingCachePort(cache_port, get_snapshot_exporter(cache_port))
+    return DailyFunFactService(
+        cache_port,
+        InstrumentedLlmPort(get_mistral_adapter(), "llm"),
+        pool_port=get_fun_fact_pool_redis_adapter() if pool_enabled else None,
+        pool_low_water=int(os.getenv("FUN_FACT_POOL_LOW_WATER", "3")),
+        pool_batch_size=int(os.getenv("FUN_FACT_POOL_BATCH_SIZE", "10")),
+        duplicate_index=(
+            NearDuplicateIndex(threshold=float(os.getenv("FUN_FACT_DEDUP_THRESHOLD", "0.5"))) if dedup_enabled else None
+        ),
+        # not "memory", which is the label of the memory cache tier
+        on_memory_cache_lookup=lambda hit: record_cache_lookup("service", hit),
+    )
 
 def get_daily_fun_fact_service() -> DailyFunFactService:
+    global _daily_fun_fact_service_instance
+    if _daily_fun_fact_service_instance is None:
+        _daily_fun_fact_service_instance = _create_daily_fun_fact_service()
     return _daily_fun_fact_service_instance
+
+def _fun_fact_categories() -> list[str]:
+    categories = os.getenv("FUN_FACT_CATEGORIES", "science,history,animals")
+    return list(dict.fromkeys(category.strip().lower() for category in categories.split(",") if category.strip()))
+
+def get_category_fun_fact_service() -> CategoryFunFactService:
+    # the facts of all categories are stored together in Redis, whatever the cache tiers of the daily fact are
+    from app.adapter.metrics import InstrumentedLlmPort
+    from app.adapter.mistral import get_mistral_adapter
+    from app.adapter.redis import get_category_fun_fact_redis_adapter
+
+    global _category_fun_fact_service_instance
+    if _category_fun_fact_service_instance is None:
+        categories = _fun_fact_categories()
+        _category_fun_fact_service_instance = CategoryFunFactService(
+            get_category_fun_fact_redis_adapter(categories),
+            InstrumentedLlmPort(get_mistral_adapter(), "llm"),
+            categories,
+        )
+    return _category_fun_fact_service_instance
+
+async def warm_up_cache_adapter(connections: int) -> None:
+    from app.adapter.redis import warm_up_redis_adapters
+    from app.adapter.sqlite import warm_up_sqlite_adapter
+
+    tiers = _cache_tiers()
+    if "redis" in tiers:
+        await warm_up_redis_adapters(connections)
+    if "sqlite" in tiers:
+        await warm_up_sqlite_adapter(connections)
+
+async def close_daily_fun_fact_service() -> None:
+    from app.adapter.mistral import close_mistral_adapter
+    from app.adapter.redis import close_redis_adapters
+    from app.adapter.snapshot import close_snapshot_exporter
+    from app.adapter.sqlite import close_sqlite_adapter
+
+    global _daily_fun_fact_service_instance, _category_fun_fact_service_instance
+    _daily_fun_fact_service_instance = _category_fun_fact_service_instance = None
+    await close_snapshot_exporter()
+    await close_redis_adapters()
+    await close_sqlite_adapter()
+    await close_mistral_adapter()
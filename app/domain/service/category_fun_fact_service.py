@@ -0,0 +1,105 @@
+import json
+from datetime import date
+from typing import Optional
+
+from app.util import logger, DailyLruCache, timed_phase
+
+from app.domain.port import CategoryFunFactCachePort, LlmPort
+from app.domain.model import DailyFunFact
+from app.domain.service.locked_generation import SingleFlight, generate_under_lock
+
+
+class CategoryFunFactService:
+    """Fun facts per category, generated for all categories of a day by a single LLM call."""
+
+    _PROMPT = (
+        "Tell me one random fun fact for each of these categories: {categories}. Your response MUST be only a JSON "
+        "object with exactly these categories as keys and one fun fact per category as string values."
+    )
+    _TOKENS_PER_FACT = 64
+    _MAX_ATTEMPTS = 2
+    _LOCK_WAIT_TIMEOUT = 30.0
+    _LOCK_TTL = 10  # the default ttl of acquire_lock
+
+    def __init__(
+        self,
+        cache_port: CategoryFunFactCachePort,
+        llm_port: LlmPort,
+        categories: list[str],
+        lock_wait_timeout: float = _LOCK_WAIT_TIMEOUT,
+    ):
+        self.cache_port = cache_port
+        self.llm_port = llm_port
+        self.categories = list(categories)
+        self._lock_wait_timeout = lock_wait_timeout
+        self._memory_cache = DailyLruCache(max_size=8)
+        self._loads: SingleFlight[dict[str, str]] = SingleFlight()
+
+    async def get_todays_fun_fact(self, category: str) -> Optional[DailyFunFact]:
+        today = date.today()
+        fact = (await self.get_fun_facts(today)).get(category)
+        return DailyFunFact(date=today, fact=fact) if fact else None
+
+    async def get_fun_facts(self, target_date: date) -> dict[str, str]:
+        facts = self._memory_cache.get(target_date)
+        if facts is not None:
+            return facts
+
+        return await self._loads.run(target_date, lambda: self._load_or_generate(target_date))
+
+    async def pregenerate_fun_facts(self, target_date: date) -> dict[str, str]:
+        return await self.get_fun_facts(target_date)
+
+    async def _load_or_generate(self, target_date: date) -> dict[str, str]:
+        with timed_phase("cache"):
+            facts = await self.cache_port.get_categories(target_date)
+        if not facts:
+            facts = await self._generate(target_date)
+
+        if facts:
+            self._memory_cache.put(target_date, facts, target_date)
+        return facts
+
+    async def _generate(self, target_date: date) -> dict[str, str]:
+        return await generate_under_lock(
+            self.cache_port,
+            target_date,
+            f"the categories of {target_date}",
+            lookup=lambda: self.cache_port.get_categories(target_date),
+            generate=self._new_facts,
+            store=lambda facts: self.cache_port.store_categories(target_date, facts),
+            lock_wait_timeout=self._lock_wait_timeout,
+            lock_ttl=self._LOCK_TTL,
+        )
+
+    async def _new_facts(self) -> dict[str, str]:
+        prompt = self._PROMPT.format(categories=", ".join(self.categories))
+        missing = self.categories
+        for attempt in range(1, self._MAX_ATTEMPTS + 1):
+            with timed_phase("llm"):
+                response = await self.llm_port.chat(prompt, max_tokens=len(self.categories) * self._TOKENS_PER_FACT)
+            facts = self._parse_facts(response)
+            missing = [category for category in self.categories if category not in facts]
+            if not missing:
+                return facts
+            logger.warning(f"No fun fact for {', '.join(missing)} in the response (attempt {attempt}/{self._MAX_ATTEMPTS})")
+
+        # a partial day would be stored and served as final, leaving the missing categories empty until tomorrow
+        raise ValueError(f"Could not generate the fun facts of {', '.join(missing)}")
+
+    def _parse_facts(self, response: str) -> dict[str, str]:
+        # models like to wrap the object in prose or code fences
+        start, end = response.find("{"), response.rfind("}")
+        try:
+            candidates = json.loads(response[start:end + 1]) if 0 <= start < end else {}
+        except json.JSONDecodeError:
+            candidates = {}
+        if not isinstance(candidates, dict):
+            candidates = {}
+
+        normalized = {str(key).strip().lower(): value for key, value in candidates.items()}
+        return {
+            category: normalized[category].strip()
+            for category in self.categories
+            if isinstance(normalized.get(category), str) and normalized[category].strip()
+        }
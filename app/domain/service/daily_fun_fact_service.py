@@ -1,48 +1,297 @@
-from datetime import date
-from typing import Optional
+import asyncio
+import json
+from datetime import date, timedelta
+from typing import AsyncIterator, Callable, Optional
 
-from app.util import logger
+from app.util import logger, DailyLruCache, CacheStats, timed_phase
 
-from app.domain.port import LlmPort, DailyFunFactCachePort
+from app.domain.port import LlmPort, DailyFunFactCachePort, FunFactPoolPort
 from app.domain.model import DailyFunFact
+from app.domain.service.fun_fact_stream import FunFactStream
+from app.domain.service.locked_generation import SingleFlight, generate_under_lock
+from app.domain.service.near_duplicate_index import NearDuplicateIndex
 
 
 class DailyFunFactService:
 
     _BASE_PROMPT = "Tell me a random fun fact. Your response MUST be only the fun fact. It must be different from these: "
+    _BATCH_PROMPT = (
+        "Tell me {count} different random fun facts. Your response MUST be only a JSON array of strings, "
+        "one fun fact per string. They must be different from these: "
+    )
+    _BATCH_TOKENS_PER_FACT = 64
+    _INDEX_SYNC_PAGE_SIZE = 1000
+    _TODAY_KEY = "today"
+    _LAST_N_KEY = "last_n"
+    _LOCK_WAIT_TIMEOUT = 30.0
+    _LOCK_TTL = 10  # the default ttl of acquire_lock
 
-    def __init__(self, cache_port: DailyFunFactCachePort, llm_port: LlmPort):
+    def __init__(
+        self,
+        cache_port: DailyFunFactCachePort,
+        llm_port: LlmPort,
+        memory_cache_size: int = 64,
+        lock_wait_timeout: float = _LOCK_WAIT_TIMEOUT,
+        pool_port: Optional[FunFactPoolPort] = None,
+        pool_low_water: int = 3,
+        pool_batch_size: int = 10,
+        duplicate_index: Optional[NearDuplicateIndex] = None,
+        max_duplicate_retries: int = 2,
+        on_memory_cache_lookup: Optional[Callable[[bool], None]] = None,
+    ):
         self.cache_port = cache_port
         self.llm_port = llm_port
+        self.pool_port = pool_port
+        self._pool_low_water = pool_low_water
+        self._pool_batch_size = pool_batch_size
+        self.duplicate_index = duplicate_index
+        self._max_duplicate_retries = max_duplicate_retries
+        self._index_synced_through: Optional[date] = None
+        self._index_lock = asyncio.Lock()
         self.cached_prompt_date = None
         self.cached_prompt = ""
+        self._memory_cache = DailyLruCache(memory_cache_size, on_lookup=on_memory_cache_lookup)
+        self._lock_wait_timeout = lock_wait_timeout
+        self._streams: dict[date, FunFactStream] = {}
+        self._loads: SingleFlight[Optional[DailyFunFact]] = SingleFlight(
+            on_finish=lambda target_date: self._streams.pop(target_date, None)
+        )
 
     async def get_todays_fun_fact(self) -> Optional[DailyFunFact]:
-        today = date.today()
-        fact = await self.cache_port.get(today)
+        fact = self._memory_cache.get(self._TODAY_KEY)
         if fact:
             return fact
 
-        fact = None
-        lock_acquired = await self.cache_port.acquire_lock(today)
+        return await self._get_or_generate(date.today())
+
+    async def stream_todays_fun_fact(self) -> AsyncIterator[str]:
+        fact = self._memory_cache.get(self._TODAY_KEY)
+        if fact:
+            yield fact.fact
+            return
+
+        today = date.today()
+        stream = self._streams.get(today)
+        if stream is None and today not in self._loads:
+            stream = FunFactStream()
+            self._streams[today] = stream
+            self._loads.start(today, self._load_or_generate(today, stream))
+
+        if stream is None:
+            # a load without streaming is already in flight, its result comes in one piece
+            fact = await self._get_or_generate(today)
+            if fact:
+                yield fact.fact
+            return
+
+        async for chunk in stream.subscribe():
+            yield chunk
+
+    async def get_last_n_fun_facts(self, n: int) -> list[DailyFunFact]:
+        key = (self._LAST_N_KEY, n)
+        facts = self._memory_cache.get(key)
+        if facts is not None:
+            return list(facts)
+
+        today = date.today()
+        facts = await self.cache_port.get_last_n(n)
+        if facts and facts[0].date == today:
+            # the list can no longer change once today's fact is in it
+            self._memory_cache.put(key, tuple(facts), today)
+        return facts
+
+    async def get_fun_facts_page(
+        self, start: date, end: date, limit: int
+    ) -> tuple[list[DailyFunFact], Optional[date]]:
+        end = min(end, date.today())
+        if start > end:
+            return [], None
+
+        # one extra item tells whether there is a next page and where it starts
+        facts = await self.cache_port.get_range(start, end, limit + 1)
+        if len(facts) > limit:
+            return facts[:limit], facts[limit].date
+        return facts, None
+
+    async def iter_fun_fact_pages(
+        self, start: date, end: date, page_size: int, limit: Optional[int] = None
+    ) -> AsyncIterator[list[DailyFunFact]]:
+        cursor: Optional[date] = start
+        remaining = limit
+        while cursor is not None and remaining != 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            facts, cursor = await self.get_fun_facts_page(cursor, end, size)
+            if facts:
+                yield facts
+            if remaining is not None:
+                remaining -= len(facts)
+
+    async def get_fun_facts_by_date(self, dates: list[date]) -> tuple[list[DailyFunFact], list[date]]:
+        today = date.today()
+        requested = list(dict.fromkeys(dates))
+        found = await self.cache_port.get_many([query_date for query_date in requested if query_date <= today])
+
+        found_dates = {fact.date for fact in found}
+        missing = [query_date for query_date in requested if query_date not in found_dates]
+        return found, missing
+
+    async def pregenerate_fun_fact(self, target_date: date) -> Optional[DailyFunFact]:
+        return await self._get_or_generate(target_date)
+
+    async def refill_fun_fact_pool(self) -> int:
+        if self.pool_port is None or await self.pool_port.size() >= self._pool_low_water:
+            return 0
+        if not await self.pool_port.acquire_refill_lock():
+            return 0
 
         try:
-            if lock_acquired:
-                fact = await self.cache_port.get(today)
-                if not fact:
-                    prompt = await self._get_prompt(today)
-                    fact_text = await self.llm_port.chat(prompt)
-                    fact = DailyFunFact(today, fact_text)
-                    await self.cache_port.store(fact)
+            recent_fun_facts = await self.get_last_n_fun_facts(10)
+            recent_fun_facts_str = ",".join([f'`{fun_fact.fact}`' for fun_fact in recent_fun_facts])
+            prompt = f"{self._BATCH_PROMPT.format(count=self._pool_batch_size)} + [{recent_fun_facts_str}]"
+            response = await self.llm_port.chat(
+                prompt, max_tokens=self._pool_batch_size * self._BATCH_TOKENS_PER_FACT
+            )
+            await self._sync_duplicate_index()
+            facts = [fact for fact in self._parse_fact_batch(response) if not self._find_similar(fact)]
+            added = await self.pool_port.push_many(facts)
         finally:
-            if lock_acquired:
-                await self.cache_port.release_lock(today)
+            await self.pool_port.release_refill_lock()
+
+        logger.info(f"Added {added} fun facts to the pool")
+        return added
+
+    async def warm_up(self, recent_count: int) -> None:
+        # fills the in-memory cache, so that a fresh worker answers its first requests without a round trip
+        await self.get_todays_fun_fact()
+        await self.get_last_n_fun_facts(recent_count)
+
+    def memory_cache_stats(self) -> CacheStats:
+        return self._memory_cache.stats()
+
+    async def _get_or_generate(self, target_date: date) -> Optional[DailyFunFact]:
+        return await self._loads.run(target_date, lambda: self._load_or_generate(target_date))
 
+    async def _load_or_generate(
+        self, target_date: date, stream: Optional[FunFactStream] = None
+    ) -> Optional[DailyFunFact]:
+        try:
+            with timed_phase("cache"):
+                fact = await self.cache_port.get(target_date)
+            if not fact:
+                fact = await self._generate(target_date, stream)
+        except Exception as e:
+            if stream:
+                stream.close(e)
+            raise
+
+        if fact:
+            self._memory_cache.put(self._TODAY_KEY, fact, target_date)
+        if stream:
+            if fact and stream.is_empty:
+                stream.push(fact.fact)  # found in the cache or generated by another worker
+            stream.close()
         return fact
-    
-    async def get_last_n_fun_facts(self, n: int) -> list[DailyFunFact]:
-        return await self.cache_port.get_last_n(n)
-    
+
+    async def _generate(self, target_date: date, stream: Optional[FunFactStream] = None) -> Optional[DailyFunFact]:
+        async def new_fact() -> DailyFunFact:
+            return DailyFunFact(target_date, await self._new_fact_text(target_date, stream))
+
+        return await generate_under_lock(
+            self.cache_port,
+            target_date,
+            f"the fun fact of {target_date}",
+            lookup=lambda: self.cache_port.get(target_date),
+            generate=new_fact,
+            store=self.cache_port.store,
+            lock_wait_timeout=self._lock_wait_timeout,
+            lock_ttl=self._LOCK_TTL,
+        )
+
+    async def _new_fact_text(self, target_date: date, stream: Optional[FunFactStream]) -> str:
+        with timed_phase("dedup"):
+            await self._sync_duplicate_index()
+
+        rejected: list[str] = []
+        while True:
+            with timed_phase("pool"):
+                fact_text = await self._pop_pooled_fact()
+            if fact_text is None:
+                with timed_phase("prompt"):
+                    prompt = await self._get_prompt(target_date)
+                if rejected:
+                    prompt += " Also different from these: [" + ",".join(f"`{text}`" for text in rejected) + "]"
+                # only the first attempt is streamed, the closing fact event corrects a rejected one
+                with timed_phase("llm"):
+                    fact_text = await self._complete(prompt, None if rejected else stream)
+
+            with timed_phase("dedup"):
+                similar = self._find_similar(fact_text)
+            if similar is None:
+                return fact_text
+
+            similar_date, similarity = similar
+            if len(rejected) >= self._max_duplicate_retries:
+                logger.warning(f"Keeping a near-duplicate of the fun fact of {similar_date} after {len(rejected)} retries")
+                return fact_text
+
+            logger.info(f"Rejected a near-duplicate of the fun fact of {similar_date} ({similarity:.0%} similar): {fact_text}")
+            rejected.append(fact_text)
+
+    def _find_similar(self, fact_text: str) -> Optional[tuple[date, float]]:
+        if self.duplicate_index is None:
+            return None
+        return self.duplicate_index.find_similar(fact_text)
+
+    async def _sync_duplicate_index(self) -> None:
+        # picks up every fact stored since the last sync, by any worker
+        if self.duplicate_index is None:
+            return
+
+        async with self._index_lock:
+            start = self._index_synced_through + timedelta(days=1) if self._index_synced_through else date.min
+            while True:
+                facts = await self.cache_port.get_range(start, date.max, self._INDEX_SYNC_PAGE_SIZE)
+                for fact in facts:
+                    self.duplicate_index.add(fact.date, fact.fact)
+                if facts:
+                    self._index_synced_through = facts[-1].date
+                    start = facts[-1].date + timedelta(days=1)
+                if len(facts) < self._INDEX_SYNC_PAGE_SIZE:
+                    return
+
+    async def _pop_pooled_fact(self) -> Optional[str]:
+        if self.pool_port is None:
+            return None
+
+        try:
+            return await self.pool_port.pop()
+        except Exception as e:
+            logger.warning(f"Could not take a fun fact from the pool, generating one: {e}")
+            return None
+
+    def _parse_fact_batch(self, response: str) -> list[str]:
+        # models like to wrap the array in prose or code fences
+        start, end = response.find("["), response.rfind("]")
+        try:
+            candidates = json.loads(response[start:end + 1]) if 0 <= start < end else []
+        except json.JSONDecodeError:
+            candidates = []
+
+        facts = [candidate.strip() for candidate in candidates if isinstance(candidate, str) and candidate.strip()]
+        if not facts:
+            logger.warning(f"Could not parse a batch of fun facts from: {response}")
+        return list(dict.fromkeys(facts))
+
+    async def _complete(self, prompt: str, stream: Optional[FunFactStream]) -> str:
+        if stream is None:
+            return await self.llm_port.chat(prompt)
+
+        chunks = []
+        async for chunk in self.llm_port.stream_chat(prompt):
+            chunks.append(chunk)
+            stream.push(chunk)
+        return "".join(chunks)
+
     async def _get_prompt(self, date: date) -> str:
         if date == self.cached_prompt_date:
             return self.cached_prompt
@@ -0,0 +1,43 @@
+import asyncio
+from typing import AsyncIterator, Optional
+
+
+class FunFactStream:
+    """Chunks of a fact being generated, replayed to every subscriber from the start."""
+
+    def __init__(self):
+        self._chunks: list[str] = []
+        self._changed = asyncio.Event()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._chunks
+
+    def push(self, chunk: str) -> None:
+        self._chunks.append(chunk)
+        self._notify()
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        self._closed = True
+        self._error = error
+        self._notify()
+
+    async def subscribe(self) -> AsyncIterator[str]:
+        index = 0
+        while True:
+            while index < len(self._chunks):
+                yield self._chunks[index]
+                index += 1
+
+            if self._closed:
+                if self._error is not None:
+                    raise self._error
+                return
+
+            await self._changed.wait()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
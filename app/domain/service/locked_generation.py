@@ -0,0 +1,110 @@
+import asyncio
+import contextlib
+from datetime import date
+from typing import Awaitable, Callable, Generic, Hashable, Optional, Protocol, TypeVar
+
+from app.util import logger, timed_phase
+
+from app.domain.port import LockLostError
+
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Runs one load per key and process at a time, concurrent callers share its result."""
+
+    def __init__(self, on_finish: Optional[Callable[[Hashable], None]] = None):
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+        self._on_finish = on_finish
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._in_flight
+
+    async def run(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        task = self._in_flight.get(key)
+        if task is None:
+            return await asyncio.shield(self.start(key, load()))
+
+        with timed_phase("wait"):
+            return await asyncio.shield(task)
+
+    def start(self, key: Hashable, load: Awaitable[T]) -> asyncio.Future:
+        task = asyncio.ensure_future(load)
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return task
+
+    def _finish(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+            if self._on_finish:
+                self._on_finish(key)
+        if not task.cancelled():
+            task.exception()  # mark as retrieved even if every waiter went away
+
+
+class LeasedLockPort(Protocol[T]):
+    """The lock methods that the daily and the category cache ports share."""
+
+    async def acquire_lock(self, date: date, ttl: int = 10) -> bool: ...
+
+    async def renew_lock(self, date: date, ttl: int = 10) -> bool: ...
+
+    async def release_lock(self, date: date): ...
+
+    async def wait_for_store(self, date: date, timeout: float) -> Optional[T]: ...
+
+
+async def generate_under_lock(
+    lock_port: LeasedLockPort[T],
+    target_date: date,
+    description: str,
+    lookup: Callable[[], Awaitable[Optional[T]]],
+    generate: Callable[[], Awaitable[T]],
+    store: Callable[[T], Awaitable[None]],
+    lock_wait_timeout: float,
+    lock_ttl: float,
+) -> Optional[T]:
+    """Generates and stores what a date is missing in a single worker, the others wait for its store.
+
+    The lock is renewed while the generation is in flight. A holder that lost it anyway takes what the new holder
+    stores instead of its own.
+    """
+    with timed_phase("lock"):
+        acquired = await lock_port.acquire_lock(target_date)
+    if not acquired:
+        logger.info(f"Waiting for another worker to generate {description}")
+        with timed_phase("wait"):
+            return await lock_port.wait_for_store(target_date, lock_wait_timeout)
+
+    lease = asyncio.create_task(_renew_lock(lock_port, target_date, description, lock_ttl))
+    try:
+        with timed_phase("cache"):
+            result = await lookup()
+        if not result:
+            result = await generate()
+            try:
+                with timed_phase("store"):
+                    await store(result)
+            except LockLostError as e:
+                logger.warning(f"{e}, using {description} of the new lock holder")
+                with timed_phase("wait"):
+                    result = await lock_port.wait_for_store(target_date, lock_wait_timeout)
+    finally:
+        # a renewal still in flight could otherwise extend the lock after it is released
+        lease.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await lease
+        await lock_port.release_lock(target_date)
+
+    return result
+
+
+async def _renew_lock(lock_port: LeasedLockPort, target_date: date, description: str, lock_ttl: float) -> None:
+    # keeps the lock alive while a slow LLM call is in flight
+    while True:
+        await asyncio.sleep(lock_ttl / 3)
+        if not await lock_port.renew_lock(target_date, lock_ttl):
+            logger.warning(f"Could not renew the lock of {description}")
+            return
@@ -0,0 +1,51 @@
+import re
+import zlib
+from datetime import date
+from typing import Optional
+
+import numpy as np
+
+
+class NearDuplicateIndex:
+    """MinHash signatures of character shingles, compared against every indexed fact at once."""
+
+    _SHINGLE_SIZE = 5
+    _NON_WORD = re.compile(r"[^a-z0-9]+")
+
+    def __init__(self, threshold: float = 0.5, num_permutations: int = 128, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        # multiply-add-shift hashing, the uint64 overflow is the intended mod 2^64
+        self._a = (rng.integers(0, 2 ** 63, size=(num_permutations, 1), dtype=np.uint64) << np.uint64(1)) | np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, size=(num_permutations, 1), dtype=np.uint64)
+        self._threshold = threshold
+        self._signatures = np.empty((64, num_permutations), dtype=np.uint32)
+        self._dates: list[date] = []
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def add(self, fact_date: date, fact: str) -> None:
+        if len(self._dates) == len(self._signatures):
+            self._signatures = np.concatenate([self._signatures, np.empty_like(self._signatures)])
+
+        self._signatures[len(self._dates)] = self._signature(fact)
+        self._dates.append(fact_date)
+
+    def find_similar(self, fact: str) -> Optional[tuple[date, float]]:
+        if not self._dates:
+            return None
+
+        signatures = self._signatures[:len(self._dates)]
+        similarities = (signatures == self._signature(fact)).mean(axis=1)
+        best = int(similarities.argmax())
+        if similarities[best] < self._threshold:
+            return None
+        return self._dates[best], float(similarities[best])
+
+    def _signature(self, fact: str) -> np.ndarray:
+        text = self._NON_WORD.sub(" ", fact.lower()).strip()
+        shingles = {text[i:i + self._SHINGLE_SIZE] for i in range(max(len(text) - self._SHINGLE_SIZE + 1, 1))}
+        hashes = np.fromiter((zlib.crc32(shingle.encode()) for shingle in shingles), dtype=np.uint64, count=len(shingles))
+        with np.errstate(over="ignore"):
+            permuted = (self._a * hashes + self._b) >> np.uint64(32)
+        return permuted.min(axis=1).astype(np.uint32)
@@ -1 +1,3 @@
 from app.util.logger import logger
+from app.util.daily_lru_cache import DailyLruCache, CacheStats
+from app.util.phase_timings import start_phase_timings, stop_phase_timings, timed_phase
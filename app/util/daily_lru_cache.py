@@ -0,0 +1,70 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Hashable, Optional
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class DailyLruCache:
+    """Bounded in-process LRU whose entries are only valid for the day they were cached on."""
+
+    def __init__(
+        self,
+        max_size: int = 64,
+        clock: Callable[[], date] = date.today,
+        on_lookup: Optional[Callable[[bool], None]] = None,
+    ):
+        self._max_size = max_size
+        self._clock = clock
+        self._on_lookup = on_lookup
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._day: Optional[date] = None
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        self._roll_over()
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self._misses += 1
+            self._notify(False)
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        self._notify(True)
+        return value
+
+    def put(self, key: Hashable, value: Any, day: date) -> None:
+        self._roll_over()
+        if day != self._day:
+            return  # computed before the rollover, would leak into the new day
+
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self._hits, misses=self._misses, size=len(self._entries), max_size=self._max_size)
+
+    def _notify(self, hit: bool) -> None:
+        if self._on_lookup:
+            self._on_lookup(hit)
+
+    def _roll_over(self) -> None:
+        today = self._clock()
+        if today != self._day:
+            self._entries.clear()
+            self._day = today
@@ -0,0 +1,32 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Iterator, Optional
+
+
+_phase_timings: ContextVar[Optional[dict[str, float]]] = ContextVar("phase_timings", default=None)
+
+
+def start_phase_timings() -> tuple[dict[str, float], Token]:
+    """Starts collecting the time spent per phase in the current context, e.g. for one request."""
+    timings: dict[str, float] = {}
+    return timings, _phase_timings.set(timings)
+
+
+def stop_phase_timings(token: Token) -> None:
+    _phase_timings.reset(token)
+
+
+@contextmanager
+def timed_phase(name: str) -> Iterator[None]:
+    timings = _phase_timings.get()
+    if timings is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        # a phase entered more than once, like retried LLM calls, adds up
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - started
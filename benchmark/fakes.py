@@ -0,0 +1,20 @@
+import asyncio
+from typing import AsyncIterator, Optional
+
+from app.domain.port import LlmPort
+
+
+class FakeLatencyLlmPort(LlmPort):
+
+    def __init__(self, latency: float = 0.5, response: str = "Benchmarks are more fun than they look."):
+        self.latency = latency
+        self.response = response
+        self.calls = 0
+
+    async def chat(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return f"{self.response} #{self.calls}"
+
+    async def stream_chat(self, prompt: str) -> AsyncIterator[str]:
+        yield await self.chat(prompt)
@@ -0,0 +1,373 @@
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import platform
+import socket
+import sys
+import tempfile
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, asdict
+from datetime import date, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+import httpx
+import redis.asyncio as redis
+import uvicorn
+from fakeredis import FakeAsyncRedis
+
+from app.adapter.api.v1 import clear_cached_representations
+from app.adapter.redis.daily_fun_fact_redis_adapter import FunFactRedisAdapter
+from app.adapter.sqlite import FunFactSqliteAdapter
+from app.domain.model import DailyFunFact
+from app.domain.port import DailyFunFactCachePort
+from app.domain.service import get_daily_fun_fact_service
+from app.domain.service.daily_fun_fact_service import DailyFunFactService
+from benchmark.fakes import FakeLatencyLlmPort
+from app.util import logger
+from main import create_app
+
+
+_TRANSPORTS = ("inprocess", "socket")
+_DEFAULT_THRESHOLDS = os.path.join(os.path.dirname(__file__), "thresholds.json")
+_HISTORY_DAYS = 30
+_RECENT_PATH = "/v1/fun-facts/recent"
+_TODAY_PATH = "/v1/fun-facts/today"
+_CLIENT_TIMEOUT = httpx.Timeout(30.0)
+
+
+@dataclass
+class ScenarioResult:
+    scenario: str
+    transport: str
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    throughput_rps: float
+    llm_calls: int
+
+
+@dataclass
+class _Samples:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    elapsed: float = 0.0
+    llm_calls: Optional[int] = None
+
+
+@asynccontextmanager
+async def _benchmark_lifespan(app) -> AsyncIterator[None]:
+    # the benchmark owns the service, so the app must not warm up or start background work against the configured Redis
+    yield
+
+
+class BenchmarkTarget:
+
+    def __init__(self, backend: str, redis_url: Optional[str], llm_latency: float):
+        self.app = create_app(lifespan_context=_benchmark_lifespan)
+        self.llm = FakeLatencyLlmPort(llm_latency)
+        self.service: Optional[DailyFunFactService] = None
+        self._backend = backend
+        self._redis_url = redis_url
+        self._redis_client = None
+        self._sqlite_directory = tempfile.TemporaryDirectory(prefix="funfacts-benchmark-")
+        self._sqlite_adapter: Optional[FunFactSqliteAdapter] = None
+        self._resets = 0
+        self._llm_latency = llm_latency
+        self.app.dependency_overrides[get_daily_fun_fact_service] = lambda: self.service
+
+    async def reset(self, history_days: int = 0, include_today: bool = False):
+        clear_cached_representations()
+        cache_port = await self._fresh_cache_port()
+        self.llm = FakeLatencyLlmPort(self._llm_latency)
+        self.service = DailyFunFactService(cache_port, self.llm)
+
+        today = date.today()
+        first_day = 0 if include_today else 1
+        for days_ago in range(first_day, first_day + history_days):
+            fact_date = today - timedelta(days=days_ago)
+            await cache_port.store(DailyFunFact(date=fact_date, fact=f"Seeded fact for {fact_date.isoformat()}"))
+
+    async def close(self):
+        if self._redis_client is not None:
+            await self._redis_client.flushdb()
+            await self._redis_client.aclose()
+        if self._sqlite_adapter is not None:
+            await self._sqlite_adapter.close()
+        self._sqlite_directory.cleanup()
+
+    async def _fresh_cache_port(self) -> DailyFunFactCachePort:
+        if self._backend == "sqlite":
+            if self._sqlite_adapter is not None:
+                await self._sqlite_adapter.close()
+            self._resets += 1
+            path = os.path.join(self._sqlite_directory.name, f"funfacts-{self._resets}.sqlite3")
+            self._sqlite_adapter = FunFactSqliteAdapter(path)
+            return self._sqlite_adapter
+
+        # redis connections are bound to the loop that serves the app, so the client is created on first reset
+        if self._redis_client is None:
+            self._redis_client = (
+                redis.from_url(self._redis_url, decode_responses=True)
+                if self._redis_url
+                else FakeAsyncRedis(decode_responses=True)
+            )
+        await self._redis_client.flushdb()
+        cache_port = FunFactRedisAdapter("redis://localhost:6379")
+        cache_port._client = self._redis_client
+        return cache_port
+
+
+class _ServerThread(threading.Thread):
+
+    def __init__(self, server: uvicorn.Server):
+        super().__init__(name="benchmark-server", daemon=True)
+        self.server = server
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_ready = threading.Event()
+
+    def run(self):
+        asyncio.run(self._serve())
+
+    async def _serve(self):
+        self._loop = asyncio.get_running_loop()
+        self._loop_ready.set()
+        await self.server.serve()
+
+    async def call(self, coro: Awaitable[Any]) -> Any:
+        self._loop_ready.wait()
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._loop))
+
+
+def percentile(latencies: list[float], p: float) -> float:
+    if not latencies:
+        return 0.0
+    ordered = sorted(latencies)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+async def _drive(client: httpx.AsyncClient, path: str, total: int, concurrency: int) -> _Samples:
+    samples = _Samples()
+    remaining = iter(range(total))
+
+    async def worker():
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code != 200:
+                    logger.warning(f"Benchmark request to {path} returned {response.status_code}")
+                    samples.errors += 1
+            except httpx.HTTPError as e:
+                logger.warning(f"Benchmark request to {path} failed: {e!r}")
+                samples.errors += 1
+            samples.latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, total))))
+    samples.elapsed = time.perf_counter() - started
+    return samples
+
+
+async def _warm_today(client, control, target: BenchmarkTarget, args) -> _Samples:
+    await control(target.reset(history_days=_HISTORY_DAYS))
+    await client.get(_TODAY_PATH)
+    return await _drive(client, _TODAY_PATH, args.requests, args.concurrency)
+
+
+async def _warm_recent(client, control, target: BenchmarkTarget, args) -> _Samples:
+    await control(target.reset(history_days=_HISTORY_DAYS, include_today=True))
+    await client.get(_RECENT_PATH)
+    return await _drive(client, _RECENT_PATH, args.requests, args.concurrency)
+
+
+async def _cold_today(client, control, target: BenchmarkTarget, args) -> _Samples:
+    samples = _Samples(llm_calls=0)
+    for _ in range(args.cold_iterations):
+        await control(target.reset(history_days=_HISTORY_DAYS))
+        iteration = await _drive(client, _TODAY_PATH, 1, 1)
+        samples.latencies.extend(iteration.latencies)
+        samples.errors += iteration.errors
+        samples.elapsed += iteration.elapsed
+        samples.llm_calls += target.llm.calls
+    return samples
+
+
+async def _thundering_herd(client, control, target: BenchmarkTarget, args) -> _Samples:
+    # every client arrives at the rollover together, before anyone has generated the new day's fact
+    await control(target.reset(history_days=_HISTORY_DAYS))
+    return await _drive(client, _TODAY_PATH, args.herd_size, args.herd_size)
+
+
+async def _recent_fan_out(client, control, target: BenchmarkTarget, args) -> _Samples:
+    # without today's fact the list is not final, so every request goes through to storage
+    await control(target.reset(history_days=_HISTORY_DAYS))
+    return await _drive(client, _RECENT_PATH, args.requests, args.concurrency)
+
+
+# control runs a coroutine on the loop that serves the app
+_Control = Callable[[Awaitable[Any]], Awaitable[Any]]
+
+_Scenario = Callable[[httpx.AsyncClient, _Control, BenchmarkTarget, argparse.Namespace], Awaitable[_Samples]]
+
+SCENARIOS: dict[str, _Scenario] = {
+    "warm_today": _warm_today,
+    "warm_recent": _warm_recent,
+    "cold_today": _cold_today,
+    "thundering_herd": _thundering_herd,
+    "recent_fan_out": _recent_fan_out,
+}
+
+
+async def _run_directly(coro: Awaitable[Any]) -> Any:
+    return await coro
+
+
+@asynccontextmanager
+async def _client_for(
+    transport: str, target: BenchmarkTarget, concurrency: int
+) -> AsyncIterator[tuple[httpx.AsyncClient, _Control]]:
+    if transport == "inprocess":
+        asgi_transport = httpx.ASGITransport(app=target.app)
+        async with httpx.AsyncClient(
+            transport=asgi_transport, base_url="http://benchmark", timeout=_CLIENT_TIMEOUT
+        ) as client:
+            yield client, _run_directly
+        await target.close()
+        return
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    # the server gets its own thread and loop so that the load generator does not compete with it
+    server = uvicorn.Server(uvicorn.Config(
+        target.app, host="127.0.0.1", port=port, lifespan="off", log_config=None, access_log=False
+    ))
+    server_thread = _ServerThread(server)
+    server_thread.start()
+    while not server.started:
+        if not server_thread.is_alive():
+            raise RuntimeError("benchmark server failed to start")
+        await asyncio.sleep(0.01)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=_CLIENT_TIMEOUT) as client:
+            yield client, server_thread.call
+        await server_thread.call(target.close())
+    finally:
+        server.should_exit = True
+        await asyncio.to_thread(server_thread.join)
+
+
+async def run_benchmarks(args: argparse.Namespace) -> list[ScenarioResult]:
+    results = []
+    for transport in args.transports:
+        target = BenchmarkTarget(args.backend, args.redis_url, args.llm_latency)
+        async with _client_for(transport, target, max(args.concurrency, args.herd_size)) as (client, control):
+            for name in args.scenarios:
+                samples = await SCENARIOS[name](client, control, target, args)
+                llm_calls = target.llm.calls if samples.llm_calls is None else samples.llm_calls
+                results.append(_summarize(name, transport, samples, llm_calls))
+    return results
+
+
+def _summarize(scenario: str, transport: str, samples: _Samples, llm_calls: int) -> ScenarioResult:
+    return ScenarioResult(
+        scenario=scenario,
+        transport=transport,
+        requests=len(samples.latencies),
+        errors=samples.errors,
+        p50_ms=round(percentile(samples.latencies, 50) * 1000, 3),
+        p95_ms=round(percentile(samples.latencies, 95) * 1000, 3),
+        p99_ms=round(percentile(samples.latencies, 99) * 1000, 3),
+        throughput_rps=round(len(samples.latencies) / samples.elapsed, 1) if samples.elapsed else 0.0,
+        llm_calls=llm_calls,
+    )
+
+
+def find_regressions(results: list[ScenarioResult], thresholds: dict) -> list[str]:
+    regressions = []
+    for result in results:
+        # "<scenario>:<transport>" overrides the thresholds shared by both transports
+        limits = thresholds.get(f"{result.scenario}:{result.transport}", thresholds.get(result.scenario, {}))
+        label = f"{result.scenario} ({result.transport})"
+
+        if result.errors > limits.get("max_errors", 0):
+            regressions.append(f"{label}: {result.errors} failed requests")
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            if metric in limits and getattr(result, metric) > limits[metric]:
+                regressions.append(f"{label}: {metric} {getattr(result, metric)} > {limits[metric]}")
+        if "min_throughput_rps" in limits and result.throughput_rps < limits["min_throughput_rps"]:
+            regressions.append(f"{label}: throughput {result.throughput_rps} rps < {limits['min_throughput_rps']}")
+        if "max_llm_calls" in limits and result.llm_calls > limits["max_llm_calls"]:
+            regressions.append(f"{label}: {result.llm_calls} LLM calls > {limits['max_llm_calls']}")
+    return regressions
+
+
+def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the /today and /recent paths of the fun fact API.")
+    parser.add_argument("--scenario", dest="scenarios", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run, may be repeated (default: all)")
+    parser.add_argument("--transport", dest="transports", action="append", choices=_TRANSPORTS,
+                        help="drive the app in-process or over a uvicorn socket, may be repeated (default: both)")
+    parser.add_argument("--backend", choices=("redis", "sqlite"), default="redis", help="cache adapter to benchmark")
+    parser.add_argument("--redis-url", help="benchmark against this Redis instead of fakeredis; its database is flushed")
+    parser.add_argument("--llm-latency", type=float, default=0.1, help="seconds the fake LLM takes per call")
+    parser.add_argument("--requests", type=int, default=2000, help="requests per warm and fan-out scenario")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--cold-iterations", type=int, default=20, help="cold-day misses to sample")
+    parser.add_argument("--herd-size", type=int, default=200, help="concurrent clients at the midnight rollover")
+    parser.add_argument("--thresholds", default=_DEFAULT_THRESHOLDS, help="JSON file of regression thresholds")
+    parser.add_argument("--no-thresholds", action="store_true", help="report results without checking thresholds")
+    parser.add_argument("--output", help="write the JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+    args.scenarios = args.scenarios or list(SCENARIOS)
+    args.transports = args.transports or list(_TRANSPORTS)
+    return args
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = _parse_args(argv)
+    # per-request logging would dominate the measurements
+    logger.setLevel(logging.WARNING)
+    results = asyncio.run(run_benchmarks(args))
+
+    regressions = []
+    if not args.no_thresholds:
+        with open(args.thresholds) as thresholds_file:
+            regressions = find_regressions(results, json.load(thresholds_file))
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backend": args.backend,
+            "redis": "external" if args.redis_url else "fakeredis",
+            "llm_latency_seconds": args.llm_latency,
+        },
+        "results": [asdict(result) for result in results],
+        "regressions": regressions,
+    }
+    encoded = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(encoded + "\n")
+    else:
+        print(encoded)
+
+    for regression in regressions:
+        print(f"REGRESSION: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
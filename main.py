@@ -1,15 +1,118 @@
+import asyncio
+import math
+import os
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Callable
+
 from fastapi import FastAPI
 import uvicorn
 
 from app.adapter.api.v1 import router as fun_fact_router
+from app.adapter.diagnostics import SamplingProfiler, ServerTimingMiddleware, SlowRequestProfilerMiddleware
+from app.adapter.metrics import RequestMetricsMiddleware, metrics_router, reset_multiprocess_dir
+from app.adapter.push import close_fun_fact_broadcaster
+from app.adapter.ratelimit import close_rate_limiter
+from app.adapter.scheduler import create_daily_fun_fact_scheduler, create_fun_fact_pool_refiller
+from app.adapter.snapshot import find_snapshot_exporter
+from app.domain.service import (
+    DailyFunFactService,
+    close_daily_fun_fact_service,
+    get_daily_fun_fact_service,
+    warm_up_cache_adapter,
+)
+from app.util import logger
+
+
+_scheduler_enabled = os.getenv("FUN_FACT_SCHEDULER_ENABLED", "true").lower() == "true"
+_server_timing_enabled = os.getenv("SERVER_TIMING_ENABLED", "true").lower() == "true"
+_slow_request_profile_dir = os.getenv("SLOW_REQUEST_PROFILE_DIR")
+_slow_request_threshold = float(os.getenv("SLOW_REQUEST_THRESHOLD_SECONDS", "1.0"))
+_profiler_sample_interval = float(os.getenv("PROFILER_SAMPLE_INTERVAL_SECONDS", "0.005"))
+_warm_up_enabled = os.getenv("FUN_FACT_WARM_UP_ENABLED", "true").lower() == "true"
+_warm_up_timeout = float(os.getenv("FUN_FACT_WARM_UP_TIMEOUT_SECONDS", "30"))
+_warm_up_connections = int(os.getenv("CACHE_WARM_UP_CONNECTIONS", "10"))
+_WARM_UP_RECENT_COUNT = 10  # the size of /recent
+_DEFAULT_KEEP_ALIVE_SECONDS = 75  # longer than the idle timeout of common load balancers, which close first
+_CGROUP_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+
+async def _warm_up(service: DailyFunFactService):
+    try:
+        async with asyncio.timeout(_warm_up_timeout):
+            await warm_up_cache_adapter(_warm_up_connections)
+            await service.warm_up(_WARM_UP_RECENT_COUNT)
+    except Exception as e:
+        # a cold worker is still better than none, requests retry whatever failed here
+        logger.warning(f"Warm-up failed, starting cold: {e!r}")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    service = get_daily_fun_fact_service()
+    if _warm_up_enabled:
+        await _warm_up(service)
 
-def create_app() -> FastAPI:
-    app = FastAPI(title="Daily Fun Fact API")
+    background_tasks = [create_daily_fun_fact_scheduler(), create_fun_fact_pool_refiller()] if _scheduler_enabled else []
+    if snapshot_exporter := find_snapshot_exporter():
+        # every process, so that today's files appear even if the one holding the pre-generated fact restarted
+        background_tasks.append(snapshot_exporter)
+    for background_task in background_tasks:
+        background_task.start()
+    yield
+    for background_task in background_tasks:
+        await background_task.stop()
+    if profiler := getattr(app.state, "profiler", None):
+        profiler.stop()
+    await close_fun_fact_broadcaster()
+    await close_daily_fun_fact_service()
+    await close_rate_limiter()
+
+def create_app(lifespan_context: Callable[[FastAPI], AbstractAsyncContextManager] = lifespan) -> FastAPI:
+    app = FastAPI(title="Daily Fun Fact API", lifespan=lifespan_context)
     app.include_router(fun_fact_router, tags=["fun facts"])
+    app.include_router(metrics_router)
+    app.add_middleware(RequestMetricsMiddleware)
+    if _server_timing_enabled:
+        app.add_middleware(ServerTimingMiddleware)
+    if _slow_request_profile_dir:
+        app.state.profiler = SamplingProfiler(interval=_profiler_sample_interval)
+        app.add_middleware(
+            SlowRequestProfilerMiddleware,
+            profiler=app.state.profiler,
+            directory=_slow_request_profile_dir,
+            threshold=_slow_request_threshold,
+        )
     return app
 
 app = create_app()
 
+def _available_cpus() -> int:
+    # os.cpu_count() is the host's; a container is limited by its CPU affinity and its cgroup quota
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    try:
+        with open(_CGROUP_CPU_MAX) as cpu_max:
+            quota, period = cpu_max.read().split()[:2]
+        if quota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+def _server_options() -> dict:
+    options = {"host": os.getenv("HOST", "0.0.0.0"), "port": int(os.getenv("PORT", "8000"))}
+    if os.getenv("SERVER_MODE", "production").lower() == "development":
+        # reload restarts a single process on changes, it ignores workers
+        return {**options, "reload": True}
+
+    return {
+        **options,
+        "workers": int(os.getenv("WEB_CONCURRENCY") or _available_cpus()),
+        "loop": os.getenv("SERVER_LOOP", "uvloop"),
+        "http": os.getenv("SERVER_HTTP", "httptools"),
+        "backlog": int(os.getenv("SERVER_BACKLOG", "2048")),
+        "timeout_keep_alive": int(os.getenv("SERVER_KEEP_ALIVE_SECONDS", str(_DEFAULT_KEEP_ALIVE_SECONDS))),
+        # on SIGTERM workers stop accepting connections and let in-flight requests finish for this long
+        "timeout_graceful_shutdown": int(os.getenv("SERVER_GRACEFUL_SHUTDOWN_SECONDS", "25")),
+    }
+
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True, workers=3)
+    reset_multiprocess_dir()
+    uvicorn.run("main:app", **_server_options())
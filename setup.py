@@ -7,8 +7,12 @@ setup(
     install_requires=[
         "fastapi",
         "uvicorn",
+        "uvloop; sys_platform != 'win32'",
+        "httptools",
         "redis",
         "mistralai",
+        "numpy",
+        "prometheus-client",
         "pydantic",
         "python-dateutil",
         "PyYAML",
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from datetime import date
 from unittest.mock import AsyncMock
@@ -5,7 +6,44 @@ from unittest.mock import AsyncMock
 from fakeredis import FakeAsyncRedis
 
 from app.domain.model import DailyFunFact
-from app.domain.port import LlmPort, DailyFunFactCachePort
+from app.domain.port import LlmPort, DailyFunFactCachePort, FunFactPoolPort
+
+
+class FakeLlmPort(LlmPort):
+
+    def __init__(
+        self,
+        latencies: list[float] | None = None,
+        failures: int = 0,
+        response: str = "A fake fun fact.",
+        chunk_latency: float = 0,
+    ):
+        self.latencies = list(latencies or [])
+        self.failures = failures
+        self.response = response
+        self.chunk_latency = chunk_latency
+        self.calls = 0
+        self.open_streams = 0
+
+    async def chat(self, prompt: str, max_tokens: int | None = None) -> str:
+        self.calls += 1
+        if self.latencies:
+            await asyncio.sleep(self.latencies.pop(0))
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("LLM unavailable")
+        return self.response
+
+    async def stream_chat(self, prompt: str):
+        # stands in for the HTTP response a real stream holds open until it is closed
+        self.open_streams += 1
+        try:
+            response = await self.chat(prompt)
+            for index, word in enumerate(response.split(" ")):
+                await asyncio.sleep(self.chunk_latency if index else 0)
+                yield word if index == 0 else f" {word}"
+        finally:
+            self.open_streams -= 1
 
 
 @pytest.fixture
@@ -32,6 +70,11 @@ def sample_fun_facts() -> list[DailyFunFact]:
     ]
 
 
+@pytest.fixture
+def fake_llm_port_factory() -> type[FakeLlmPort]:
+    return FakeLlmPort
+
+
 @pytest.fixture
 def mock_llm_port() -> AsyncMock:
     mock = AsyncMock(spec=LlmPort)
@@ -47,6 +90,7 @@ def mock_cache_port() -> AsyncMock:
     mock.acquire_lock.return_value = True
     mock.store.return_value = None
     mock.release_lock.return_value = None
+    mock.wait_for_store.return_value = None
     return mock
 
 
@@ -58,4 +102,16 @@ def mock_cache_port_with_data(sample_fun_facts) -> AsyncMock:
     mock.acquire_lock.return_value = True
     mock.store.return_value = None
     mock.release_lock.return_value = None
+    mock.wait_for_store.return_value = None
+    return mock
+
+
+@pytest.fixture
+def mock_pool_port() -> AsyncMock:
+    mock = AsyncMock(spec=FunFactPoolPort)
+    mock.pop.return_value = None
+    mock.size.return_value = 0
+    mock.push_many.side_effect = lambda facts: len(facts)
+    mock.acquire_refill_lock.return_value = True
+    mock.release_refill_lock.return_value = None
     return mock
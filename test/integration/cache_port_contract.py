@@ -0,0 +1,255 @@
+import pytest
+from datetime import date, timedelta
+
+from app.domain.model import DailyFunFact
+
+
+class DailyFunFactCachePortContract:
+    """Behaviour every DailyFunFactCachePort must have.
+
+    Subclasses provide two adapters over the same storage as the `cache_port` and `other_cache_port` fixtures.
+    """
+
+    @pytest.mark.asyncio
+    async def test_store_and_get_fun_fact(self, cache_port, sample_fun_fact):
+        # Act
+        await cache_port.store(sample_fun_fact)
+        result = await cache_port.get(sample_fun_fact.date)
+
+        # Assert
+        assert result == sample_fun_fact
+
+    @pytest.mark.asyncio
+    async def test_get_non_existent_fun_fact(self, cache_port):
+        # Act
+        result = await cache_port.get(date(2024, 1, 1))
+
+        # Assert
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_store_multiple_fun_facts(self, cache_port, sample_fun_facts):
+        # Setup
+        for fact in sample_fun_facts:
+            await cache_port.store(fact)
+
+        # Assert
+        for fact in sample_fun_facts:
+            result = await cache_port.get(fact.date)
+            assert result == fact
+
+    @pytest.mark.asyncio
+    async def test_get_last_n_fun_facts(self, cache_port, sample_fun_facts):
+        # Setup
+        for fact in sample_fun_facts:
+            await cache_port.store(fact)
+
+        # Act
+        result = await cache_port.get_last_n(3)
+
+        # Assert
+        assert len(result) == 3
+        assert result[0].date == sample_fun_facts[0].date
+        assert result[1].date == sample_fun_facts[1].date
+        assert result[2].date == sample_fun_facts[2].date
+
+    @pytest.mark.asyncio
+    async def test_get_last_n_with_insufficient_facts(self, cache_port, sample_fun_facts):
+        # Setup
+        for fact in sample_fun_facts[:2]:
+            await cache_port.store(fact)
+
+        # Act
+        result = await cache_port.get_last_n(5)
+
+        # Assert
+        assert len(result) == 2
+        assert result[0].date == sample_fun_facts[0].date
+        assert result[1].date == sample_fun_facts[1].date
+
+    @pytest.mark.asyncio
+    async def test_get_last_n_with_no_facts(self, cache_port):
+        # Act
+        result = await cache_port.get_last_n(5)
+
+        # Assert
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_lock_acquire_and_release(self, cache_port):
+        test_date = date(2024, 1, 15)
+
+        # Act
+        acquired1 = await cache_port.acquire_lock(test_date)
+        acquired2 = await cache_port.acquire_lock(test_date)
+        await cache_port.release_lock(test_date)
+        acquired3 = await cache_port.acquire_lock(test_date) 
+
+        # Assert
+        assert acquired1 is True
+        assert acquired2 is False
+        assert acquired3 is True
+
+    @pytest.mark.asyncio
+    async def test_lock_expiration(self, cache_port):
+        test_date = date(2024, 1, 15)
+
+        # Act
+        acquired1 = await cache_port.acquire_lock(test_date, ttl=1)  
+        acquired2 = await cache_port.acquire_lock(test_date)
+
+        import asyncio
+        await asyncio.sleep(1.1)
+
+        acquired3 = await cache_port.acquire_lock(test_date) 
+
+        # Assert
+        assert acquired1 is True
+        assert acquired2 is False
+        assert acquired3 is True
+
+    @pytest.mark.asyncio
+    async def test_wait_for_store_returns_published_fact(self, cache_port, sample_fun_fact):
+        import asyncio
+
+        # Act
+        waiter = asyncio.create_task(cache_port.wait_for_store(sample_fun_fact.date, timeout=5))
+        await asyncio.sleep(0.1)
+        await cache_port.store(sample_fun_fact)
+        result = await waiter
+
+        # Assert
+        assert result == sample_fun_fact
+
+    @pytest.mark.asyncio
+    async def test_wait_for_store_returns_already_stored_fact(self, cache_port, sample_fun_fact):
+        # Setup
+        await cache_port.store(sample_fun_fact)
+
+        # Act
+        result = await cache_port.wait_for_store(sample_fun_fact.date, timeout=5)
+
+        # Assert
+        assert result == sample_fun_fact
+
+    @pytest.mark.asyncio
+    async def test_wait_for_store_times_out(self, cache_port):
+        # Act
+        result = await cache_port.wait_for_store(date(2024, 1, 1), timeout=0.2)
+
+        # Assert
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_get_last_n_hides_future_facts(self, cache_port, sample_fun_fact):
+        # Setup
+        tomorrow = DailyFunFact(date=date.today() + timedelta(days=1), fact="Pre-generated fact.")
+        await cache_port.store(sample_fun_fact)
+        await cache_port.store(tomorrow)
+
+        # Act
+        result = await cache_port.get_last_n(5)
+
+        # Assert
+        assert result == [sample_fun_fact]
+
+    @pytest.mark.asyncio
+    async def test_get_range(self, cache_port, sample_fun_facts):
+        # Setup
+        for fact in sample_fun_facts:
+            await cache_port.store(fact)
+
+        # Act
+        result = await cache_port.get_range(date(2024, 1, 12), date(2024, 1, 15), 2)
+
+        # Assert
+        assert [fact.date for fact in result] == [date(2024, 1, 12), date(2024, 1, 13)]
+
+    @pytest.mark.asyncio
+    async def test_get_many(self, cache_port, sample_fun_facts):
+        # Setup
+        for fact in sample_fun_facts[:2]:
+            await cache_port.store(fact)
+
+        # Act
+        result = await cache_port.get_many([sample_fun_facts[1].date, date(2024, 1, 1), sample_fun_facts[0].date])
+
+        # Assert
+        assert result == [sample_fun_facts[1], sample_fun_facts[0]]
+
+    @pytest.mark.asyncio
+    async def test_repeated_fact_keeps_both_dates(self, cache_port):
+        # Setup
+        first = DailyFunFact(date=date(2024, 1, 14), fact="Same fact.")
+        second = DailyFunFact(date=date(2024, 1, 15), fact="Same fact.")
+
+        # Act
+        await cache_port.store(first)
+        await cache_port.store(second)
+
+        # Assert
+        assert await cache_port.get(first.date) == first
+        assert await cache_port.get(second.date) == second
+
+    @pytest.mark.asyncio
+    async def test_release_does_not_delete_lock_of_new_owner(self, cache_port, other_cache_port):
+        import asyncio
+        test_date = date(2024, 1, 15)
+
+        # Setup
+        await cache_port.acquire_lock(test_date, ttl=1)
+        await asyncio.sleep(1.1)
+        acquired_by_other = await other_cache_port.acquire_lock(test_date)
+
+        # Act
+        await cache_port.release_lock(test_date)
+        acquired_again = await cache_port.acquire_lock(test_date)
+
+        # Assert
+        assert acquired_by_other is True
+        assert acquired_again is False
+
+    @pytest.mark.asyncio
+    async def test_store_after_losing_lock_is_rejected(self, cache_port, other_cache_port, sample_fun_fact):
+        import asyncio
+        from app.domain.port import LockLostError
+
+        # Setup
+        await cache_port.acquire_lock(sample_fun_fact.date, ttl=1)
+        await asyncio.sleep(1.1)
+        await other_cache_port.acquire_lock(sample_fun_fact.date)
+
+        # Act & Assert
+        with pytest.raises(LockLostError):
+            await cache_port.store(sample_fun_fact)
+        assert await cache_port.get(sample_fun_fact.date) is None
+
+    @pytest.mark.asyncio
+    async def test_store_by_lock_holder(self, cache_port, sample_fun_fact):
+        # Setup
+        await cache_port.acquire_lock(sample_fun_fact.date)
+
+        # Act
+        await cache_port.store(sample_fun_fact)
+
+        # Assert
+        assert await cache_port.get(sample_fun_fact.date) == sample_fun_fact
+
+    @pytest.mark.asyncio
+    async def test_renewed_lock_outlives_its_original_ttl(self, cache_port, other_cache_port):
+        import asyncio
+        test_date = date(2024, 1, 15)
+
+        # Setup
+        await cache_port.acquire_lock(test_date, ttl=1)
+
+        # Act
+        renewed = await cache_port.renew_lock(test_date, ttl=30)
+        renewed_by_other = await other_cache_port.renew_lock(test_date, ttl=30)
+        await asyncio.sleep(1.1)
+        acquired_by_other = await other_cache_port.acquire_lock(test_date)
+
+        # Assert
+        assert renewed is True
+        assert renewed_by_other is False
+        assert acquired_by_other is False
@@ -1,18 +1,28 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch, AsyncMock
 from datetime import date
+from ipaddress import ip_network
 
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from main import create_app
+from app.adapter.api.v1 import clear_cached_representations
+from app.adapter.ratelimit import RateLimit
 from app.domain.model import DailyFunFact
 
 
 @pytest.mark.integration
 class TestFunFactAPIRouter:
 
+    @pytest.fixture(autouse=True)
+    def clear_validators(self):
+        clear_cached_representations()
+
     @pytest.fixture
     def client(self):
         app = create_app()
@@ -155,3 +165,333 @@ class TestFunFactAPIRouter:
             assert isinstance(item["date"], str)
             assert isinstance(item["fact"], str)
 
+
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_get_todays_fun_fact_sets_cache_headers(self, mock_service, client):
+        # Setup
+        mock_service.get_todays_fun_fact = AsyncMock(return_value=DailyFunFact(date.today(), "Today's fact."))
+
+        # Act
+        response = client.get("/v1/fun-facts/today")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert "last-modified" in response.headers
+        assert response.headers["cache-control"].startswith("public, max-age=")
+
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_get_todays_fun_fact_etag_is_deterministic(self, mock_service, client):
+        # Setup
+        mock_service.get_todays_fun_fact = AsyncMock(return_value=DailyFunFact(date.today(), "Today's fact."))
+
+        # Act
+        etag1 = client.get("/v1/fun-facts/today").headers["etag"]
+        clear_cached_representations()
+        etag2 = client.get("/v1/fun-facts/today").headers["etag"]
+
+        # Assert
+        assert etag1 == etag2
+
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_get_todays_fun_fact_not_modified_skips_service(self, mock_service, client):
+        # Setup
+        mock_service.get_todays_fun_fact = AsyncMock(return_value=DailyFunFact(date.today(), "Today's fact."))
+        etag = client.get("/v1/fun-facts/today").headers["etag"]
+
+        # Act
+        response = client.get("/v1/fun-facts/today", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        mock_service.get_todays_fun_fact.assert_called_once()
+
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_get_recent_fun_facts_not_modified(self, mock_service, client, sample_fun_facts):
+        # Setup
+        mock_service.get_last_n_fun_facts = AsyncMock(return_value=sample_fun_facts)
+        etag = client.get("/v1/fun-facts/recent").headers["etag"]
+
+        # Act
+        response = client.get("/v1/fun-facts/recent", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == 304
+        assert response.headers["cache-control"] == "no-cache"
+
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_get_todays_fun_fact_served_from_encoded_cache(self, mock_service, client):
+        # Setup
+        mock_service.get_todays_fun_fact = AsyncMock(return_value=DailyFunFact(date.today(), "Today's fact – ünïcode."))
+
+        # Act
+        response1 = client.get("/v1/fun-facts/today")
+        response2 = client.get("/v1/fun-facts/today")
+
+        # Assert
+        assert response1.content == response2.content
+        assert response2.json() == {"date": date.today().isoformat(), "fact": "Today's fact – ünïcode."}
+        assert response2.headers["content-type"] == "application/json"
+        mock_service.get_todays_fun_fact.assert_called_once()
+
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_get_fun_facts_page(self, mock_service, client, sample_fun_facts):
+        # Setup
+        mock_service.get_fun_facts_page = AsyncMock(return_value=(sample_fun_facts[:2], date(2024, 1, 13)))
+
+        # Act
+        response = client.get("/v1/fun-facts", params={"from": "2024-01-01", "to": "2024-01-31", "limit": 2})
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["date"] for item in data["items"]] == ["2024-01-15", "2024-01-14"]
+        assert data["next_cursor"] == "2024-01-13"
+        mock_service.get_fun_facts_page.assert_called_once_with(date(2024, 1, 1), date(2024, 1, 31), 2)
+
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_get_fun_facts_cursor_overrides_from(self, mock_service, client):
+        # Setup
+        mock_service.get_fun_facts_page = AsyncMock(return_value=([], None))
+
+        # Act
+        response = client.get("/v1/fun-facts", params={"from": "2024-01-01", "to": "2024-01-31", "cursor": "2024-01-13"})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"items": [], "next_cursor": None}
+        mock_service.get_fun_facts_page.assert_called_once_with(date(2024, 1, 13), date(2024, 1, 31), 100)
+
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_get_fun_facts_limit_too_large(self, mock_service, client):
+        # Act
+        response = client.get("/v1/fun-facts", params={"limit": 5000})
+
+        # Assert
+        assert response.status_code == 422
+
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_get_fun_facts_ndjson_stream(self, mock_service, client, sample_fun_facts):
+        # Setup
+        async def pages(*args):
+            yield sample_fun_facts[:2]
+            yield sample_fun_facts[2:]
+
+        mock_service.iter_fun_fact_pages = pages
+
+        # Act
+        response = client.get("/v1/fun-facts", headers={"Accept": "application/x-ndjson"})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = response.text.splitlines()
+        assert len(lines) == len(sample_fun_facts)
+        assert lines[0] == '{"date":"2024-01-15","fact":"The human brain contains approximately 86 billion neurons."}'
+
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_get_fun_facts_batch(self, mock_service, client, sample_fun_facts):
+        # Setup
+        mock_service.get_fun_facts_by_date = AsyncMock(return_value=(sample_fun_facts[:1], [date(2020, 1, 1)]))
+
+        # Act
+        response = client.post("/v1/fun-facts/batch", json={"dates": ["2024-01-15", "2020-01-01"]})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {
+            "found": [{"date": "2024-01-15", "fact": "The human brain contains approximately 86 billion neurons."}],
+            "missing": ["2020-01-01"],
+        }
+        mock_service.get_fun_facts_by_date.assert_called_once_with([date(2024, 1, 15), date(2020, 1, 1)])
+
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_get_fun_facts_batch_rejects_empty(self, mock_service, client):
+        # Act
+        response = client.post("/v1/fun-facts/batch", json={"dates": []})
+
+        # Assert
+        assert response.status_code == 422
+
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_stream_todays_fun_fact(self, mock_service, client, sample_fun_fact):
+        # Setup
+        async def chunks():
+            yield "The human brain"
+            yield " contains approximately 86 billion neurons."
+
+        mock_service.stream_todays_fun_fact = chunks
+        mock_service.get_todays_fun_fact = AsyncMock(return_value=sample_fun_fact)
+
+        # Act
+        response = client.get("/v1/fun-facts/today/stream")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text == (
+            'event: token\ndata: {"token":"The human brain"}\n\n'
+            'event: token\ndata: {"token":" contains approximately 86 billion neurons."}\n\n'
+            'event: fact\ndata: {"date":"2024-01-15","fact":"The human brain contains approximately 86 billion neurons."}\n\n'
+        )
+
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_stream_todays_fun_fact_error(self, mock_service, client):
+        # Setup
+        async def chunks():
+            raise Exception("LLM error")
+            yield
+
+        mock_service.stream_todays_fun_fact = chunks
+
+        # Act
+        response = client.get("/v1/fun-facts/today/stream")
+
+        # Assert
+        assert response.text == 'event: error\ndata: {"detail":"Fun fact could not be generated"}\n\n'
+
+    @patch('app.domain.service._category_fun_fact_service_instance')
+    def test_get_todays_category_fun_fact(self, mock_service, client):
+        # Setup
+        mock_service.categories = ["science", "history"]
+        mock_service.get_todays_fun_fact = AsyncMock(return_value=DailyFunFact(date.today(), "Atoms."))
+
+        # Act
+        response = client.get("/v1/fun-facts/Science/today")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"date": date.today().isoformat(), "fact": "Atoms."}
+        mock_service.get_todays_fun_fact.assert_called_once_with("science")
+
+    @patch('app.domain.service._category_fun_fact_service_instance')
+    def test_get_todays_category_fun_fact_unknown_category(self, mock_service, client):
+        # Setup
+        mock_service.categories = ["science", "history"]
+        mock_service.get_todays_fun_fact = AsyncMock()
+
+        # Act
+        response = client.get("/v1/fun-facts/sports/today")
+
+        # Assert
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Unknown category"
+        mock_service.get_todays_fun_fact.assert_not_called()
+
+    @patch('app.adapter.ratelimit.rate_limit_dependency._rate_limiter_instance')
+    @patch('app.adapter.ratelimit.rate_limit_dependency._rate_limiting_enabled', return_value=True)
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_rate_limited_request_gets_429(self, mock_service, _, mock_limiter, client):
+        # Setup
+        mock_limiter.acquire = AsyncMock(return_value=2.5)
+        mock_service.get_todays_fun_fact = AsyncMock()
+
+        # Act
+        response = client.get("/v1/fun-facts/today")
+
+        # Assert
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "3"
+        mock_limiter.acquire.assert_called_once_with("/v1/fun-facts/today:testclient", RateLimit(120, 60))
+        mock_service.get_todays_fun_fact.assert_not_called()
+
+    @patch('app.adapter.ratelimit.rate_limit_dependency._rate_limiter_instance')
+    @patch('app.adapter.ratelimit.rate_limit_dependency._rate_limiting_enabled', return_value=True)
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_rate_limit_budgets_are_per_route(self, mock_service, _, mock_limiter, client, sample_fun_facts):
+        # Setup
+        mock_limiter.acquire = AsyncMock(return_value=0.0)
+        mock_service.get_fun_facts_by_date = AsyncMock(return_value=(sample_fun_facts, []))
+
+        # Act
+        response = client.post("/v1/fun-facts/batch", json={"dates": ["2024-01-15"]})
+
+        # Assert
+        assert response.status_code == 200
+        mock_limiter.acquire.assert_called_once_with("/v1/fun-facts/batch:testclient", RateLimit(30, 60))
+
+    @patch('app.adapter.ratelimit.rate_limit_dependency._rate_limiter_instance')
+    @patch('app.adapter.ratelimit.rate_limit_dependency._rate_limiting_enabled', return_value=True)
+    @patch('app.adapter.ratelimit.rate_limit_dependency._trusted_proxies_instance', [ip_network("10.0.0.0/8")])
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_rate_limit_keys_clients_behind_trusted_proxy(self, mock_service, _, mock_limiter, sample_fun_fact):
+        # Setup
+        mock_limiter.acquire = AsyncMock(return_value=0.0)
+        mock_service.get_todays_fun_fact = AsyncMock(return_value=sample_fun_fact)
+        client = TestClient(create_app(), client=("10.0.0.2", 50000))
+
+        # Act
+        response = client.get("/v1/fun-facts/today", headers={"X-Forwarded-For": "6.6.6.6, 203.0.113.7, 10.0.0.1"})
+
+        # Assert
+        assert response.status_code == 200
+        mock_limiter.acquire.assert_called_once_with("/v1/fun-facts/today:203.0.113.7", RateLimit(120, 60))
+
+    @patch('app.adapter.ratelimit.rate_limit_dependency._rate_limiter_instance')
+    @patch('app.adapter.ratelimit.rate_limit_dependency._rate_limiting_enabled', return_value=True)
+    @patch('app.adapter.ratelimit.rate_limit_dependency._trusted_proxies_instance', [ip_network("10.0.0.0/8")])
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_rate_limit_ignores_forwarded_for_from_untrusted_peer(self, mock_service, _, mock_limiter, sample_fun_fact):
+        # Setup
+        mock_limiter.acquire = AsyncMock(return_value=0.0)
+        mock_service.get_todays_fun_fact = AsyncMock(return_value=sample_fun_fact)
+        client = TestClient(create_app(), client=("198.51.100.4", 50000))
+
+        # Act
+        response = client.get("/v1/fun-facts/today", headers={"X-Forwarded-For": "203.0.113.7"})
+
+        # Assert
+        assert response.status_code == 200
+        mock_limiter.acquire.assert_called_once_with("/v1/fun-facts/today:198.51.100.4", RateLimit(120, 60))
+
+    def test_subscribe_needs_redis_as_authoritative_tier(self, client, monkeypatch):
+        # Setup
+        monkeypatch.setenv("FUN_FACT_CACHE_TIERS", "memory,sqlite")
+
+        # Act
+        with patch('app.adapter.push.FunFactBroadcaster') as broadcaster_class:
+            response = client.get("/v1/fun-facts/subscribe")
+
+        # Assert
+        assert response.status_code == 503
+        broadcaster_class.assert_not_called()
+
+    @patch('app.adapter.push._fun_fact_broadcaster_instance')
+    def test_subscribe_pushes_new_fun_facts(self, mock_broadcaster, client, sample_fun_fact):
+        # Setup
+        @asynccontextmanager
+        async def subscribe():
+            facts = asyncio.Queue()
+            facts.put_nowait(sample_fun_fact)
+            facts.put_nowait(None)
+            yield facts
+
+        mock_broadcaster.subscribe = subscribe
+
+        # Act
+        response = client.get("/v1/fun-facts/subscribe")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text == (
+            'retry: 5000\n\n'
+            'event: fact\ndata: {"date":"2024-01-15","fact":"The human brain contains approximately 86 billion neurons."}\n\n'
+        )
+
+    @patch('app.domain.service._daily_fun_fact_service_instance')
+    def test_metrics_exposes_route_latency_and_handler_errors(self, mock_service):
+        # Setup
+        client = TestClient(create_app(), raise_server_exceptions=False)
+        mock_service.get_todays_fun_fact = AsyncMock(side_effect=ConnectionError("Redis unavailable"))
+        client.get("/v1/fun-facts/today")
+
+        # Act
+        response = client.get("/metrics")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'funfacts_http_request_seconds_count{method="GET",route="/v1/fun-facts/today",status="500"}' in response.text
+        assert 'funfacts_request_errors_total{error="ConnectionError",handler="get_todays_fun_fact"}' in response.text
@@ -0,0 +1,87 @@
+import pytest
+
+from benchmark.run import ScenarioResult, find_regressions, percentile, run_benchmarks, _parse_args
+
+
+def _result(**overrides) -> ScenarioResult:
+    fields = dict(
+        scenario="warm_today",
+        transport="inprocess",
+        requests=100,
+        errors=0,
+        p50_ms=1.0,
+        p95_ms=2.0,
+        p99_ms=3.0,
+        throughput_rps=1000.0,
+        llm_calls=1,
+    )
+    fields.update(overrides)
+    return ScenarioResult(**fields)
+
+
+@pytest.mark.integration
+class TestBenchmark:
+
+    def test_percentile_uses_nearest_rank(self):
+        # Setup
+        latencies = [float(value) for value in range(1, 101)]
+
+        # Act & Assert
+        assert percentile(latencies, 50) == 50.0
+        assert percentile(latencies, 99) == 99.0
+        assert percentile([], 99) == 0.0
+
+    def test_find_regressions_within_thresholds(self):
+        # Setup
+        thresholds = {"warm_today": {"p99_ms": 5, "min_throughput_rps": 500}}
+
+        # Act
+        regressions = find_regressions([_result()], thresholds)
+
+        # Assert
+        assert regressions == []
+
+    def test_find_regressions_reports_each_exceeded_threshold(self):
+        # Setup
+        thresholds = {"warm_today": {"p99_ms": 5, "min_throughput_rps": 500, "max_llm_calls": 1}}
+        result = _result(p99_ms=10.0, throughput_rps=100.0, llm_calls=3, errors=1)
+
+        # Act
+        regressions = find_regressions([result], thresholds)
+
+        # Assert
+        assert len(regressions) == 4
+
+    def test_find_regressions_prefers_transport_specific_thresholds(self):
+        # Setup
+        thresholds = {"warm_today": {"p99_ms": 5}, "warm_today:socket": {"p99_ms": 50}}
+        result = _result(transport="socket", p99_ms=10.0)
+
+        # Act
+        regressions = find_regressions([result], thresholds)
+
+        # Assert
+        assert regressions == []
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_run_benchmarks_in_process(self):
+        # Setup
+        args = _parse_args([
+            "--transport", "inprocess",
+            "--requests", "20",
+            "--concurrency", "4",
+            "--cold-iterations", "2",
+            "--herd-size", "10",
+            "--llm-latency", "0.01",
+        ])
+
+        # Act
+        results = await run_benchmarks(args)
+
+        # Assert
+        by_scenario = {result.scenario: result for result in results}
+        assert set(by_scenario) == set(args.scenarios)
+        assert all(result.errors == 0 for result in results)
+        assert by_scenario["thundering_herd"].llm_calls == 1
+        assert by_scenario["cold_today"].llm_calls == 2
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+from datetime import date
+
+from app.adapter.redis import CategoryFunFactRedisAdapter
+from app.domain.port import LockLostError
+
+
+@pytest.mark.integration
+class TestCategoryFunFactRedisAdapter:
+
+    @pytest.fixture
+    def categories(self):
+        return ["science", "history", "animals"]
+
+    @pytest.fixture
+    def category_adapter(self, fake_redis, categories):
+        adapter = CategoryFunFactRedisAdapter("redis://localhost:6379", categories)
+        adapter._client = fake_redis
+        return adapter
+
+    @pytest.fixture
+    def other_category_adapter(self, fake_redis, categories):
+        adapter = CategoryFunFactRedisAdapter("redis://localhost:6379", categories)
+        adapter._client = fake_redis
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_store_and_get_categories(self, category_adapter):
+        # Setup
+        facts = {"science": "Atoms.", "history": "Rome.", "animals": "Octopuses."}
+
+        # Act
+        await category_adapter.store_categories(date(2024, 1, 15), facts)
+        result = await category_adapter.get_categories(date(2024, 1, 15))
+
+        # Assert
+        assert result == facts
+        assert await category_adapter.get_categories(date(2024, 1, 14)) == {}
+
+    @pytest.mark.asyncio
+    async def test_each_category_has_its_own_namespace(self, category_adapter, fake_redis):
+        # Act
+        await category_adapter.store_categories(date(2024, 1, 15), {"science": "Atoms.", "history": "Rome."})
+
+        # Assert
+        ordinal = str(date(2024, 1, 15).toordinal())
+        assert await fake_redis.hget(CategoryFunFactRedisAdapter.facts_key("science"), ordinal) == "Atoms."
+        assert await fake_redis.hget(CategoryFunFactRedisAdapter.facts_key("history"), ordinal) == "Rome."
+        assert await fake_redis.zrange(CategoryFunFactRedisAdapter.index_key("history"), 0, -1) == [ordinal]
+        assert await fake_redis.exists("funfacts:facts") == 0
+
+    @pytest.mark.asyncio
+    async def test_store_after_losing_lock_stores_no_category(self, category_adapter, other_category_adapter):
+        # Setup
+        await category_adapter.acquire_lock(date(2024, 1, 15), ttl=1)
+        await asyncio.sleep(1.1)
+        await other_category_adapter.acquire_lock(date(2024, 1, 15))
+
+        # Act & Assert
+        with pytest.raises(LockLostError):
+            await category_adapter.store_categories(date(2024, 1, 15), {"science": "Atoms.", "history": "Rome."})
+        assert await category_adapter.get_categories(date(2024, 1, 15)) == {}
+
+    @pytest.mark.asyncio
+    async def test_lock_is_exclusive(self, category_adapter, other_category_adapter):
+        # Act
+        first = await category_adapter.acquire_lock(date(2024, 1, 15))
+        second = await other_category_adapter.acquire_lock(date(2024, 1, 15))
+        await category_adapter.release_lock(date(2024, 1, 15))
+        after_release = await other_category_adapter.acquire_lock(date(2024, 1, 15))
+
+        # Assert
+        assert (first, second, after_release) == (True, False, True)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_store_returns_published_facts(self, category_adapter, other_category_adapter):
+        # Setup
+        facts = {"science": "Atoms.", "history": "Rome.", "animals": "Octopuses."}
+
+        # Act
+        waiter = asyncio.create_task(category_adapter.wait_for_store(date(2024, 1, 15), timeout=5))
+        await asyncio.sleep(0.05)
+        await other_category_adapter.store_categories(date(2024, 1, 15), facts)
+        result = await waiter
+
+        # Assert
+        assert result == facts
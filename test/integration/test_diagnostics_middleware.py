@@ -0,0 +1,71 @@
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.adapter.diagnostics import SamplingProfiler, ServerTimingMiddleware, SlowRequestProfilerMiddleware
+from app.util import timed_phase
+
+
+def _busy_wait(seconds: float):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+@pytest.mark.integration
+class TestDiagnosticsMiddleware:
+
+    @pytest.fixture
+    def app(self):
+        app = FastAPI()
+
+        @app.get("/slow")
+        async def slow():
+            with timed_phase("cache"):
+                _busy_wait(0.01)
+            with timed_phase("llm"):
+                _busy_wait(0.1)
+            return {"ok": True}
+
+        @app.get("/fast")
+        async def fast():
+            return {"ok": True}
+
+        return app
+
+    def test_server_timing_reports_recorded_phases(self, app):
+        # Setup
+        app.add_middleware(ServerTimingMiddleware)
+        client = TestClient(app)
+
+        # Act
+        response = client.get("/slow")
+
+        # Assert
+        metrics = dict(metric.split(";dur=") for metric in response.headers["Server-Timing"].split(", "))
+        assert list(metrics) == ["cache", "llm", "total"]
+        assert float(metrics["llm"]) >= 100
+        assert float(metrics["total"]) >= float(metrics["cache"]) + float(metrics["llm"])
+
+    def test_slow_request_profile_is_written(self, app, tmp_path):
+        # Setup
+        profiler = SamplingProfiler(interval=0.001)
+        app.add_middleware(SlowRequestProfilerMiddleware, profiler=profiler, directory=str(tmp_path), threshold=0.05)
+        client = TestClient(app)
+
+        # Act
+        try:
+            client.get("/fast")
+            client.get("/slow")
+        finally:
+            profiler.stop()
+
+        # Assert
+        profiles = list(tmp_path.iterdir())
+        assert len(profiles) == 1
+        assert "-slow-" in profiles[0].name
+        lines = profiles[0].read_text().splitlines()
+        assert any("_busy_wait (test_diagnostics_middleware.py)" in line for line in lines)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from datetime import date, datetime
+
+from app.adapter.memory import FunFactMemoryAdapter
+from app.adapter.push import FunFactBroadcaster
+from app.adapter.redis.daily_fun_fact_redis_adapter import FunFactRedisAdapter
+from app.domain.model import DailyFunFact
+
+
+@pytest.mark.integration
+class TestFunFactBroadcaster:
+
+    @pytest.fixture
+    def clock(self):
+        class Clock:
+            now = datetime(2024, 1, 15, 12, 0)
+
+            def __call__(self):
+                return self.now
+
+        return Clock()
+
+    @pytest.fixture
+    def cache_port(self):
+        return FunFactMemoryAdapter()
+
+    @pytest_asyncio.fixture
+    async def broadcaster(self, fake_redis, cache_port, clock):
+        broadcaster = FunFactBroadcaster("redis://localhost:6379", cache_port, queue_size=2, clock=clock)
+        broadcaster._client = fake_redis
+        yield broadcaster
+        await broadcaster.close()
+
+    @pytest.fixture
+    def redis_adapter(self, fake_redis):
+        adapter = FunFactRedisAdapter("redis://localhost:6379")
+        adapter._client = fake_redis
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_pushes_stored_fact_to_every_subscriber(self, broadcaster, redis_adapter, sample_fun_fact):
+        # Setup
+        async with broadcaster.subscribe() as first, broadcaster.subscribe() as second:
+            await asyncio.sleep(0.05)
+
+            # Act
+            await redis_adapter.store(sample_fun_fact)
+            results = await asyncio.wait_for(asyncio.gather(first.get(), second.get()), timeout=1)
+
+        # Assert
+        assert results == [sample_fun_fact, sample_fun_fact]
+        assert broadcaster.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_pushes_each_day_once(self, broadcaster, sample_fun_fact):
+        # Setup
+        async with broadcaster.subscribe() as facts:
+            # Act
+            broadcaster.push(sample_fun_fact)
+            broadcaster.push(sample_fun_fact)
+            broadcaster.push(DailyFunFact(date(2024, 1, 14), "Yesterday's, stored late."))
+
+            # Assert
+            assert facts.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_future_fact_is_pushed_at_its_midnight(self, broadcaster, clock):
+        # Setup
+        clock.now = datetime(2024, 1, 15, 23, 59, 59, 950000)
+        tomorrow = DailyFunFact(date(2024, 1, 16), "Tomorrow.")
+
+        async with broadcaster.subscribe() as facts:
+            # Act
+            broadcaster.push(tomorrow)
+            await asyncio.sleep(0.01)
+            pushed_early = not facts.empty()
+            clock.now = datetime(2024, 1, 16, 0, 0, 0, 1)
+            result = await asyncio.wait_for(facts.get(), timeout=1)
+
+        # Assert
+        assert pushed_early is False
+        assert result == tomorrow
+
+    @pytest.mark.asyncio
+    async def test_fact_pregenerated_before_subscribing_is_pushed(self, broadcaster, cache_port, clock):
+        # Setup
+        clock.now = datetime(2024, 1, 15, 23, 59, 59, 900000)
+        tomorrow = DailyFunFact(date(2024, 1, 16), "Pre-generated.")
+        await cache_port.store(tomorrow)
+
+        async with broadcaster.subscribe() as facts:
+            # Act
+            await asyncio.sleep(0.05)
+            clock.now = datetime(2024, 1, 16, 0, 0, 0, 1)
+            result = await asyncio.wait_for(facts.get(), timeout=1)
+
+        # Assert
+        assert result == tomorrow
+
+    @pytest.mark.asyncio
+    async def test_subscriber_that_falls_behind_is_dropped(self, broadcaster, clock):
+        # Setup
+        async with broadcaster.subscribe() as slow, broadcaster.subscribe() as fast:
+            # Act
+            for day in (15, 16, 17):
+                clock.now = datetime(2024, 1, day, 12, 0)
+                broadcaster.push(DailyFunFact(date(2024, 1, day), f"Fact {day}."))
+                await fast.get()
+
+            # Assert
+            assert slow.get_nowait() is None
+            assert broadcaster.subscriber_count == 1
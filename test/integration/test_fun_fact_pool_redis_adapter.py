@@ -0,0 +1,46 @@
+import pytest
+
+from app.adapter.redis.fun_fact_pool_redis_adapter import FunFactPoolRedisAdapter
+
+
+@pytest.mark.integration
+class TestFunFactPoolRedisAdapter:
+
+    @pytest.fixture
+    def pool_adapter(self, fake_redis):
+        adapter = FunFactPoolRedisAdapter("redis://localhost:6379")
+        adapter._client = fake_redis
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_push_and_pop_in_order(self, pool_adapter):
+        # Act
+        added = await pool_adapter.push_many(["Fact one.", "Fact two."])
+        first = await pool_adapter.pop()
+        size = await pool_adapter.size()
+
+        # Assert
+        assert added == 2
+        assert first == "Fact one."
+        assert size == 1
+
+    @pytest.mark.asyncio
+    async def test_pop_empty_pool(self, pool_adapter):
+        # Act
+        result = await pool_adapter.pop()
+
+        # Assert
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_refill_lock(self, pool_adapter):
+        # Act
+        acquired1 = await pool_adapter.acquire_refill_lock()
+        acquired2 = await pool_adapter.acquire_refill_lock()
+        await pool_adapter.release_refill_lock()
+        acquired3 = await pool_adapter.acquire_refill_lock()
+
+        # Assert
+        assert acquired1 is True
+        assert acquired2 is False
+        assert acquired3 is True
@@ -0,0 +1,67 @@
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, patch
+
+import main
+from main import create_app
+from app.adapter import redis as redis_adapters
+
+
+@pytest.mark.integration
+class TestLifespan:
+
+    @pytest.fixture(autouse=True)
+    def without_background_tasks(self):
+        with patch.object(main, "_scheduler_enabled", False):
+            yield
+
+    @patch("main.close_daily_fun_fact_service", new_callable=AsyncMock)
+    @patch("main.warm_up_cache_adapter", new_callable=AsyncMock)
+    @patch("app.domain.service._daily_fun_fact_service_instance")
+    def test_warms_up_before_serving_and_closes_on_shutdown(self, mock_service, mock_warm_up_redis, mock_close):
+        # Setup
+        mock_service.warm_up = AsyncMock()
+
+        # Act
+        with TestClient(create_app()):
+            # Assert
+            mock_warm_up_redis.assert_awaited_once_with(main._warm_up_connections)
+            mock_service.warm_up.assert_awaited_once_with(10)
+            mock_close.assert_not_awaited()
+
+        mock_close.assert_awaited_once()
+
+    @patch("main.close_daily_fun_fact_service", new_callable=AsyncMock)
+    @patch("main.warm_up_cache_adapter", new_callable=AsyncMock)
+    @patch("app.domain.service._daily_fun_fact_service_instance")
+    def test_starts_cold_when_warm_up_fails(self, mock_service, mock_warm_up_redis, mock_close):
+        # Setup
+        mock_warm_up_redis.side_effect = ConnectionError("Redis unavailable")
+        mock_service.warm_up = AsyncMock()
+        mock_service.get_last_n_fun_facts = AsyncMock(return_value=[])
+
+        # Act
+        with TestClient(create_app()) as client:
+            response = client.get("/v1/fun-facts/recent")
+
+        # Assert
+        assert response.status_code == 200
+        mock_service.warm_up.assert_not_awaited()
+        mock_close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_redis_adapters_are_built_once_and_rebuilt_after_close(self, monkeypatch):
+        # Setup
+        monkeypatch.setenv("REDIS_URL", "redis://localhost:6379")
+        monkeypatch.setattr(redis_adapters, "_daily_fun_fact_redis_adapter_instance", None)
+        monkeypatch.setattr(redis_adapters, "_fun_fact_pool_redis_adapter_instance", None)
+
+        # Act
+        first = redis_adapters.get_daily_fun_fact_redis_adapter()
+        second = redis_adapters.get_daily_fun_fact_redis_adapter()
+        await redis_adapters.close_redis_adapters()
+        rebuilt = redis_adapters.get_daily_fun_fact_redis_adapter()
+
+        # Assert
+        assert first is second
+        assert rebuilt is not first
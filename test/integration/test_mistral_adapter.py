@@ -35,7 +35,7 @@ class TestMistralAdapter:
                 model="mistral-tiny",
                 messages=[{"role": "user", "content": test_prompt}],
                 temperature=1.0,
-                max_tokens=4096
+                max_tokens=256
             )
 
     @pytest.mark.asyncio
@@ -82,3 +82,45 @@ class TestMistralAdapter:
 
             # Assert
             assert result == expected_response 
+
+    @pytest.mark.asyncio
+    async def test_stream_chat(self, mistral_adapter):
+        # Setup
+        def event(content):
+            mock_event = MagicMock()
+            mock_event.data.choices[0].delta.content = content
+            return mock_event
+
+        class Events:
+            def __init__(self, events):
+                self._events = iter(events)
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                pass
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                try:
+                    return next(self._events)
+                except StopIteration:
+                    raise StopAsyncIteration
+
+        with patch.object(mistral_adapter.client.chat, 'stream_async', new_callable=AsyncMock) as mock_stream:
+            mock_stream.return_value = Events([event("The Sun"), event(None), event(" is a star.")])
+
+            # Act
+            result = [chunk async for chunk in mistral_adapter.stream_chat("prompt")]
+
+            # Assert
+            assert result == ["The Sun", " is a star."]
+            mock_stream.assert_called_once_with(
+                model="mistral-tiny",
+                messages=[{"role": "user", "content": "prompt"}],
+                temperature=1.0,
+                max_tokens=256
+            )
@@ -0,0 +1,114 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from app.adapter.ratelimit import RateLimit, RateLimiter
+
+
+@pytest.mark.integration
+class TestRateLimiter:
+
+    @pytest.fixture
+    def clock(self):
+        class Clock:
+            now = 1000.0
+
+            def __call__(self):
+                return self.now
+
+        return Clock()
+
+    @pytest.fixture
+    def limiter_factory(self, fake_redis, clock):
+        def create(lease_size=5):
+            limiter = RateLimiter("redis://localhost:6379", lease_size=lease_size, clock=clock)
+            limiter._client = fake_redis
+            return limiter
+
+        return create
+
+    def test_parse_rate_limit(self):
+        # Act
+        limit = RateLimit.parse("60/30")
+
+        # Assert
+        assert limit == RateLimit(capacity=60, period=30.0)
+        assert limit.tokens_per_ms == pytest.approx(0.002)
+
+    @pytest.mark.asyncio
+    async def test_denies_once_bucket_is_empty(self, limiter_factory):
+        # Setup
+        limiter = limiter_factory(lease_size=1)
+        limit = RateLimit(capacity=3, period=60)
+
+        # Act
+        results = [await limiter.acquire("client", limit) for _ in range(4)]
+
+        # Assert
+        assert results[:3] == [0.0, 0.0, 0.0]
+        assert 0 < results[3] <= 20
+
+    @pytest.mark.asyncio
+    async def test_leased_tokens_are_spent_without_round_trip(self, limiter_factory, fake_redis):
+        # Setup
+        limiter = limiter_factory(lease_size=5)
+        limit = RateLimit(capacity=100, period=60)
+
+        # Act
+        first = await limiter.acquire("client", limit)
+        remaining_in_redis = float(await fake_redis.hget("funfacts:ratelimit:client", "tokens"))
+        await fake_redis.delete("funfacts:ratelimit:client")
+        rest = [await limiter.acquire("client", limit) for _ in range(4)]
+
+        # Assert
+        assert first == 0.0
+        assert remaining_in_redis == pytest.approx(95, abs=0.1)
+        assert rest == [0.0] * 4
+        assert await fake_redis.exists("funfacts:ratelimit:client") == 0
+
+    @pytest.mark.asyncio
+    async def test_denial_is_remembered_locally_until_retry_time(self, limiter_factory, fake_redis, clock):
+        # Setup
+        limiter = limiter_factory(lease_size=1)
+        limit = RateLimit(capacity=1, period=60)
+        await limiter.acquire("client", limit)
+        retry_after = await limiter.acquire("client", limit)
+        await fake_redis.delete("funfacts:ratelimit:client")
+
+        # Act
+        clock.now += retry_after / 2
+        still_denied = await limiter.acquire("client", limit)
+        clock.now += retry_after
+        allowed_again = await limiter.acquire("client", limit)
+
+        # Assert
+        assert still_denied == pytest.approx(retry_after / 2)
+        assert allowed_again == 0.0
+
+    @pytest.mark.asyncio
+    async def test_workers_share_bucket(self, limiter_factory):
+        # Setup
+        limit = RateLimit(capacity=2, period=60)
+        worker, other_worker = limiter_factory(lease_size=1), limiter_factory(lease_size=1)
+
+        # Act
+        results = [
+            await worker.acquire("client", limit),
+            await other_worker.acquire("client", limit),
+            await worker.acquire("client", limit),
+        ]
+
+        # Assert
+        assert results[:2] == [0.0, 0.0]
+        assert results[2] > 0
+
+    @pytest.mark.asyncio
+    async def test_lets_requests_through_when_redis_fails(self, limiter_factory):
+        # Setup
+        limiter = limiter_factory()
+        limiter._take_tokens_script = AsyncMock(side_effect=ConnectionError("down"))
+
+        # Act
+        result = await limiter.acquire("client", RateLimit(capacity=1, period=60))
+
+        # Assert
+        assert result == 0.0
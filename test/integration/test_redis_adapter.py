@@ -1,13 +1,13 @@
 import pytest
-from datetime import date, timedelta
-from unittest.mock import patch
+from datetime import date
 
 from app.adapter.redis.daily_fun_fact_redis_adapter import FunFactRedisAdapter
 from app.domain.model import DailyFunFact
+from cache_port_contract import DailyFunFactCachePortContract
 
 
 @pytest.mark.integration
-class TestFunFactRedisAdapter:
+class TestFunFactRedisAdapter(DailyFunFactCachePortContract):
 
     @pytest.fixture
     def redis_adapter(self, fake_redis):
@@ -15,100 +15,92 @@ class TestFunFactRedisAdapter:
         adapter._client = fake_redis
         return adapter
 
-    @pytest.mark.asyncio
-    async def test_store_and_get_fun_fact(self, redis_adapter, sample_fun_fact):
-        # Act
-        await redis_adapter.store(sample_fun_fact)
-        result = await redis_adapter.get(sample_fun_fact.date)
-
-        # Assert
-        assert result == sample_fun_fact
-
-    @pytest.mark.asyncio
-    async def test_get_non_existent_fun_fact(self, redis_adapter):
-        # Act
-        result = await redis_adapter.get(date(2024, 1, 1))
+    @pytest.fixture
+    def cache_port(self, redis_adapter):
+        return redis_adapter
 
-        # Assert
-        assert result is None
+    @pytest.fixture
+    def other_cache_port(self, other_redis_adapter):
+        return other_redis_adapter
 
     @pytest.mark.asyncio
-    async def test_store_multiple_fun_facts(self, redis_adapter, sample_fun_facts):
+    async def test_get_falls_back_to_legacy_layout(self, redis_adapter, fake_redis, sample_fun_fact):
         # Setup
-        for fact in sample_fun_facts:
-            await redis_adapter.store(fact)
+        await fake_redis.zadd(FunFactRedisAdapter.LEGACY_KEY, {sample_fun_fact.fact: sample_fun_fact.date.toordinal()})
+
+        # Act
+        result = await redis_adapter.get(sample_fun_fact.date)
 
         # Assert
-        for fact in sample_fun_facts:
-            result = await redis_adapter.get(fact.date)
-            assert result == fact
+        assert result == sample_fun_fact
 
     @pytest.mark.asyncio
-    async def test_get_last_n_fun_facts(self, redis_adapter, sample_fun_facts):
+    async def test_migrate_legacy_layout(self, redis_adapter, fake_redis, sample_fun_facts):
         # Setup
         for fact in sample_fun_facts:
-            await redis_adapter.store(fact)
+            await fake_redis.zadd(FunFactRedisAdapter.LEGACY_KEY, {fact.fact: fact.date.toordinal()})
+        newer = DailyFunFact(date=sample_fun_facts[0].date, fact="Written by the new release.")
+        await redis_adapter.store(newer)
 
         # Act
-        result = await redis_adapter.get_last_n(3)
+        migrated = await redis_adapter.migrate_legacy_layout(batch_size=2, delete_legacy=True)
 
         # Assert
-        assert len(result) == 3
-        assert result[0].date == sample_fun_facts[0].date
-        assert result[1].date == sample_fun_facts[1].date
-        assert result[2].date == sample_fun_facts[2].date
+        assert migrated == len(sample_fun_facts) - 1
+        assert await fake_redis.exists(FunFactRedisAdapter.LEGACY_KEY) == 0
+        assert await redis_adapter.get(newer.date) == newer
+        assert await redis_adapter.get_last_n(10) == [newer] + sample_fun_facts[1:]
 
     @pytest.mark.asyncio
-    async def test_get_last_n_with_insufficient_facts(self, redis_adapter, sample_fun_facts):
+    async def test_mixed_releases_see_each_others_facts_during_migration(self, fake_redis, sample_fun_facts):
         # Setup
-        for fact in sample_fun_facts[:2]:
-            await redis_adapter.store(fact)
+        new_release = FunFactRedisAdapter("redis://localhost:6379", legacy_layout=True)
+        new_release._client = fake_redis
+        old_fact, new_fact, locked_fact = sample_fun_facts[1], sample_fun_facts[2], sample_fun_facts[0]
 
         # Act
-        result = await redis_adapter.get_last_n(5)
+        # the old release only knows the legacy sorted set
+        await fake_redis.zadd(FunFactRedisAdapter.LEGACY_KEY, {old_fact.fact: old_fact.date.toordinal()})
+        await new_release.store(new_fact)
+        await new_release.acquire_lock(locked_fact.date)
+        await new_release.store(locked_fact)
+        seen_by_old_release = [
+            await fake_redis.zrangebyscore(FunFactRedisAdapter.LEGACY_KEY, fact.date.toordinal(), fact.date.toordinal())
+            for fact in (new_fact, locked_fact)
+        ]
 
         # Assert
-        assert len(result) == 2
-        assert result[0].date == sample_fun_facts[0].date
-        assert result[1].date == sample_fun_facts[1].date
+        assert seen_by_old_release == [[new_fact.fact], [locked_fact.fact]]
+        assert await new_release.get_last_n(10) == [locked_fact, old_fact, new_fact]
+        assert await new_release.get_range(new_fact.date, locked_fact.date, 2) == [new_fact, old_fact]
+        assert await new_release.get_many([old_fact.date, new_fact.date]) == [old_fact, new_fact]
 
     @pytest.mark.asyncio
-    async def test_get_last_n_with_no_facts(self, redis_adapter):
+    async def test_legacy_layout_is_left_alone_by_default(self, redis_adapter, fake_redis, sample_fun_fact):
         # Act
-        result = await redis_adapter.get_last_n(5)
+        await redis_adapter.store(sample_fun_fact)
 
         # Assert
-        assert result == []
+        assert await fake_redis.exists(FunFactRedisAdapter.LEGACY_KEY) == 0
 
-    @pytest.mark.asyncio
-    async def test_lock_acquire_and_release(self, redis_adapter):
-        test_date = date(2024, 1, 15)
-
-        # Act
-        acquired1 = await redis_adapter.acquire_lock(test_date)
-        acquired2 = await redis_adapter.acquire_lock(test_date)
-        await redis_adapter.release_lock(test_date)
-        acquired3 = await redis_adapter.acquire_lock(test_date) 
-
-        # Assert
-        assert acquired1 is True
-        assert acquired2 is False
-        assert acquired3 is True
+    @pytest.fixture
+    def other_redis_adapter(self, fake_redis):
+        adapter = FunFactRedisAdapter("redis://localhost:6379")
+        adapter._client = fake_redis
+        return adapter
 
     @pytest.mark.asyncio
-    async def test_lock_expiration(self, redis_adapter):
+    async def test_renew_lock(self, redis_adapter, other_redis_adapter, fake_redis):
         test_date = date(2024, 1, 15)
 
-        # Act
-        acquired1 = await redis_adapter.acquire_lock(test_date, ttl=1)  
-        acquired2 = await redis_adapter.acquire_lock(test_date)
-
-        import asyncio
-        await asyncio.sleep(1.1)
+        # Setup
+        await redis_adapter.acquire_lock(test_date, ttl=1)
 
-        acquired3 = await redis_adapter.acquire_lock(test_date) 
+        # Act
+        renewed = await redis_adapter.renew_lock(test_date, ttl=30)
+        renewed_by_other = await other_redis_adapter.renew_lock(test_date, ttl=30)
 
         # Assert
-        assert acquired1 is True
-        assert acquired2 is False
-        assert acquired3 is True
+        assert renewed is True
+        assert renewed_by_other is False
+        assert await fake_redis.ttl(redis_adapter._build_lock_key(test_date)) > 1
@@ -0,0 +1,200 @@
+import asyncio
+import gzip
+import hashlib
+import json
+
+import pytest
+import pytest_asyncio
+from datetime import date, datetime
+from unittest.mock import AsyncMock
+
+from app.adapter.memory import FunFactMemoryAdapter
+from app.adapter.snapshot import SnapshotExporter, SnapshotExportingCachePort
+from app.domain.model import DailyFunFact
+
+
+@pytest.mark.integration
+class TestSnapshotExporter:
+
+    @pytest.fixture
+    def clock(self):
+        class Clock:
+            now = datetime(2024, 1, 15, 12, 0)
+
+            def __call__(self):
+                return self.now
+
+        return Clock()
+
+    @pytest.fixture
+    def cache_port(self):
+        return FunFactMemoryAdapter()
+
+    @pytest_asyncio.fixture
+    async def exporter(self, cache_port, tmp_path, clock):
+        exporter = SnapshotExporter(cache_port, str(tmp_path), recent_count=3, clock=clock)
+        yield exporter
+        await exporter.close()
+
+    @staticmethod
+    def read_json(path):
+        return json.loads(path.read_bytes())
+
+    @pytest.mark.asyncio
+    async def test_export_all_writes_today_recent_and_archives(self, exporter, cache_port, tmp_path, sample_fun_facts):
+        # Setup
+        december = DailyFunFact(date=date(2023, 12, 31), fact="New year's eve.")
+        for fact in [*sample_fun_facts, december]:
+            await cache_port.store(fact)
+
+        # Act
+        written = await exporter.export_all()
+
+        # Assert
+        assert written == ["archive/2023/12.json", "archive/2024/01.json", "recent.json", "today.json"]
+        assert self.read_json(tmp_path / "today.json") == {"date": "2024-01-15", "fact": sample_fun_facts[0].fact}
+        assert [fact["date"] for fact in self.read_json(tmp_path / "recent.json")] == [
+            "2024-01-15", "2024-01-14", "2024-01-13"
+        ]
+        assert [fact["date"] for fact in self.read_json(tmp_path / "archive/2024/01.json")] == [
+            "2024-01-11", "2024-01-12", "2024-01-13", "2024-01-14", "2024-01-15"
+        ]
+        assert self.read_json(tmp_path / "archive/2023/12.json") == [{"date": "2023-12-31", "fact": december.fact}]
+
+    @pytest.mark.asyncio
+    async def test_files_are_precompressed_and_hashed_in_manifest(self, exporter, cache_port, tmp_path, sample_fun_fact):
+        # Setup
+        await cache_port.store(sample_fun_fact)
+
+        # Act
+        await exporter.export_all()
+
+        # Assert
+        manifest = self.read_json(tmp_path / "manifest.json")["files"]
+        for path in ["today.json", "recent.json", "archive/2024/01.json"]:
+            content = (tmp_path / path).read_bytes()
+            assert gzip.decompress((tmp_path / f"{path}.gz").read_bytes()) == content
+            assert manifest[path] == {"sha256": hashlib.sha256(content).hexdigest(), "size": len(content)}
+
+    @pytest.mark.asyncio
+    async def test_exporters_sharing_a_directory_keep_manifest_consistent(self, tmp_path, clock):
+        # Setup
+        exporters = []
+        for year in range(2014, 2024):
+            cache_port = FunFactMemoryAdapter()
+            for month in range(1, 13):
+                await cache_port.store(DailyFunFact(date(year, month, 1), f"Fact of {year}-{month}."))
+            exporters.append(SnapshotExporter(cache_port, str(tmp_path), clock=clock))
+
+        # Act
+        await asyncio.gather(*(exporter.export_all() for exporter in exporters * 3))
+
+        # Assert
+        manifest = self.read_json(tmp_path / "manifest.json")["files"]
+        assert len(manifest) == 10 * 12 + 1
+        for path, entry in manifest.items():
+            assert entry["sha256"] == hashlib.sha256((tmp_path / path).read_bytes()).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_are_not_rewritten(self, exporter, cache_port, sample_fun_facts):
+        # Setup
+        for fact in sample_fun_facts:
+            await cache_port.store(fact)
+        await exporter.export_all()
+
+        # Act
+        written = await exporter.export_all()
+
+        # Assert
+        assert written == []
+
+    @pytest.mark.asyncio
+    async def test_new_fact_only_rewrites_files_it_touches(self, exporter, cache_port, tmp_path, clock):
+        # Setup
+        for fact in [DailyFunFact(date(2023, 11, 30), "November."), DailyFunFact(date(2024, 1, 14), "Yesterday.")]:
+            await cache_port.store(fact)
+        await exporter.export_all()
+        november = (tmp_path / "archive/2023/11.json").stat().st_mtime_ns
+        today = DailyFunFact(date(2024, 1, 15), "Today.")
+        await cache_port.store(today)
+
+        # Act
+        written = await exporter.export_fact(today)
+
+        # Assert
+        assert written == ["archive/2024/01.json", "recent.json", "today.json"]
+        assert (tmp_path / "archive/2023/11.json").stat().st_mtime_ns == november
+        assert self.read_json(tmp_path / "today.json")["fact"] == "Today."
+
+    @pytest.mark.asyncio
+    async def test_future_fact_is_exported_on_its_date(self, exporter, cache_port, tmp_path, clock):
+        # Setup
+        clock.now = datetime(2024, 1, 15, 23, 59, 59, 950000)
+        tomorrow = DailyFunFact(date(2024, 1, 16), "Tomorrow.")
+        await cache_port.store(tomorrow)
+
+        # Act
+        written = await exporter.export_fact(tomorrow)
+        await asyncio.sleep(0.01)
+        exported_early = (tmp_path / "today.json").exists()
+        clock.now = datetime(2024, 1, 16, 0, 0, 0, 1)
+        await asyncio.sleep(0.2)
+
+        # Assert
+        assert written == []
+        assert exported_early is False
+        assert self.read_json(tmp_path / "today.json") == {"date": "2024-01-16", "fact": "Tomorrow."}
+
+    @pytest.mark.asyncio
+    async def test_started_exporter_exports_fact_stored_elsewhere(self, exporter, cache_port, tmp_path, clock):
+        # Setup
+        await cache_port.store(DailyFunFact(date(2024, 1, 15), "Today."))
+
+        # Act
+        exporter.start()
+        await asyncio.sleep(0.05)
+
+        # Assert
+        assert self.read_json(tmp_path / "today.json") == {"date": "2024-01-15", "fact": "Today."}
+        assert self.read_json(tmp_path / "archive/2024/01.json") == [{"date": "2024-01-15", "fact": "Today."}]
+
+    @pytest.mark.asyncio
+    async def test_started_exporter_exports_at_rollover(self, exporter, cache_port, tmp_path, clock):
+        # Setup
+        clock.now = datetime(2024, 1, 15, 23, 59, 59, 950000)
+        await cache_port.store(DailyFunFact(date(2024, 1, 16), "Tomorrow."))
+        exporter.start()
+        await asyncio.sleep(0.01)
+
+        # Act
+        exported_early = (tmp_path / "today.json").exists()
+        clock.now = datetime(2024, 1, 16, 0, 0, 0, 1)
+        await asyncio.sleep(0.2)
+
+        # Assert
+        assert exported_early is False
+        assert self.read_json(tmp_path / "today.json") == {"date": "2024-01-16", "fact": "Tomorrow."}
+
+    @pytest.mark.asyncio
+    async def test_store_through_hook_exports_fact(self, exporter, cache_port, tmp_path, sample_fun_fact):
+        # Setup
+        hooked_port = SnapshotExportingCachePort(cache_port, exporter)
+
+        # Act
+        await hooked_port.store(sample_fun_fact)
+
+        # Assert
+        assert self.read_json(tmp_path / "today.json")["fact"] == sample_fun_fact.fact
+
+    @pytest.mark.asyncio
+    async def test_failed_export_does_not_fail_store(self, cache_port, sample_fun_fact):
+        # Setup
+        exporter = AsyncMock(spec=SnapshotExporter)
+        exporter.export_fact.side_effect = OSError("disk full")
+        hooked_port = SnapshotExportingCachePort(cache_port, exporter)
+
+        # Act
+        await hooked_port.store(sample_fun_fact)
+
+        # Assert
+        assert await cache_port.get(sample_fun_fact.date) == sample_fun_fact
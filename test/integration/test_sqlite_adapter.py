@@ -0,0 +1,121 @@
+import sqlite3
+
+import pytest
+import pytest_asyncio
+from datetime import date
+
+from app.adapter.sqlite import FunFactSqliteAdapter
+from app.domain.model import DailyFunFact
+from cache_port_contract import DailyFunFactCachePortContract
+
+
+@pytest.mark.integration
+class TestFunFactSqliteAdapter(DailyFunFactCachePortContract):
+
+    @pytest.fixture
+    def database_path(self, tmp_path):
+        return str(tmp_path / "funfacts.sqlite3")
+
+    @pytest_asyncio.fixture
+    async def sqlite_adapter(self, database_path):
+        adapter = FunFactSqliteAdapter(database_path, poll_interval=0.01)
+        yield adapter
+        await adapter.close()
+
+    @pytest_asyncio.fixture
+    async def other_sqlite_adapter(self, database_path):
+        adapter = FunFactSqliteAdapter(database_path, poll_interval=0.01)
+        yield adapter
+        await adapter.close()
+
+    @pytest.fixture
+    def cache_port(self, sqlite_adapter):
+        return sqlite_adapter
+
+    @pytest.fixture
+    def other_cache_port(self, other_sqlite_adapter):
+        return other_sqlite_adapter
+
+    @pytest.mark.asyncio
+    async def test_database_uses_wal_mode(self, sqlite_adapter, database_path, sample_fun_fact):
+        # Setup
+        await sqlite_adapter.store(sample_fun_fact)
+
+        # Act
+        with sqlite3.connect(database_path) as connection:
+            journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+        # Assert
+        assert journal_mode == "wal"
+
+    @pytest.mark.asyncio
+    async def test_wait_for_store_sees_fact_stored_by_other_process(self, sqlite_adapter, other_sqlite_adapter):
+        import asyncio
+        fact = DailyFunFact(date=date(2024, 1, 15), fact="Written by another worker.")
+
+        # Act
+        waiter = asyncio.create_task(sqlite_adapter.wait_for_store(fact.date, timeout=5))
+        await asyncio.sleep(0.05)
+        await other_sqlite_adapter.store(fact)
+        result = await waiter
+
+        # Assert
+        assert result == fact
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lock_attempts_have_one_winner(self, database_path):
+        import asyncio
+        adapters = [FunFactSqliteAdapter(database_path) for _ in range(5)]
+
+        # Act
+        try:
+            results = await asyncio.gather(*(adapter.acquire_lock(date(2024, 1, 15)) for adapter in adapters))
+        finally:
+            for adapter in adapters:
+                await adapter.close()
+
+        # Assert
+        assert sorted(results) == [False, False, False, False, True]
+
+    @pytest.mark.asyncio
+    async def test_get_many_with_more_dates_than_one_query_takes(self, sqlite_adapter):
+        # Setup
+        facts = [DailyFunFact.from_ordinal(ordinal, f"Fact {ordinal}") for ordinal in range(738000, 738600)]
+        for fact in facts:
+            await sqlite_adapter.store(fact)
+
+        # Act
+        result = await sqlite_adapter.get_many([fact.date for fact in reversed(facts)])
+
+        # Assert
+        assert result == list(reversed(facts))
+
+    @pytest.mark.asyncio
+    async def test_warm_up_opens_a_connection_per_thread(self, database_path):
+        # Setup
+        adapter = FunFactSqliteAdapter(database_path, max_workers=3)
+
+        # Act
+        try:
+            await adapter.warm_up(10)
+            connections = len(adapter._connections)
+        finally:
+            await adapter.close()
+
+        # Assert
+        assert connections == 3
+
+    @pytest.mark.asyncio
+    async def test_warm_up_without_connections_does_nothing(self, database_path):
+        # Setup
+        adapter = FunFactSqliteAdapter(database_path, max_workers=3)
+
+        # Act
+        try:
+            await adapter.warm_up(0)
+            connections = len(adapter._connections)
+        finally:
+            await adapter.close()
+
+        # Assert
+        assert connections == 0
@@ -0,0 +1,139 @@
+import pytest
+import pytest_asyncio
+from datetime import date
+from unittest.mock import AsyncMock
+
+from app.adapter.memory import FunFactMemoryAdapter
+from app.adapter.sqlite import FunFactSqliteAdapter
+from app.adapter.tiered import TierStats, TieredCachePort
+from app.domain.port import DailyFunFactCachePort
+from cache_port_contract import DailyFunFactCachePortContract
+
+
+@pytest.mark.integration
+class TestTieredCachePort(DailyFunFactCachePortContract):
+
+    @pytest.fixture
+    def database_path(self, tmp_path):
+        return str(tmp_path / "funfacts.sqlite3")
+
+    @pytest_asyncio.fixture
+    async def sqlite_adapter(self, database_path):
+        adapter = FunFactSqliteAdapter(database_path, poll_interval=0.01)
+        yield adapter
+        await adapter.close()
+
+    @pytest_asyncio.fixture
+    async def other_sqlite_adapter(self, database_path):
+        adapter = FunFactSqliteAdapter(database_path, poll_interval=0.01)
+        yield adapter
+        await adapter.close()
+
+    @pytest.fixture
+    def memory_adapter(self):
+        return FunFactMemoryAdapter()
+
+    @pytest.fixture
+    def cache_port(self, memory_adapter, sqlite_adapter):
+        return TieredCachePort([("memory", memory_adapter), ("sqlite", sqlite_adapter)])
+
+    @pytest.fixture
+    def other_cache_port(self, other_sqlite_adapter):
+        # another worker, with its own memory tier over the same database
+        return TieredCachePort([("memory", FunFactMemoryAdapter()), ("sqlite", other_sqlite_adapter)])
+
+    @pytest.mark.asyncio
+    async def test_lower_tier_hit_backfills_upper_tier(
+        self, cache_port, memory_adapter, sqlite_adapter, sample_fun_fact
+    ):
+        # Setup
+        await sqlite_adapter.store(sample_fun_fact)
+
+        # Act
+        first = await cache_port.get(sample_fun_fact.date)
+        second = await cache_port.get(sample_fun_fact.date)
+
+        # Assert
+        assert first == second == sample_fun_fact
+        assert await memory_adapter.get(sample_fun_fact.date) == sample_fun_fact
+        assert cache_port.stats() == [
+            TierStats(name="memory", hits=1, misses=1),
+            TierStats(name="sqlite", hits=1, misses=0),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_many_only_asks_lower_tier_for_missing_dates(
+        self, cache_port, memory_adapter, sqlite_adapter, sample_fun_facts
+    ):
+        # Setup
+        for fact in sample_fun_facts:
+            await sqlite_adapter.store(fact)
+        await memory_adapter.store(sample_fun_facts[0])
+        dates = [fact.date for fact in sample_fun_facts]
+
+        # Act
+        result = await cache_port.get_many(dates)
+
+        # Assert
+        assert result == sample_fun_facts
+        assert cache_port.stats() == [
+            TierStats(name="memory", hits=1, misses=4),
+            TierStats(name="sqlite", hits=4, misses=0),
+        ]
+        assert await memory_adapter.get_many(dates) == sample_fun_facts
+
+    @pytest.mark.asyncio
+    async def test_store_writes_through_every_tier(self, cache_port, memory_adapter, sqlite_adapter, sample_fun_fact):
+        # Act
+        await cache_port.store(sample_fun_fact)
+
+        # Assert
+        assert await memory_adapter.get(sample_fun_fact.date) == sample_fun_fact
+        assert await sqlite_adapter.get(sample_fun_fact.date) == sample_fun_fact
+
+    @pytest.mark.asyncio
+    async def test_failing_upper_tier_reads_as_miss(self, sqlite_adapter, sample_fun_fact):
+        # Setup
+        broken = AsyncMock(spec=DailyFunFactCachePort)
+        broken.get.side_effect = ConnectionError("down")
+        broken.store.side_effect = ConnectionError("down")
+        cache_port = TieredCachePort([("broken", broken), ("sqlite", sqlite_adapter)])
+        await sqlite_adapter.store(sample_fun_fact)
+
+        # Act
+        result = await cache_port.get(sample_fun_fact.date)
+
+        # Assert
+        assert result == sample_fun_fact
+        assert cache_port.stats()[0] == TierStats(name="broken", hits=0, misses=1)
+
+    @pytest.mark.asyncio
+    async def test_failing_authoritative_tier_raises(self, memory_adapter):
+        # Setup
+        broken = AsyncMock(spec=DailyFunFactCachePort)
+        broken.get.side_effect = ConnectionError("down")
+        cache_port = TieredCachePort([("memory", memory_adapter), ("broken", broken)])
+
+        # Act & Assert
+        with pytest.raises(ConnectionError):
+            await cache_port.get(date(2024, 1, 15))
+
+    @pytest.mark.asyncio
+    async def test_recent_facts_come_from_authoritative_tier(
+        self, cache_port, memory_adapter, sqlite_adapter, sample_fun_facts
+    ):
+        # Setup
+        for fact in sample_fun_facts:
+            await sqlite_adapter.store(fact)
+        await memory_adapter.store(sample_fun_facts[0])
+
+        # Act
+        result = await cache_port.get_last_n(5)
+
+        # Assert
+        assert result == sample_fun_facts
+
+    def test_needs_at_least_one_tier(self):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            TieredCachePort([])
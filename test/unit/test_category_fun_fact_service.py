@@ -0,0 +1,149 @@
+import asyncio
+
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock
+
+from app.domain.model import DailyFunFact
+from app.domain.port import CategoryFunFactCachePort, LockLostError
+from app.domain.service.category_fun_fact_service import CategoryFunFactService
+
+
+@pytest.mark.unit
+class TestCategoryFunFactService:
+
+    @pytest.fixture
+    def mock_category_cache_port(self):
+        mock = AsyncMock(spec=CategoryFunFactCachePort)
+        mock.get_categories.return_value = {}
+        mock.acquire_lock.return_value = True
+        mock.wait_for_store.return_value = {}
+        return mock
+
+    @pytest.fixture
+    def service(self, mock_category_cache_port, mock_llm_port):
+        return CategoryFunFactService(mock_category_cache_port, mock_llm_port, ["science", "history"])
+
+    @pytest.mark.asyncio
+    async def test_returns_stored_fact_of_category(self, service, mock_category_cache_port, mock_llm_port):
+        # Setup
+        mock_category_cache_port.get_categories.return_value = {"science": "Stored.", "history": "Also stored."}
+
+        # Act
+        result = await service.get_todays_fun_fact("science")
+
+        # Assert
+        assert result == DailyFunFact(date.today(), "Stored.")
+        mock_category_cache_port.acquire_lock.assert_not_called()
+        mock_llm_port.chat.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_generates_every_category_with_one_llm_call(self, service, mock_category_cache_port, mock_llm_port):
+        # Setup
+        today = date.today()
+        mock_llm_port.chat.return_value = '```json\n{"Science": "Atoms.", "history": "Rome."}\n```'
+
+        # Act
+        science = await service.get_todays_fun_fact("science")
+        history = await service.get_todays_fun_fact("history")
+
+        # Assert
+        assert science == DailyFunFact(today, "Atoms.")
+        assert history == DailyFunFact(today, "Rome.")
+        mock_llm_port.chat.assert_called_once()
+        mock_category_cache_port.store_categories.assert_called_once_with(
+            today, {"science": "Atoms.", "history": "Rome."}
+        )
+        mock_category_cache_port.release_lock.assert_called_once_with(today)
+
+    @pytest.mark.asyncio
+    async def test_retries_when_category_is_missing(self, service, mock_category_cache_port, mock_llm_port):
+        # Setup
+        mock_llm_port.chat.side_effect = ['{"science": "Atoms."}', '{"science": "Cells.", "history": "Rome."}']
+
+        # Act
+        result = await service.get_todays_fun_fact("history")
+
+        # Assert
+        assert result.fact == "Rome."
+        assert mock_llm_port.chat.call_count == 2
+        mock_category_cache_port.store_categories.assert_called_once_with(
+            date.today(), {"science": "Cells.", "history": "Rome."}
+        )
+
+    @pytest.mark.asyncio
+    async def test_category_missing_after_retries_stores_nothing(self, service, mock_category_cache_port, mock_llm_port):
+        # Setup
+        mock_llm_port.chat.return_value = '{"science": "Atoms."}'
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await service.get_todays_fun_fact("science")
+        assert mock_llm_port.chat.call_count == 2
+        mock_category_cache_port.store_categories.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_generation_is_not_cached(self, service, mock_category_cache_port, mock_llm_port):
+        # Setup
+        mock_llm_port.chat.side_effect = ['{"science": "Atoms."}'] * 2 + ['{"science": "Cells.", "history": "Rome."}']
+        with pytest.raises(ValueError):
+            await service.get_todays_fun_fact("history")
+
+        # Act
+        result = await service.get_todays_fun_fact("history")
+
+        # Assert
+        assert result.fact == "Rome."
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_stores_nothing(self, service, mock_category_cache_port, mock_llm_port):
+        # Setup
+        mock_llm_port.chat.return_value = "Sorry, I cannot do that."
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await service.get_todays_fun_fact("science")
+        mock_category_cache_port.store_categories.assert_not_called()
+        mock_category_cache_port.release_lock.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_waits_for_lock_holder(self, service, mock_category_cache_port, mock_llm_port):
+        # Setup
+        mock_category_cache_port.acquire_lock.return_value = False
+        mock_category_cache_port.wait_for_store.return_value = {"science": "From another worker."}
+
+        # Act
+        result = await service.get_todays_fun_fact("science")
+
+        # Assert
+        assert result.fact == "From another worker."
+        mock_llm_port.chat.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lost_lock_uses_facts_of_new_holder(self, service, mock_category_cache_port, mock_llm_port):
+        # Setup
+        mock_llm_port.chat.return_value = '{"science": "Mine.", "history": "Mine too."}'
+        mock_category_cache_port.store_categories.side_effect = LockLostError("lost")
+        mock_category_cache_port.wait_for_store.return_value = {"science": "Theirs.", "history": "Theirs too."}
+
+        # Act
+        result = await service.get_todays_fun_fact("science")
+
+        # Assert
+        assert result.fact == "Theirs."
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_generation(self, service, mock_category_cache_port, mock_llm_port):
+        # Setup
+        async def slow_chat(prompt, max_tokens=None):
+            await asyncio.sleep(0.01)
+            return '{"science": "Atoms.", "history": "Rome."}'
+
+        mock_llm_port.chat.side_effect = slow_chat
+
+        # Act
+        results = await asyncio.gather(*(service.get_todays_fun_fact(category) for category in ["science", "history"] * 5))
+
+        # Assert
+        assert {result.fact for result in results} == {"Atoms.", "Rome."}
+        mock_llm_port.chat.assert_called_once()
@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock
+
+from app.adapter.scheduler.daily_fun_fact_scheduler import DailyFunFactScheduler
+from app.domain.model import DailyFunFact
+
+
+@pytest.mark.unit
+class TestDailyFunFactScheduler:
+
+    @pytest.fixture
+    def mock_service(self):
+        service = AsyncMock()
+        service.pregenerate_fun_fact.return_value = DailyFunFact(date(2024, 1, 16), "tomorrow's fact")
+        return service
+
+    @pytest.mark.asyncio
+    async def test_generate_succeeds_first_attempt(self, mock_service):
+        # Setup
+        scheduler = DailyFunFactScheduler(mock_service, retry_delay=0)
+
+        # Act
+        result = await scheduler.generate(date(2024, 1, 16))
+
+        # Assert
+        assert result is True
+        mock_service.pregenerate_fun_fact.assert_called_once_with(date(2024, 1, 16))
+
+    @pytest.mark.asyncio
+    async def test_generate_retries_on_failure(self, mock_service):
+        # Setup
+        mock_service.pregenerate_fun_fact.side_effect = [Exception("LLM error"), None, DailyFunFact(date(2024, 1, 16), "fact")]
+        scheduler = DailyFunFactScheduler(mock_service, retry_delay=0)
+
+        # Act
+        result = await scheduler.generate(date(2024, 1, 16))
+
+        # Assert
+        assert result is True
+        assert mock_service.pregenerate_fun_fact.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_generate_gives_up_after_max_attempts(self, mock_service):
+        # Setup
+        mock_service.pregenerate_fun_fact.side_effect = Exception("LLM error")
+        scheduler = DailyFunFactScheduler(mock_service, max_attempts=3, retry_delay=0)
+
+        # Act
+        result = await scheduler.generate(date(2024, 1, 16))
+
+        # Assert
+        assert result is False
+        assert mock_service.pregenerate_fun_fact.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_generate_pregenerates_category_fun_facts(self, mock_service):
+        # Setup
+        category_service = AsyncMock()
+        category_service.pregenerate_fun_facts.return_value = {"science": "Atoms."}
+        scheduler = DailyFunFactScheduler(mock_service, retry_delay=0, category_service=category_service)
+
+        # Act
+        result = await scheduler.generate(date(2024, 1, 16))
+
+        # Assert
+        assert result is True
+        mock_service.pregenerate_fun_fact.assert_called_once_with(date(2024, 1, 16))
+        category_service.pregenerate_fun_facts.assert_called_once_with(date(2024, 1, 16))
+
+    @pytest.mark.asyncio
+    async def test_failing_category_fun_facts_do_not_stop_daily_fun_fact(self, mock_service):
+        # Setup
+        category_service = AsyncMock()
+        category_service.pregenerate_fun_facts.side_effect = ValueError("Could not generate the fun facts of science")
+        scheduler = DailyFunFactScheduler(mock_service, max_attempts=2, retry_delay=0, category_service=category_service)
+
+        # Act
+        result = await scheduler.generate(date(2024, 1, 16))
+
+        # Assert
+        assert result is False
+        mock_service.pregenerate_fun_fact.assert_called_once_with(date(2024, 1, 16))
+        assert category_service.pregenerate_fun_facts.call_count == 2
+
+    def test_next_run_is_lead_time_before_midnight(self, mock_service):
+        # Setup
+        now = datetime(2024, 1, 15, 12, 0)
+        scheduler = DailyFunFactScheduler(mock_service, lead_time=timedelta(minutes=10), clock=lambda: now)
+
+        # Act
+        next_run, target_date = scheduler._next_run(date(2024, 1, 15))
+
+        # Assert
+        assert next_run == datetime(2024, 1, 15, 23, 50)
+        assert target_date == date(2024, 1, 16)
+
+    def test_next_run_inside_lead_time_is_due_at_once(self, mock_service):
+        # Setup
+        now = datetime(2024, 1, 15, 23, 55)
+        scheduler = DailyFunFactScheduler(mock_service, lead_time=timedelta(minutes=10), clock=lambda: now)
+
+        # Act
+        next_run, target_date = scheduler._next_run(date(2024, 1, 15))
+
+        # Assert
+        assert next_run <= now
+        assert target_date == date(2024, 1, 16)
+
+    def test_next_run_after_generating_tomorrow_moves_to_next_day(self, mock_service):
+        # Setup
+        now = datetime(2024, 1, 15, 23, 55)
+        scheduler = DailyFunFactScheduler(mock_service, lead_time=timedelta(minutes=10), clock=lambda: now)
+
+        # Act
+        next_run, target_date = scheduler._next_run(date(2024, 1, 16))
+
+        # Assert
+        assert next_run == datetime(2024, 1, 16, 23, 50)
+        assert target_date == date(2024, 1, 17)
+
+    @pytest.mark.asyncio
+    async def test_start_inside_lead_time_pregenerates_tomorrow(self, mock_service):
+        # Setup
+        now = datetime(2024, 1, 15, 23, 55)
+        scheduler = DailyFunFactScheduler(
+            mock_service, lead_time=timedelta(minutes=10), retry_delay=0, clock=lambda: now
+        )
+
+        # Act
+        scheduler.start()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        await scheduler.stop()
+
+        # Assert
+        assert [call.args for call in mock_service.pregenerate_fun_fact.call_args_list] == [
+            (date(2024, 1, 15),),
+            (date(2024, 1, 16),),
+        ]
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, patch
 
 from app.domain.service.daily_fun_fact_service import DailyFunFactService
 from app.domain.model import DailyFunFact
+from app.util import start_phase_timings, stop_phase_timings
 
 
 @pytest.mark.unit
@@ -177,3 +178,361 @@ class TestDailyFunFactService:
         # Assert
         assert result is None
         mock_cache_port.release_lock.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_todays_fun_fact_served_from_memory(self, service, mock_cache_port, sample_fun_fact):
+        # Setup
+        mock_cache_port.get.return_value = sample_fun_fact
+
+        # Act
+        result1 = await service.get_todays_fun_fact()
+        result2 = await service.get_todays_fun_fact()
+
+        # Assert
+        assert result1 == result2 == sample_fun_fact
+        mock_cache_port.get.assert_called_once()
+        assert service.memory_cache_stats().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_get_todays_fun_fact_not_found_is_not_memoized(self, service, mock_cache_port):
+        # Setup
+        mock_cache_port.get.return_value = None
+        mock_cache_port.acquire_lock.return_value = False
+
+        # Act
+        await service.get_todays_fun_fact()
+        await service.get_todays_fun_fact()
+
+        # Assert
+        assert mock_cache_port.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_last_n_fun_facts_memoized_once_today_is_stored(self, service, mock_cache_port):
+        # Setup
+        facts = [DailyFunFact(date.today(), "today's fact")]
+        mock_cache_port.get_last_n.return_value = facts
+
+        # Act
+        result1 = await service.get_last_n_fun_facts(10)
+        result2 = await service.get_last_n_fun_facts(10)
+
+        # Assert
+        assert result1 == result2 == facts
+        mock_cache_port.get_last_n.assert_called_once_with(10)
+
+    @pytest.mark.asyncio
+    async def test_get_last_n_fun_facts_not_memoized_without_today(self, service, mock_cache_port, sample_fun_facts):
+        # Setup
+        mock_cache_port.get_last_n.return_value = sample_fun_facts
+
+        # Act
+        await service.get_last_n_fun_facts(10)
+        await service.get_last_n_fun_facts(10)
+
+        # Assert
+        assert mock_cache_port.get_last_n.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_generation(self, service, mock_cache_port, mock_llm_port):
+        # Setup
+        import asyncio
+        release = asyncio.Event()
+
+        async def slow_chat(prompt):
+            await release.wait()
+            return "very fun fact"
+
+        mock_cache_port.get.return_value = None
+        mock_llm_port.chat.side_effect = slow_chat
+
+        # Act
+        tasks = [asyncio.create_task(service.get_todays_fun_fact()) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        # Assert
+        assert all(result == DailyFunFact(date.today(), "very fun fact") for result in results)
+        mock_llm_port.chat.assert_called_once()
+        mock_cache_port.acquire_lock.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_lock_loser_waits_for_store(self, service, mock_cache_port, mock_llm_port, sample_fun_fact):
+        # Setup
+        mock_cache_port.get.return_value = None
+        mock_cache_port.acquire_lock.return_value = False
+        mock_cache_port.wait_for_store.return_value = sample_fun_fact
+
+        # Act
+        result = await service.get_todays_fun_fact()
+
+        # Assert
+        assert result == sample_fun_fact
+        mock_cache_port.wait_for_store.assert_called_once_with(date.today(), service._lock_wait_timeout)
+        mock_llm_port.chat.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_fun_facts_page_with_next_cursor(self, service, mock_cache_port, sample_fun_facts):
+        # Setup
+        ascending = sorted(sample_fun_facts, key=lambda fact: fact.date)
+        mock_cache_port.get_range.return_value = ascending[:3]
+
+        # Act
+        facts, next_cursor = await service.get_fun_facts_page(date(2024, 1, 1), date(2024, 1, 31), 2)
+
+        # Assert
+        assert facts == ascending[:2]
+        assert next_cursor == ascending[2].date
+        mock_cache_port.get_range.assert_called_once_with(date(2024, 1, 1), date(2024, 1, 31), 3)
+
+    @pytest.mark.asyncio
+    async def test_get_fun_facts_page_last_page(self, service, mock_cache_port, sample_fun_facts):
+        # Setup
+        mock_cache_port.get_range.return_value = sample_fun_facts[:1]
+
+        # Act
+        facts, next_cursor = await service.get_fun_facts_page(date(2024, 1, 1), date(2024, 1, 31), 2)
+
+        # Assert
+        assert facts == sample_fun_facts[:1]
+        assert next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_iter_fun_fact_pages_follows_cursor(self, service, mock_cache_port, sample_fun_facts):
+        # Setup
+        ascending = sorted(sample_fun_facts, key=lambda fact: fact.date)
+        mock_cache_port.get_range.side_effect = [ascending[0:3], ascending[2:5], ascending[4:5]]
+
+        # Act
+        pages = [page async for page in service.iter_fun_fact_pages(date(2024, 1, 1), date(2024, 1, 31), 2)]
+
+        # Assert
+        assert [fact for page in pages for fact in page] == ascending
+        assert mock_cache_port.get_range.call_args_list[1].args[0] == ascending[2].date
+
+    @pytest.mark.asyncio
+    async def test_get_fun_facts_by_date(self, service, mock_cache_port, sample_fun_facts):
+        # Setup
+        future = date(9999, 1, 1)
+        mock_cache_port.get_many.return_value = sample_fun_facts[:1]
+
+        # Act
+        found, missing = await service.get_fun_facts_by_date(
+            [sample_fun_facts[0].date, date(2020, 1, 1), sample_fun_facts[0].date, future]
+        )
+
+        # Assert
+        assert found == sample_fun_facts[:1]
+        assert missing == [date(2020, 1, 1), future]
+        mock_cache_port.get_many.assert_called_once_with([sample_fun_facts[0].date, date(2020, 1, 1)])
+
+    @pytest.mark.asyncio
+    async def test_lock_renewed_while_generating(self, service, mock_cache_port, mock_llm_port):
+        # Setup
+        import asyncio
+
+        async def slow_chat(prompt):
+            await asyncio.sleep(0.05)
+            return "very fun fact"
+
+        service._LOCK_TTL = 0.03
+        mock_llm_port.chat.side_effect = slow_chat
+        mock_cache_port.renew_lock.return_value = True
+
+        # Act
+        await service.get_todays_fun_fact()
+
+        # Assert
+        mock_cache_port.renew_lock.assert_called_with(date.today(), 0.03)
+
+    @pytest.mark.asyncio
+    async def test_lost_lock_uses_fact_of_new_holder(self, service, mock_cache_port, mock_llm_port, sample_fun_fact):
+        # Setup
+        from app.domain.port import LockLostError
+        mock_cache_port.store.side_effect = LockLostError("lock lost")
+        mock_cache_port.wait_for_store.return_value = sample_fun_fact
+
+        # Act
+        result = await service.get_todays_fun_fact()
+
+        # Assert
+        assert result == sample_fun_fact
+        mock_cache_port.release_lock.assert_called_once_with(date.today())
+
+    @pytest.mark.asyncio
+    async def test_stream_todays_fun_fact_shares_tokens_with_waiters(self, mock_cache_port, fake_llm_port_factory):
+        # Setup
+        import asyncio
+        llm_port = fake_llm_port_factory(response="Octopuses have three hearts.")
+        service = DailyFunFactService(mock_cache_port, llm_port)
+
+        async def collect():
+            return [chunk async for chunk in service.stream_todays_fun_fact()]
+
+        # Act
+        results = await asyncio.gather(collect(), collect(), service.get_todays_fun_fact())
+
+        # Assert
+        assert results[0] == results[1] == ["Octopuses", " have", " three", " hearts."]
+        assert results[2] == DailyFunFact(date.today(), "Octopuses have three hearts.")
+        assert llm_port.calls == 1
+        mock_cache_port.store.assert_called_once_with(results[2])
+
+    @pytest.mark.asyncio
+    async def test_stream_todays_fun_fact_when_cached(self, service, mock_cache_port, mock_llm_port, sample_fun_fact):
+        # Setup
+        mock_cache_port.get.return_value = sample_fun_fact
+
+        # Act
+        chunks = [chunk async for chunk in service.stream_todays_fun_fact()]
+
+        # Assert
+        assert chunks == [sample_fun_fact.fact]
+        mock_llm_port.chat.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stream_todays_fun_fact_propagates_errors(self, mock_cache_port, fake_llm_port_factory):
+        # Setup
+        service = DailyFunFactService(mock_cache_port, fake_llm_port_factory(failures=1))
+
+        # Act & Assert
+        with pytest.raises(ConnectionError):
+            async for _ in service.stream_todays_fun_fact():
+                pass
+        mock_cache_port.release_lock.assert_called_once_with(date.today())
+
+    @pytest.mark.asyncio
+    async def test_get_todays_fun_fact_takes_pooled_fact(self, mock_cache_port, mock_llm_port, mock_pool_port):
+        # Setup
+        service = DailyFunFactService(mock_cache_port, mock_llm_port, pool_port=mock_pool_port)
+        mock_pool_port.pop.return_value = "A pooled fact."
+
+        # Act
+        result = await service.get_todays_fun_fact()
+
+        # Assert
+        assert result == DailyFunFact(date.today(), "A pooled fact.")
+        mock_llm_port.chat.assert_not_called()
+        mock_cache_port.store.assert_called_once_with(result)
+
+    @pytest.mark.asyncio
+    async def test_get_todays_fun_fact_with_empty_pool_calls_llm(self, mock_cache_port, mock_llm_port, mock_pool_port):
+        # Setup
+        service = DailyFunFactService(mock_cache_port, mock_llm_port, pool_port=mock_pool_port)
+
+        # Act
+        result = await service.get_todays_fun_fact()
+
+        # Assert
+        assert result == DailyFunFact(date.today(), "This is a test fun fact from the mock LLM.")
+        mock_pool_port.pop.assert_called_once()
+        mock_llm_port.chat.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_refill_fun_fact_pool(self, mock_cache_port, mock_llm_port, mock_pool_port):
+        # Setup
+        service = DailyFunFactService(mock_cache_port, mock_llm_port, pool_port=mock_pool_port, pool_batch_size=3)
+        mock_llm_port.chat.return_value = 'Here you go:\n```json\n["Fact one.", "Fact two.", "Fact one.", 3]\n```'
+
+        # Act
+        added = await service.refill_fun_fact_pool()
+
+        # Assert
+        assert added == 2
+        mock_pool_port.push_many.assert_called_once_with(["Fact one.", "Fact two."])
+        assert mock_llm_port.chat.call_args.kwargs["max_tokens"] == 3 * service._BATCH_TOKENS_PER_FACT
+        mock_pool_port.release_refill_lock.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_refill_fun_fact_pool_above_low_water(self, mock_cache_port, mock_llm_port, mock_pool_port):
+        # Setup
+        service = DailyFunFactService(mock_cache_port, mock_llm_port, pool_port=mock_pool_port, pool_low_water=3)
+        mock_pool_port.size.return_value = 3
+
+        # Act
+        added = await service.refill_fun_fact_pool()
+
+        # Assert
+        assert added == 0
+        mock_llm_port.chat.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_refill_fun_fact_pool_unparsable_response(self, mock_cache_port, mock_llm_port, mock_pool_port):
+        # Setup
+        service = DailyFunFactService(mock_cache_port, mock_llm_port, pool_port=mock_pool_port)
+        mock_llm_port.chat.return_value = "Sorry, I can't do that."
+
+        # Act
+        added = await service.refill_fun_fact_pool()
+
+        # Assert
+        assert added == 0
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_is_regenerated(self, mock_cache_port, mock_llm_port, sample_fun_facts):
+        # Setup
+        from app.domain.service.near_duplicate_index import NearDuplicateIndex
+        service = DailyFunFactService(mock_cache_port, mock_llm_port, duplicate_index=NearDuplicateIndex())
+        mock_cache_port.get_range.return_value = sample_fun_facts
+        mock_llm_port.chat.side_effect = ["Octopuses have 3 hearts and blue blood!", "Bananas are berries."]
+
+        # Act
+        result = await service.get_todays_fun_fact()
+
+        # Assert
+        assert result == DailyFunFact(date.today(), "Bananas are berries.")
+        assert mock_llm_port.chat.call_count == 2
+        assert "Octopuses have 3 hearts and blue blood!" in mock_llm_port.chat.call_args.args[0]
+        mock_cache_port.get_range.assert_called_once_with(date.min, date.max, service._INDEX_SYNC_PAGE_SIZE)
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_kept_after_max_retries(self, mock_cache_port, mock_llm_port, sample_fun_facts):
+        # Setup
+        from app.domain.service.near_duplicate_index import NearDuplicateIndex
+        service = DailyFunFactService(
+            mock_cache_port, mock_llm_port, duplicate_index=NearDuplicateIndex(), max_duplicate_retries=1
+        )
+        mock_cache_port.get_range.return_value = sample_fun_facts
+        mock_llm_port.chat.return_value = sample_fun_facts[3].fact
+
+        # Act
+        result = await service.get_todays_fun_fact()
+
+        # Assert
+        assert result == DailyFunFact(date.today(), sample_fun_facts[3].fact)
+        assert mock_llm_port.chat.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_duplicate_index_synced_incrementally(self, mock_cache_port, mock_llm_port, sample_fun_facts):
+        # Setup
+        from app.domain.service.near_duplicate_index import NearDuplicateIndex
+        index = NearDuplicateIndex()
+        service = DailyFunFactService(mock_cache_port, mock_llm_port, duplicate_index=index)
+        ascending = sorted(sample_fun_facts, key=lambda fact: fact.date)
+        mock_cache_port.get_range.side_effect = [ascending[:3], ascending[3:]]
+
+        # Act
+        await service._sync_duplicate_index()
+        await service._sync_duplicate_index()
+
+        # Assert
+        assert len(index) == len(sample_fun_facts)
+        assert mock_cache_port.get_range.call_args.args[0] == date(2024, 1, 14)
+
+    @pytest.mark.asyncio
+    async def test_get_todays_fun_fact_records_phase_timings(self, service, mock_cache_port, mock_llm_port):
+        # Setup
+        mock_cache_port.get.return_value = None
+        mock_cache_port.acquire_lock.return_value = True
+        mock_llm_port.chat.return_value = "very fun fact"
+        timings, token = start_phase_timings()
+
+        # Act
+        try:
+            await service.get_todays_fun_fact()
+        finally:
+            stop_phase_timings(token)
+
+        # Assert
+        assert {"cache", "lock", "prompt", "llm", "store"} <= set(timings)
+        assert all(seconds >= 0 for seconds in timings.values())
@@ -0,0 +1,80 @@
+import pytest
+from datetime import date, timedelta
+
+from app.util import DailyLruCache
+
+
+@pytest.mark.unit
+class TestDailyLruCache:
+
+    @pytest.fixture
+    def clock(self):
+        class Clock:
+            today = date(2024, 1, 15)
+
+            def __call__(self):
+                return self.today
+
+        return Clock()
+
+    def test_get_after_put(self, clock):
+        # Setup
+        cache = DailyLruCache(clock=clock)
+        cache.put("key", "value", clock.today)
+
+        # Act
+        result = cache.get("key")
+
+        # Assert
+        assert result == "value"
+        assert cache.stats().hits == 1
+        assert cache.stats().misses == 0
+
+    def test_get_missing_key_counts_miss(self, clock):
+        # Act
+        cache = DailyLruCache(clock=clock)
+        result = cache.get("key")
+
+        # Assert
+        assert result is None
+        assert cache.stats().misses == 1
+
+    def test_entries_expire_on_rollover(self, clock):
+        # Setup
+        cache = DailyLruCache(clock=clock)
+        cache.put("key", "value", clock.today)
+
+        # Act
+        clock.today += timedelta(days=1)
+        result = cache.get("key")
+
+        # Assert
+        assert result is None
+        assert cache.stats().size == 0
+
+    def test_put_for_previous_day_is_ignored(self, clock):
+        # Setup
+        cache = DailyLruCache(clock=clock)
+        yesterday = clock.today - timedelta(days=1)
+
+        # Act
+        cache.put("key", "value", yesterday)
+
+        # Assert
+        assert cache.get("key") is None
+
+    def test_size_is_bounded(self, clock):
+        # Setup
+        cache = DailyLruCache(max_size=2, clock=clock)
+        cache.put("a", 1, clock.today)
+        cache.put("b", 2, clock.today)
+        cache.get("a")
+
+        # Act
+        cache.put("c", 3, clock.today)
+
+        # Assert
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.stats().size == 2
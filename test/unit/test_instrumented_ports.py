@@ -0,0 +1,127 @@
+import pytest
+from datetime import date
+
+from prometheus_client import REGISTRY
+
+import app.adapter.memory
+from app.adapter.memory import FunFactMemoryAdapter
+from app.adapter.metrics import InstrumentedCachePort, InstrumentedLlmPort
+from app.domain.service import _create_daily_fun_fact_service
+from app.domain.model import DailyFunFact
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.unit
+class TestInstrumentedCachePort:
+
+    @pytest.fixture
+    def cache_port(self, mock_cache_port):
+        return InstrumentedCachePort(mock_cache_port, "unit-cache")
+
+    @pytest.mark.asyncio
+    async def test_get_records_latency_and_lookup_result(self, cache_port, mock_cache_port):
+        # Setup
+        fact = DailyFunFact(date=date(2024, 1, 15), fact="Octopuses have three hearts.")
+        mock_cache_port.get.side_effect = [fact, None]
+        calls = _sample("funfacts_port_call_seconds_count", port="unit-cache", method="get")
+        hits = _sample("funfacts_cache_lookups_total", tier="unit-cache", result="hit")
+        misses = _sample("funfacts_cache_lookups_total", tier="unit-cache", result="miss")
+
+        # Act
+        found = await cache_port.get(date(2024, 1, 15))
+        missing = await cache_port.get(date(2024, 1, 16))
+
+        # Assert
+        assert found == fact
+        assert missing is None
+        assert _sample("funfacts_port_call_seconds_count", port="unit-cache", method="get") == calls + 2
+        assert _sample("funfacts_cache_lookups_total", tier="unit-cache", result="hit") == hits + 1
+        assert _sample("funfacts_cache_lookups_total", tier="unit-cache", result="miss") == misses + 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_lock_counts_wins_and_losses(self, cache_port, mock_cache_port):
+        # Setup
+        mock_cache_port.acquire_lock.side_effect = [True, False, False]
+        won = _sample("funfacts_lock_acquisitions_total", port="unit-cache", outcome="won")
+        lost = _sample("funfacts_lock_acquisitions_total", port="unit-cache", outcome="lost")
+
+        # Act
+        for _ in range(3):
+            await cache_port.acquire_lock(date(2024, 1, 15))
+
+        # Assert
+        assert _sample("funfacts_lock_acquisitions_total", port="unit-cache", outcome="won") == won + 1
+        assert _sample("funfacts_lock_acquisitions_total", port="unit-cache", outcome="lost") == lost + 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_counted_and_reraised(self, cache_port, mock_cache_port):
+        # Setup
+        mock_cache_port.store.side_effect = ConnectionError("Redis unavailable")
+        errors = _sample("funfacts_port_call_errors_total", port="unit-cache", method="store", error="ConnectionError")
+
+        # Act & Assert
+        with pytest.raises(ConnectionError):
+            await cache_port.store(DailyFunFact(date=date(2024, 1, 15), fact="Bananas are berries."))
+        assert _sample(
+            "funfacts_port_call_errors_total", port="unit-cache", method="store", error="ConnectionError"
+        ) == errors + 1
+
+
+@pytest.mark.unit
+class TestInstrumentedLlmPort:
+
+    @pytest.mark.asyncio
+    async def test_chat_and_stream_are_timed(self, fake_llm_port_factory):
+        # Setup
+        llm_port = InstrumentedLlmPort(fake_llm_port_factory(response="Sloths can hold their breath."), "unit-llm")
+        chats = _sample("funfacts_port_call_seconds_count", port="unit-llm", method="chat")
+        streams = _sample("funfacts_port_call_seconds_count", port="unit-llm", method="stream_chat")
+
+        # Act
+        response = await llm_port.chat("prompt")
+        chunks = [chunk async for chunk in llm_port.stream_chat("prompt")]
+
+        # Assert
+        assert response == "Sloths can hold their breath."
+        assert "".join(chunks) == response
+        assert _sample("funfacts_port_call_seconds_count", port="unit-llm", method="chat") == chats + 1
+        assert _sample("funfacts_port_call_seconds_count", port="unit-llm", method="stream_chat") == streams + 1
+
+
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_closes_wrapped_stream(self, fake_llm_port_factory):
+        # Setup
+        wrapped = fake_llm_port_factory(response="Sloths can hold their breath.")
+        stream = InstrumentedLlmPort(wrapped, "unit-llm").stream_chat("prompt")
+
+        # Act
+        await anext(stream)
+        await stream.aclose()
+
+        # Assert
+        assert wrapped.open_streams == 0
+
+@pytest.mark.unit
+class TestServiceCacheMetrics:
+
+    @pytest.mark.asyncio
+    async def test_service_cache_and_memory_tier_have_their_own_labels(self, monkeypatch):
+        # Setup
+        monkeypatch.setenv("FUN_FACT_CACHE_TIERS", "memory")
+        monkeypatch.setenv("FUN_FACT_POOL_ENABLED", "false")
+        memory_adapter = FunFactMemoryAdapter()
+        monkeypatch.setattr(app.adapter.memory, "_daily_fun_fact_memory_adapter_instance", memory_adapter)
+        await memory_adapter.store(DailyFunFact(date=date.today(), fact="Octopuses have three hearts."))
+        service = _create_daily_fun_fact_service()
+        service_misses = _sample("funfacts_cache_lookups_total", tier="service", result="miss")
+        memory_hits = _sample("funfacts_cache_lookups_total", tier="memory", result="hit")
+
+        # Act
+        await service.get_todays_fun_fact()
+
+        # Assert
+        assert _sample("funfacts_cache_lookups_total", tier="service", result="miss") == service_misses + 1
+        assert _sample("funfacts_cache_lookups_total", tier="memory", result="hit") == memory_hits + 1
@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock
+
+from app.domain.port import CategoryFunFactCachePort, LockLostError
+from app.domain.service.locked_generation import SingleFlight, generate_under_lock
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_share_one_load(self):
+        # Setup
+        loads = SingleFlight()
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "loaded"
+
+        # Act
+        results = await asyncio.gather(*(loads.run("key", load) for _ in range(5)))
+
+        # Assert
+        assert results == ["loaded"] * 5
+        assert len(calls) == 1
+        assert "key" not in loads
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_not_kept(self):
+        # Setup
+        finished = []
+        loads = SingleFlight(on_finish=finished.append)
+
+        async def fail():
+            raise ValueError("no fact")
+
+        async def load():
+            return "loaded"
+
+        with pytest.raises(ValueError):
+            await loads.run("key", fail)
+
+        # Act
+        result = await loads.run("key", load)
+
+        # Assert
+        assert result == "loaded"
+        assert finished == ["key", "key"]
+
+
+@pytest.mark.unit
+class TestGenerateUnderLock:
+
+    @pytest.fixture
+    def lock_port(self):
+        mock = AsyncMock(spec=CategoryFunFactCachePort)
+        mock.acquire_lock.return_value = True
+        mock.renew_lock.return_value = True
+        return mock
+
+    async def _generate(self, lock_port, lookup=None, generate=None, store=None):
+        return await generate_under_lock(
+            lock_port,
+            date(2024, 1, 15),
+            "the facts of 2024-01-15",
+            lookup=lookup or AsyncMock(return_value=None),
+            generate=generate or AsyncMock(return_value="generated"),
+            store=store or AsyncMock(),
+            lock_wait_timeout=1.0,
+            lock_ttl=0.03,
+        )
+
+    @pytest.mark.asyncio
+    async def test_holder_generates_stores_and_releases(self, lock_port):
+        # Setup
+        store = AsyncMock()
+
+        # Act
+        result = await self._generate(lock_port, store=store)
+
+        # Assert
+        assert result == "generated"
+        store.assert_called_once_with("generated")
+        lock_port.release_lock.assert_called_once_with(date(2024, 1, 15))
+
+    @pytest.mark.asyncio
+    async def test_loser_waits_for_store(self, lock_port):
+        # Setup
+        lock_port.acquire_lock.return_value = False
+        lock_port.wait_for_store.return_value = "theirs"
+        generate = AsyncMock()
+
+        # Act
+        result = await self._generate(lock_port, generate=generate)
+
+        # Assert
+        assert result == "theirs"
+        generate.assert_not_called()
+        lock_port.release_lock.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lost_lock_takes_result_of_new_holder(self, lock_port):
+        # Setup
+        lock_port.wait_for_store.return_value = "theirs"
+
+        # Act
+        result = await self._generate(lock_port, store=AsyncMock(side_effect=LockLostError("lost")))
+
+        # Assert
+        assert result == "theirs"
+        lock_port.release_lock.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_lock_is_renewed_while_generating(self, lock_port):
+        # Setup
+        async def slow_generate():
+            await asyncio.sleep(0.05)
+            return "generated"
+
+        # Act
+        await self._generate(lock_port, generate=slow_generate)
+
+        # Assert
+        lock_port.renew_lock.assert_called_with(date(2024, 1, 15), 0.03)
+
+    @pytest.mark.asyncio
+    async def test_renewal_in_flight_ends_before_release(self, lock_port):
+        # Setup
+        events = []
+
+        async def slow_renew(target_date, ttl):
+            events.append("renew")
+            try:
+                await asyncio.sleep(1)
+            finally:
+                events.append("renew ended")
+
+        async def slow_generate():
+            await asyncio.sleep(0.02)
+            return "generated"
+
+        lock_port.renew_lock.side_effect = slow_renew
+        lock_port.release_lock.side_effect = lambda target_date: events.append("release")
+
+        # Act
+        await self._generate(lock_port, generate=slow_generate)
+
+        # Assert
+        assert events == ["renew", "renew ended", "release"]
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+from datetime import date
+
+from app.adapter.memory import FunFactMemoryAdapter
+from app.domain.model import DailyFunFact
+
+
+@pytest.mark.unit
+class TestFunFactMemoryAdapter:
+
+    @pytest.fixture
+    def clock(self):
+        class Clock:
+            now = 1000.0
+
+            def __call__(self):
+                return self.now
+
+        return Clock()
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_fact(self, sample_fun_facts):
+        # Setup
+        adapter = FunFactMemoryAdapter(max_size=2)
+        await adapter.store(sample_fun_facts[0])
+        await adapter.store(sample_fun_facts[1])
+        await adapter.get(sample_fun_facts[0].date)
+
+        # Act
+        await adapter.store(sample_fun_facts[2])
+
+        # Assert
+        assert await adapter.get(sample_fun_facts[0].date) == sample_fun_facts[0]
+        assert await adapter.get(sample_fun_facts[1].date) is None
+        assert await adapter.get(sample_fun_facts[2].date) == sample_fun_facts[2]
+
+    @pytest.mark.asyncio
+    async def test_lock_is_exclusive_until_it_expires(self, clock):
+        # Setup
+        adapter = FunFactMemoryAdapter(clock=clock)
+        assert await adapter.acquire_lock(date(2024, 1, 15), ttl=10)
+
+        # Act
+        while_held = await adapter.acquire_lock(date(2024, 1, 15), ttl=10)
+        clock.now += 10
+        after_expiry = await adapter.acquire_lock(date(2024, 1, 15), ttl=10)
+
+        # Assert
+        assert while_held is False
+        assert after_expiry is True
+
+    @pytest.mark.asyncio
+    async def test_renew_fails_after_expiry(self, clock):
+        # Setup
+        adapter = FunFactMemoryAdapter(clock=clock)
+        await adapter.acquire_lock(date(2024, 1, 15), ttl=10)
+
+        # Act
+        clock.now += 5
+        renewed = await adapter.renew_lock(date(2024, 1, 15), ttl=10)
+        clock.now += 10
+        expired = await adapter.renew_lock(date(2024, 1, 15), ttl=10)
+
+        # Assert
+        assert renewed is True
+        assert expired is False
+
+    @pytest.mark.asyncio
+    async def test_wait_for_store_wakes_up_on_store(self, sample_fun_fact):
+        # Setup
+        adapter = FunFactMemoryAdapter()
+
+        # Act
+        waiter = asyncio.create_task(adapter.wait_for_store(sample_fun_fact.date, timeout=5))
+        await asyncio.sleep(0)
+        await adapter.store(sample_fun_fact)
+        result = await asyncio.wait_for(waiter, timeout=1)
+
+        # Assert
+        assert result == sample_fun_fact
+
+    @pytest.mark.asyncio
+    async def test_wait_for_store_times_out(self):
+        # Act
+        result = await FunFactMemoryAdapter().wait_for_store(date(2024, 1, 15), timeout=0.01)
+
+        # Assert
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_get_last_n_hides_future_facts(self):
+        # Setup
+        adapter = FunFactMemoryAdapter()
+        past = DailyFunFact(date=date(2024, 1, 15), fact="Past.")
+        future = DailyFunFact(date=date(9999, 1, 1), fact="Future.")
+        await adapter.store(past)
+        await adapter.store(future)
+
+        # Act
+        result = await adapter.get_last_n(5)
+
+        # Assert
+        assert result == [past]
@@ -0,0 +1,57 @@
+import pytest
+from datetime import date
+
+from app.domain.service.near_duplicate_index import NearDuplicateIndex
+
+
+@pytest.mark.unit
+class TestNearDuplicateIndex:
+
+    @pytest.fixture
+    def index(self, sample_fun_facts):
+        index = NearDuplicateIndex()
+        for fact in sample_fun_facts:
+            index.add(fact.date, fact.fact)
+        return index
+
+    def test_finds_near_duplicate(self, index):
+        # Act
+        result = index.find_similar("Octopuses have 3 hearts and blue blood!")
+
+        # Assert
+        assert result is not None
+        assert result[0] == date(2024, 1, 12)
+        assert result[1] >= 0.5
+
+    def test_finds_exact_duplicate(self, index):
+        # Act
+        result = index.find_similar("A group of flamingos is called a 'flamboyance'.")
+
+        # Assert
+        assert result == (date(2024, 1, 14), 1.0)
+
+    def test_ignores_different_fact(self, index):
+        # Act
+        result = index.find_similar("The Eiffel Tower can be seen from as far as 42 miles away on a clear day!")
+
+        # Assert
+        assert result is None
+
+    def test_empty_index(self):
+        # Act
+        result = NearDuplicateIndex().find_similar("Any fact.")
+
+        # Assert
+        assert result is None
+
+    def test_grows_past_initial_capacity(self):
+        # Setup
+        index = NearDuplicateIndex()
+
+        # Act
+        for ordinal in range(1, 201):
+            index.add(date.fromordinal(ordinal), f"Fact number {ordinal} about something else entirely.")
+
+        # Assert
+        assert len(index) == 200
+        assert index.find_similar("Fact number 150 about something else entirely.")[0] == date.fromordinal(150)
@@ -0,0 +1,87 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.adapter.redis.redis_client_tracking import RedisClientTracking
+
+
+@pytest.mark.unit
+class TestRedisClientTracking:
+
+    @pytest.fixture
+    def tracking(self):
+        tracking = RedisClientTracking(MagicMock(), "funfacts", {"funfacts"})
+        tracking._listener = MagicMock()  # no server to listen to
+        tracking._ready = True
+        return tracking
+
+    @pytest.mark.asyncio
+    async def test_serves_repeated_reads_locally(self, tracking):
+        # Setup
+        loader = AsyncMock(return_value="fact")
+
+        # Act
+        result1 = await tracking.get_or_load("key", loader)
+        result2 = await tracking.get_or_load("key", loader)
+
+        # Assert
+        assert result1 == result2 == "fact"
+        loader.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_does_not_cache_misses(self, tracking):
+        # Setup
+        loader = AsyncMock(return_value=None)
+
+        # Act
+        await tracking.get_or_load("key", loader)
+        await tracking.get_or_load("key", loader)
+
+        # Assert
+        assert loader.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_does_not_cache_until_tracking_is_ready(self, tracking):
+        # Setup
+        tracking._ready = False
+        loader = AsyncMock(return_value="fact")
+
+        # Act
+        await tracking.get_or_load("key", loader)
+        await tracking.get_or_load("key", loader)
+
+        # Assert
+        assert loader.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_of_tracked_key_evicts(self, tracking):
+        # Setup
+        loader = AsyncMock(side_effect=["old fact", "new fact"])
+        await tracking.get_or_load("key", loader)
+
+        # Act
+        tracking.invalidate(["funfacts:lock:2024-01-15"])
+        result1 = await tracking.get_or_load("key", loader)
+        tracking.invalidate(["funfacts"])
+        result2 = await tracking.get_or_load("key", loader)
+
+        # Assert
+        assert result1 == "old fact"
+        assert result2 == "new fact"
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_load_is_not_cached(self, tracking):
+        # Setup
+        results = iter(["stale fact", "new fact"])
+
+        async def loader():
+            result = next(results)
+            if result == "stale fact":
+                tracking.invalidate(None)
+            return result
+
+        # Act
+        await tracking.get_or_load("key", loader)
+        result = await tracking.get_or_load("key", loader)
+
+        # Assert
+        assert result == "new fact"
@@ -0,0 +1,245 @@
+import asyncio
+
+import pytest
+
+from app.adapter.resilience import CircuitBreaker, CircuitOpenError, ResilientLlmAdapter
+
+
+@pytest.mark.unit
+class TestResilientLlmAdapter:
+
+    def _adapter(self, llm_port, **kwargs) -> ResilientLlmAdapter:
+        kwargs.setdefault("backoff", 0)
+        return ResilientLlmAdapter(llm_port, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_chat_success(self, fake_llm_port_factory):
+        # Setup
+        llm_port = fake_llm_port_factory()
+
+        # Act
+        result = await self._adapter(llm_port).chat("prompt")
+
+        # Assert
+        assert result == "A fake fun fact."
+        assert llm_port.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_chat_retries_failures(self, fake_llm_port_factory):
+        # Setup
+        llm_port = fake_llm_port_factory(failures=2)
+
+        # Act
+        result = await self._adapter(llm_port, max_attempts=3).chat("prompt")
+
+        # Assert
+        assert result == "A fake fun fact."
+        assert llm_port.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_chat_raises_after_max_attempts(self, fake_llm_port_factory):
+        # Setup
+        llm_port = fake_llm_port_factory(failures=5)
+
+        # Act & Assert
+        with pytest.raises(ConnectionError):
+            await self._adapter(llm_port, max_attempts=2).chat("prompt")
+        assert llm_port.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_chat_times_out(self, fake_llm_port_factory):
+        # Setup
+        llm_port = fake_llm_port_factory(latencies=[1.0, 0])
+
+        # Act
+        result = await self._adapter(llm_port, timeout=0.05, max_attempts=2).chat("prompt")
+
+        # Assert
+        assert result == "A fake fun fact."
+        assert llm_port.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_chat_hedges_slow_requests(self, fake_llm_port_factory):
+        # Setup
+        llm_port = fake_llm_port_factory(latencies=[0.01] * 20 + [1.0, 0.01])
+        adapter = self._adapter(llm_port, hedge_percentile=0.95)
+        for _ in range(20):
+            await adapter.chat("prompt")
+
+        # Act
+        result = await adapter.chat("prompt")
+
+        # Assert
+        assert result == "A fake fun fact."
+        assert llm_port.calls == 22
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_and_fails_fast(self, fake_llm_port_factory):
+        # Setup
+        llm_port = fake_llm_port_factory(failures=10)
+        adapter = self._adapter(llm_port, max_attempts=1, circuit_breaker=CircuitBreaker(failure_threshold=2))
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await adapter.chat("prompt")
+
+        # Act & Assert
+        with pytest.raises(CircuitOpenError):
+            await adapter.chat("prompt")
+        assert llm_port.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_chat_passes_chunks_through(self, fake_llm_port_factory):
+        # Setup
+        llm_port = fake_llm_port_factory(response="Honey never spoils.")
+
+        # Act
+        chunks = [chunk async for chunk in self._adapter(llm_port).stream_chat("prompt")]
+
+        # Assert
+        assert chunks == ["Honey", " never", " spoils."]
+
+    @pytest.mark.asyncio
+    async def test_stream_chat_records_failures(self, fake_llm_port_factory):
+        # Setup
+        llm_port = fake_llm_port_factory(failures=1)
+        adapter = self._adapter(llm_port, circuit_breaker=CircuitBreaker(failure_threshold=1))
+
+        # Act
+        with pytest.raises(ConnectionError):
+            async for _ in adapter.stream_chat("prompt"):
+                pass
+
+        # Assert
+        with pytest.raises(CircuitOpenError):
+            await adapter.chat("prompt")
+
+
+    @pytest.mark.asyncio
+    async def test_stream_chat_closes_upstream_stream_after_timeout(self, fake_llm_port_factory):
+        # Setup
+        llm_port = fake_llm_port_factory(response="Honey never spoils.", chunk_latency=1)
+        adapter = self._adapter(llm_port, timeout=0.01)
+
+        # Act
+        with pytest.raises(TimeoutError):
+            async for _ in adapter.stream_chat("prompt"):
+                pass
+
+        # Assert
+        assert llm_port.open_streams == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_chat_closes_upstream_stream_when_consumer_leaves(self, fake_llm_port_factory):
+        # Setup
+        llm_port = fake_llm_port_factory(response="Honey never spoils.")
+        stream = self._adapter(llm_port).stream_chat("prompt")
+
+        # Act
+        await anext(stream)
+        await stream.aclose()
+
+        # Assert
+        assert llm_port.open_streams == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_half_open_trial_is_released(self, fake_llm_port_factory):
+        # Setup
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 10.0
+        llm_port = fake_llm_port_factory(latencies=[60])
+        adapter = self._adapter(llm_port, circuit_breaker=breaker, max_attempts=1)
+        trial = asyncio.create_task(adapter.chat("prompt"))
+        await asyncio.sleep(0)
+
+        # Act
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+        result = await adapter.chat("prompt")
+
+        # Assert
+        assert result == "A fake fun fact."
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_abandoned_half_open_stream_is_released(self, fake_llm_port_factory):
+        # Setup
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 10.0
+        adapter = self._adapter(fake_llm_port_factory(response="Honey never spoils."), circuit_breaker=breaker)
+        stream = adapter.stream_chat("prompt")
+
+        # Act
+        await anext(stream)
+        await stream.aclose()
+        result = await adapter.chat("prompt")
+
+        # Assert
+        assert result == "Honey never spoils."
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+
+    def test_half_open_after_reset_timeout(self):
+        # Setup
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+        breaker.record_failure()
+
+        # Act
+        state_before = breaker.state
+        now[0] = 10.0
+        state_after = breaker.state
+
+        # Assert
+        assert state_before == CircuitBreaker.OPEN
+        assert state_after == CircuitBreaker.HALF_OPEN
+
+    def test_half_open_allows_single_trial(self):
+        # Setup
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 10.0
+
+        # Act
+        breaker.before_call()
+
+        # Assert
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_success_closes_circuit(self):
+        # Setup
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 10.0
+        breaker.before_call()
+
+        # Act
+        breaker.record_success()
+
+        # Assert
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_cancelled_trial_keeps_half_open(self):
+        # Setup
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 10.0
+        breaker.before_call()
+
+        # Act
+        breaker.record_cancelled()
+
+        # Assert
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        breaker.before_call()
@@ -0,0 +1,68 @@
+import threading
+import time
+
+import pytest
+
+from app.adapter.diagnostics import SamplingProfiler
+from app.util import start_phase_timings, stop_phase_timings, timed_phase
+
+
+def _busy_wait(seconds: float):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+@pytest.mark.unit
+class TestSamplingProfiler:
+
+    def test_collapsed_stacks_contain_sampled_function(self):
+        # Setup
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start(threading.get_ident())
+        started = time.monotonic()
+
+        # Act
+        try:
+            _busy_wait(0.1)
+        finally:
+            profiler.stop()
+        stacks = profiler.collapsed_stacks(started, time.monotonic())
+
+        # Assert
+        assert stacks
+        assert any("_busy_wait (test_sampling_profiler.py)" in stack for stack in stacks)
+        assert all(";" in stack for stack in stacks)
+
+    def test_collapsed_stacks_outside_window_are_excluded(self):
+        # Setup
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start(threading.get_ident())
+        _busy_wait(0.05)
+        profiler.stop()
+
+        # Act
+        stacks = profiler.collapsed_stacks(time.monotonic(), time.monotonic() + 1)
+
+        # Assert
+        assert not stacks
+
+
+@pytest.mark.unit
+class TestPhaseTimings:
+
+    def test_repeated_phases_add_up(self):
+        # Setup
+        timings, token = start_phase_timings()
+
+        # Act
+        try:
+            for _ in range(2):
+                with timed_phase("llm"):
+                    _busy_wait(0.01)
+        finally:
+            stop_phase_timings(token)
+
+        # Assert
+        assert list(timings) == ["llm"]
+        assert timings["llm"] >= 0.02
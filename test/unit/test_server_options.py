@@ -0,0 +1,78 @@
+import pytest
+from unittest.mock import patch
+
+import main
+
+
+@pytest.mark.unit
+class TestServerOptions:
+
+    def test_production_uses_every_core(self, monkeypatch, tmp_path):
+        # Setup
+        monkeypatch.delenv("SERVER_MODE", raising=False)
+        monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+        monkeypatch.setattr(main, "_CGROUP_CPU_MAX", str(tmp_path / "cpu.max"))
+
+        # Act
+        with patch("main.os.sched_getaffinity", return_value=set(range(8))):
+            options = main._server_options()
+
+        # Assert
+        assert options["workers"] == 8
+        assert options["loop"] == "uvloop"
+        assert options["http"] == "httptools"
+        assert options["timeout_keep_alive"] == 75
+        assert options["timeout_graceful_shutdown"] == 25
+        assert "reload" not in options
+
+    def test_worker_count_follows_cgroup_cpu_quota(self, monkeypatch, tmp_path):
+        # Setup
+        monkeypatch.delenv("SERVER_MODE", raising=False)
+        monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("150000 100000\n")
+        monkeypatch.setattr(main, "_CGROUP_CPU_MAX", str(cpu_max))
+
+        # Act
+        with patch("main.os.sched_getaffinity", return_value=set(range(64))):
+            options = main._server_options()
+
+        # Assert
+        assert options["workers"] == 2
+
+    def test_unlimited_cgroup_cpu_quota_uses_affinity(self, monkeypatch, tmp_path):
+        # Setup
+        monkeypatch.delenv("SERVER_MODE", raising=False)
+        monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("max 100000\n")
+        monkeypatch.setattr(main, "_CGROUP_CPU_MAX", str(cpu_max))
+
+        # Act
+        with patch("main.os.sched_getaffinity", return_value={0, 1, 2, 3}):
+            options = main._server_options()
+
+        # Assert
+        assert options["workers"] == 4
+
+    def test_worker_count_can_be_set(self, monkeypatch):
+        # Setup
+        monkeypatch.delenv("SERVER_MODE", raising=False)
+        monkeypatch.setenv("WEB_CONCURRENCY", "3")
+
+        # Act
+        options = main._server_options()
+
+        # Assert
+        assert options["workers"] == 3
+
+    def test_development_reloads_a_single_process(self, monkeypatch):
+        # Setup
+        monkeypatch.setenv("SERVER_MODE", "development")
+
+        # Act
+        options = main._server_options()
+
+        # Assert
+        assert options["reload"] is True
+        assert "workers" not in options